@@ -3,18 +3,29 @@ Azure Function HTTP Trigger — POST /api/run
 
 Copilot Studio → Azure Function → 5개 에이전트 실행 → JSON 응답
 
-요청:  { "repo_url": "https://github.com/org/repo.git", "mode": "all" }
-응답:  { "status": "ok", "artifacts": [...], ... }
+요청:  { "repo_url": "https://github.com/org/repo.git", "mode": "all", "ref": "v1.2.0" }   (ref 선택)
+응답:  { "status": "ok", "commit_sha": "...", "artifacts": [...], ... }
+
+큰 레포용 비동기 API (HTTP 타임아웃 회피):
+  POST /api/jobs                      → 202 { "job_id": "...", "status": "queued" }
+  GET  /api/jobs/{job_id}             → 진행률 + 에이전트별 상태
+  GET  /api/jobs/{job_id}/artifacts   → /api/run 과 같은 형태의 결과
 """
 import json
 import logging
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
 
 import azure.functions as func
 
 from erd_agent.commands.erd import run_erd
-from erd_agent.repo import prepare_repo
+from erd_agent.config import settings
+from erd_agent.jobs import FINISHED_STATUSES, JobStore, get_job_store, job_heartbeat
+from erd_agent.llm.response_cache import response_cache_stats
+from erd_agent.repo_index import RepoIndex, open_repo_index
+from erd_agent.scan_pool import warm_process_pool
 from api_agent.run import run_api
 from arch_agent.run import run_arch
 from ddl_agent.run import run_ddl
@@ -32,6 +43,12 @@ AGENTS = {
     "stack": {"fn": run_stack, "outputs": [("tech_stack.md", "text/markdown")]},
 }
 
+# /api/jobs 백그라운드 워커 (warm 인스턴스 동안 유지)
+_JOB_POOL = ThreadPoolExecutor(max_workers=settings.job_max_workers, thread_name_prefix="job")
+
+# 분류/파싱 프로세스 풀(forkserver)을 요청이 들어오기 전에 띄워 둔다
+warm_process_pool()
+
 
 def _json_response(body: dict, status: int = 200) -> func.HttpResponse:
     return func.HttpResponse(
@@ -50,50 +67,49 @@ def _read_file(path: Path, max_chars: int = 250_000) -> str:
     return text[:max_chars] + "\n\n... (truncated)" if len(text) > max_chars else text
 
 
-@app.route(route="run", methods=["POST"], auth_level=func.AuthLevel.ANONYMOUS)
-def run(req: func.HttpRequest) -> func.HttpResponse:
-    # ── 1. 요청 파싱 ──
+def _run_agent(
+    m: str,
+    index: RepoIndex,
+    out_dir: Path,
+    on_update: Callable[[str, dict], None] | None = None,
+) -> dict:
+    """에이전트 하나 실행. 실패는 해당 에이전트 결과로만 기록 (다른 에이전트에 영향 없음)."""
+    if on_update:
+        on_update(m, {"status": "running"})
     try:
-        body = req.get_json()
-    except Exception:
-        return _error_response("BAD_JSON", "요청 본문이 유효한 JSON이 아닙니다.")
+        AGENTS[m]["fn"](repo=index, out_dir=out_dir / m)
+        result = {"status": "ok"}
+    except Exception as e:
+        logging.exception(f"Agent failed: {m}")
+        result = {"status": "error", "message": str(e)[:500]}
+    if on_update:
+        on_update(m, result)
+    return result
 
-    repo_url = body.get("repo_url", "")
-    mode = body.get("mode", "all").lower()
 
-    if not repo_url:
-        return _error_response("MISSING_REPO_URL", "repo_url은 필수입니다.")
-    if mode not in VALID_MODES:
-        return _error_response("INVALID_MODE", f"mode는 {sorted(VALID_MODES)} 중 하나여야 합니다.")
+def _run_agents(
+    index: RepoIndex,
+    modes: list[str],
+    out_dir: Path,
+    on_update: Callable[[str, dict], None] | None = None,
+) -> dict[str, dict]:
+    """
+    에이전트들을 제한된 워커 풀에서 동시에 실행하고 modes 순서대로 결과를 모은다.
+    on_update(agent, result)가 주어지면 시작/종료 시점마다 호출 (job 진행률 기록용).
+    """
+    workers = max(1, min(settings.agent_max_workers, len(modes)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agent") as pool:
+        futures = {m: pool.submit(_run_agent, m, index, out_dir, on_update) for m in modes}
+        results = {m: futures[m].result() for m in modes}
+    stats = response_cache_stats()
+    if stats is not None:
+        logging.info(f"LLM response cache (warm instance total): {stats['hits']} hits / {stats['misses']} misses")
+    return results
 
-    # ── 2. 레포 준비 (clone 또는 로컬 경로) ──
-    try:
-        repo_path = prepare_repo(repo_url)
-    except Exception as e:
-        logging.exception("REPO_FAILED")
-        return _json_response(
-            {"error": {"code": "REPO_FAILED", "message": f"레포 준비 실패: {e}"}},
-            status=500,
-        )
 
-    # ── 3. 에이전트 실행 ──
-    out_dir = Path(tempfile.mkdtemp(prefix="docagent_"))
-    modes_to_run = list(AGENTS.keys()) if mode == "all" else [mode]
-
-    results: dict[str, dict] = {}
-    for m in modes_to_run:
-        agent = AGENTS[m]
-        agent_out = out_dir / m
-        try:
-            agent["fn"](repo=str(repo_path), out_dir=agent_out)
-            results[m] = {"status": "ok"}
-        except Exception as e:
-            logging.exception(f"Agent failed: {m}")
-            results[m] = {"status": "error", "message": str(e)[:500]}
-
-    # ── 4. 산출물 수집 ──
+def _collect_artifacts(modes: list[str], results: dict[str, dict], out_dir: Path) -> list[dict]:
     artifacts = []
-    for m in modes_to_run:
+    for m in modes:
         if results[m]["status"] != "ok":
             continue
         agent_out = out_dir / m
@@ -106,14 +122,155 @@ def run(req: func.HttpRequest) -> func.HttpResponse:
                     "content_type": content_type,
                     "content": _read_file(fpath),
                 })
+    return artifacts
 
-    # ── 5. 응답 ──
+
+def _run_response(
+    repo_url: str,
+    mode: str,
+    results: dict[str, dict],
+    artifacts: list[dict],
+    ref: str | None = None,
+    commit_sha: str | None = None,
+) -> dict:
     all_ok = all(r["status"] == "ok" for r in results.values())
-    return _json_response({
+    return {
         "status": "ok" if all_ok else "partial",
         "repo_url": repo_url,
         "mode": mode,
+        "ref": ref,
+        "commit_sha": commit_sha,
         "summary": artifacts[0]["content"][:2_000] if artifacts else "",
         "agents": results,
         "artifacts": artifacts,
-    })
+    }
+
+
+def _parse_run_request(req: func.HttpRequest) -> tuple[str, str, str | None] | func.HttpResponse:
+    """요청 본문 검증. 성공 시 (repo_url, mode, ref), 실패 시 에러 응답."""
+    try:
+        body = req.get_json()
+    except Exception:
+        return _error_response("BAD_JSON", "요청 본문이 유효한 JSON이 아닙니다.")
+
+    repo_url = body.get("repo_url", "")
+    mode = body.get("mode", "all").lower()
+    ref = body.get("ref") or None
+
+    if not repo_url:
+        return _error_response("MISSING_REPO_URL", "repo_url은 필수입니다.")
+    if mode not in VALID_MODES:
+        return _error_response("INVALID_MODE", f"mode는 {sorted(VALID_MODES)} 중 하나여야 합니다.")
+    if ref is not None and not isinstance(ref, str):
+        return _error_response("INVALID_REF", "ref는 브랜치/태그/커밋 SHA 문자열이어야 합니다.")
+    return repo_url, mode, ref
+
+
+def _modes_for(mode: str) -> list[str]:
+    return list(AGENTS.keys()) if mode == "all" else [mode]
+
+
+@app.route(route="run", methods=["POST"], auth_level=func.AuthLevel.ANONYMOUS)
+def run(req: func.HttpRequest) -> func.HttpResponse:
+    # ── 1. 요청 파싱 ──
+    parsed = _parse_run_request(req)
+    if isinstance(parsed, func.HttpResponse):
+        return parsed
+    repo_url, mode, ref = parsed
+
+    # ── 2. 레포 준비 (ref → 커밋 SHA 고정, clone 또는 로컬 경로) + 단일 패스 인덱싱 ──
+    modes_to_run = _modes_for(mode)
+    try:
+        index = open_repo_index(repo_url, ref=ref, modes=modes_to_run)
+    except Exception as e:
+        logging.exception("REPO_FAILED")
+        return _json_response(
+            {"error": {"code": "REPO_FAILED", "message": f"레포 준비 실패: {e}"}},
+            status=500,
+        )
+
+    # ── 3. 에이전트 병렬 실행 / 4. 산출물 수집 (내용을 읽은 뒤 출력 디렉터리는 삭제, 인덱스는 닫음) ──
+    with index, tempfile.TemporaryDirectory(prefix="docagent_") as tmp:
+        out_dir = Path(tmp)
+        results = _run_agents(index, modes_to_run, out_dir)
+        artifacts = _collect_artifacts(modes_to_run, results, out_dir)
+
+    # ── 5. 응답 ──
+    return _json_response(_run_response(repo_url, mode, results, artifacts, ref, index.commit_sha))
+
+
+def _execute_job(job_id: str, repo_url: str, mode: str, ref: str | None = None) -> None:
+    """백그라운드 워커에서 /api/run 과 같은 파이프라인을 실행하고 진행 상황을 job 저장소에 기록."""
+    store = get_job_store()
+    store.set_status(job_id, "running")
+    # 실행 중에는 updated_at을 주기적으로 갱신 (긴 clone/에이전트가 중단(JOB_STALE)으로 오인되지 않게)
+    with job_heartbeat(store, job_id):
+        _run_job(store, job_id, repo_url, mode, ref)
+
+
+def _run_job(store: JobStore, job_id: str, repo_url: str, mode: str, ref: str | None) -> None:
+    modes = _modes_for(mode)
+    try:
+        index = open_repo_index(repo_url, ref=ref, modes=modes)
+        store.set_commit_sha(job_id, index.commit_sha)
+    except Exception as e:
+        logging.exception("REPO_FAILED")
+        store.set_status(job_id, "error", {"code": "REPO_FAILED", "message": f"레포 준비 실패: {e}"})
+        return
+
+    try:
+        # 산출물을 저장소에 기록한 뒤 출력 디렉터리는 삭제하고 인덱스(zip 핸들)는 닫는다
+        with index, tempfile.TemporaryDirectory(prefix="docagent_") as tmp:
+            out_dir = Path(tmp)
+            results = _run_agents(index, modes, out_dir, on_update=lambda m, r: store.set_agent(job_id, m, r))
+            body = _run_response(repo_url, mode, results, _collect_artifacts(modes, results, out_dir), ref, index.commit_sha)
+            store.set_artifacts(job_id, body["artifacts"])
+        store.set_status(job_id, body["status"])
+    except Exception as e:
+        logging.exception(f"Job failed: {job_id}")
+        store.set_status(job_id, "error", {"code": "JOB_FAILED", "message": str(e)[:500]})
+
+
+@app.route(route="jobs", methods=["POST"], auth_level=func.AuthLevel.ANONYMOUS)
+def create_job(req: func.HttpRequest) -> func.HttpResponse:
+    parsed = _parse_run_request(req)
+    if isinstance(parsed, func.HttpResponse):
+        return parsed
+    repo_url, mode, ref = parsed
+
+    job_id = get_job_store().create(repo_url, mode, _modes_for(mode), ref=ref)
+    _JOB_POOL.submit(_execute_job, job_id, repo_url, mode, ref)
+    return _json_response(
+        {
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"/api/jobs/{job_id}",
+            "artifacts_url": f"/api/jobs/{job_id}/artifacts",
+        },
+        status=202,
+    )
+
+
+@app.route(route="jobs/{job_id}", methods=["GET"], auth_level=func.AuthLevel.ANONYMOUS)
+def get_job(req: func.HttpRequest) -> func.HttpResponse:
+    job = get_job_store().get(req.route_params.get("job_id", ""))
+    if job is None:
+        return _error_response("JOB_NOT_FOUND", "해당 job_id의 작업이 없습니다.", status=404)
+    return _json_response(job)
+
+
+@app.route(route="jobs/{job_id}/artifacts", methods=["GET"], auth_level=func.AuthLevel.ANONYMOUS)
+def get_job_artifacts(req: func.HttpRequest) -> func.HttpResponse:
+    store = get_job_store()
+    job = store.get(req.route_params.get("job_id", ""))
+    if job is None:
+        return _error_response("JOB_NOT_FOUND", "해당 job_id의 작업이 없습니다.", status=404)
+    if job["status"] not in FINISHED_STATUSES:
+        return _error_response("JOB_NOT_FINISHED", f"작업이 아직 진행 중입니다. (status={job['status']})", status=409)
+    if job["status"] == "error":
+        return _json_response({"error": job["error"], "job_id": job["job_id"]}, status=500)
+
+    artifacts = store.get_artifacts(job["job_id"]) or []
+    body = _run_response(job["repo_url"], job["mode"], job["agents"], artifacts, job["ref"], job["commit_sha"])
+    body["job_id"] = job["job_id"]
+    return _json_response(body)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+엔티티 파싱 벤치마크: javalang 전체 AST vs 경량 선언 추출기(java_lite).
+
+합성 JPA 엔티티 코퍼스(필드 + 관계 + 메서드 본문)를 만들어 파일당 파싱 시간과
+JPAJavaParser 결과 스키마가 같은지 비교한다.
+
+  python scripts/bench_parse.py
+  python scripts/bench_parse.py --files 2000 --methods 20
+  python scripts/bench_parse.py --corpus ./my-project   # 기존 레포의 @Entity 파일로 측정
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트에서 실행 시 src 로드 (pip install 없이 실행 가능)
+_ROOT = Path(__file__).resolve().parent.parent
+_SRC = _ROOT / "src"
+if _SRC.exists() and str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+_TYPES = ["String", "Long", "int", "LocalDate", "LocalDateTime", "BigDecimal", "Boolean", "UUID"]
+_COLUMN_ANNS = ["", "@Column(nullable = false)", "@Column(name = \"c_{j}\", length = 50)", "@Column(unique = true)"]
+
+
+def make_entity(i: int, n_fields: int, n_methods: int, rnd: random.Random) -> str:
+    lines = [
+        "package com.bench.domain;",
+        "",
+        "import javax.persistence.*;",
+        "import java.util.*;",
+        "",
+        "@Entity",
+        f"@Table(name = \"entity_{i}\")",
+        f"public class Entity{i} {{",
+        "    @Id @GeneratedValue(strategy = GenerationType.IDENTITY) private Long id;",
+    ]
+    for j in range(n_fields):
+        ann = rnd.choice(_COLUMN_ANNS).format(j=j)
+        lines.append(f"    {ann} private {rnd.choice(_TYPES)} field{j};")
+    if i:
+        lines.append(f"    @ManyToOne(fetch = FetchType.LAZY) @JoinColumn(name = \"parent_id\") private Entity{rnd.randrange(i)} parent;")
+    lines.append("    @OneToMany(mappedBy = \"parent\") private List<Item> items = new ArrayList<>();")
+    for k in range(n_methods):
+        lines += [
+            f"    public String method{k}(int a, String b) {{",
+            "        StringBuilder sb = new StringBuilder();",
+            "        for (int x = 0; x < a; x++) { if (x % 2 == 0) { sb.append(b).append('}'); } else { sb.append(\"{\"); } }",
+            "        return sb.toString();",
+            "    }",
+        ]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="javalang vs java_lite 엔티티 파싱 벤치마크")
+    parser.add_argument("--files", type=int, default=500, help="생성할 엔티티 수")
+    parser.add_argument("--fields", type=int, default=25, help="엔티티당 필드 수")
+    parser.add_argument("--methods", type=int, default=8, help="엔티티당 메서드 수 (본문 포함)")
+    parser.add_argument("--corpus", type=Path, default=None, help="생성 대신 측정할 기존 디렉터리 (@Entity 파일만)")
+    args = parser.parse_args()
+
+    import javalang
+    from erd_agent.model import Schema
+    from erd_agent.parsers import java_lite
+    from erd_agent.parsers import jpa_java
+
+    if args.corpus is not None:
+        texts = [
+            t for t in (f.read_text(encoding="utf-8", errors="ignore") for f in sorted(args.corpus.rglob("*.java")))
+            if "@Entity" in t
+        ]
+    else:
+        rnd = random.Random(7)
+        texts = [make_entity(i, args.fields, args.methods, rnd) for i in range(args.files)]
+    if not texts:
+        print("@Entity 파일이 없습니다.")
+        return
+    size = sum(len(t.encode("utf-8")) for t in texts)
+
+    def run(parse) -> tuple[float, int, list]:
+        trees, failures = [], 0
+        start = time.perf_counter()
+        for t in texts:
+            try:
+                trees.append(parse(t))
+            except Exception:
+                trees.append(None)
+                failures += 1
+        return time.perf_counter() - start, failures, trees
+
+    results = {}
+    for name, fn in (("javalang", javalang.parse.parse), ("lite", java_lite.parse)):
+        elapsed, failures, trees = run(fn)
+        results[name] = (elapsed, trees)
+        print(
+            f"{name:9s} {len(texts):6d} files {size / 1e6:7.1f} MB {elapsed:7.2f}s "
+            f"{elapsed / len(texts) * 1000:7.2f} ms/file {size / 1e6 / elapsed:7.2f} MB/s  failures={failures}"
+        )
+    print(f"speedup x{results['javalang'][0] / results['lite'][0]:.1f}")
+
+    # 같은 JPAJavaParser 규칙으로 두 AST에서 만든 스키마 비교
+    p = jpa_java.JPAJavaParser()
+    original = jpa_java.parse_java
+    same = differ = 0
+    try:
+        for t, jl, lite in zip(texts, results["javalang"][1], results["lite"][1]):
+            if jl is None or lite is None:
+                continue
+            a, b = Schema(), Schema()
+            jpa_java.parse_java = lambda text, path=None, tree=jl: tree
+            p.parse(Path("X.java"), t, a)
+            jpa_java.parse_java = lambda text, path=None, tree=lite: tree
+            p.parse(Path("X.java"), t, b)
+            if a == b:
+                same += 1
+            else:
+                differ += 1
+    finally:
+        jpa_java.parse_java = original
+    print(f"schema: same={same} differ={differ}")
+
+
+if __name__ == "__main__":
+    main()
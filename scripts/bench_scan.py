@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+스캐너 분류 처리량(MB/s) 벤치마크.
+
+합성 Java 코퍼스를 만들어 분류 방식별 처리량을 비교한다.
+  - regex : 파일을 str로 디코딩 후 애너테이션 정규식 4개 + 타입 선언 정규식을 따로 실행 (기존 방식)
+  - bytes : prefilter.classify_bytes — mmap/bytes 위 결합 정규식 한 번 (디코딩 없음)
+  - pool  : bytes 방식을 SCAN_WORKERS 크기의 프로세스 풀로 분산 (--workers, 워커가 2개 이상일 때만)
+
+  python scripts/bench_scan.py
+  python scripts/bench_scan.py --files 20000 --lines 200
+  python scripts/bench_scan.py --corpus ./my-project   # 기존 레포로 측정 (생성 생략)
+  python scripts/bench_scan.py --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트에서 실행 시 src 로드 (pip install 없이 실행 가능)
+_ROOT = Path(__file__).resolve().parent.parent
+_SRC = _ROOT / "src"
+if _SRC.exists() and str(_SRC) not in sys.path:
+    sys.path.insert(0, str(_SRC))
+
+_HEADERS = ["", "@Entity\n@Table(name = \"t\")\n", "@RestController\n@RequestMapping(\"/x\")\n", "@Service\n", "@Embeddable\n"]
+
+
+def make_corpus(root: Path, files: int, lines: int, seed: int = 7) -> None:
+    rnd = random.Random(seed)
+    for i in range(files):
+        d = root / "src" / "main" / "java" / "com" / "bench" / f"p{i % 100}"
+        d.mkdir(parents=True, exist_ok=True)
+        body = "\n".join(
+            f"    private {rnd.choice(['String', 'Long', 'int', 'List<Foo>'])} field{j}; // {'z' * rnd.randint(10, 80)}"
+            for j in range(lines)
+        )
+        (d / f"C{i}.java").write_text(
+            f"package com.bench.p{i % 100};\n\nimport java.util.*;\n\n{rnd.choice(_HEADERS)}"
+            f"public class C{i} {{\n{body}\n}}\n",
+            encoding="utf-8",
+        )
+
+
+def _run(files: list[Path], classify) -> tuple[float, int]:
+    total = 0
+    start = time.perf_counter()
+    for f in files:
+        total += classify(f)
+    return time.perf_counter() - start, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="스캐너 분류 처리량(MB/s) 벤치마크")
+    parser.add_argument("--files", type=int, default=5000, help="생성할 Java 파일 수")
+    parser.add_argument("--lines", type=int, default=120, help="파일당 필드 줄 수")
+    parser.add_argument("--corpus", type=Path, default=None, help="생성 대신 측정할 기존 디렉터리")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최고 기록 사용)")
+    parser.add_argument("--workers", type=int, default=None, help="pool 방식 워커 수 (기본: SCAN_WORKERS)")
+    args = parser.parse_args()
+
+    from erd_agent.config import settings
+    if args.workers is not None:
+        settings.scan_workers = args.workers
+
+    from erd_agent.prefilter import classify_bytes, map_file
+    from erd_agent.scan_pool import classify_job, map_cpu, scan_workers
+    from erd_agent.scanner import ENTITY_ANN_RE, TABLE_ANN_RE, find_type_declarations
+    from api_agent.scanner import CONTROLLER_ANN_RE
+    from arch_agent.scanner import ARCH_HINTS_RE
+
+    def regex_way(f: Path) -> int:
+        data = f.read_bytes()
+        text = data.decode("utf-8", errors="ignore")
+        for rx in (ENTITY_ANN_RE, TABLE_ANN_RE, CONTROLLER_ANN_RE, ARCH_HINTS_RE):
+            rx.search(text)
+        find_type_declarations(text)
+        return len(data)
+
+    def bytes_way(f: Path) -> int:
+        with map_file(f) as buf:
+            classify_bytes(buf)
+            return len(buf)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.corpus
+        if root is None:
+            root = Path(tmp)
+            make_corpus(root, args.files, args.lines)
+        files = sorted(root.rglob("*.java"))
+        if not files:
+            print("Java 파일이 없습니다.")
+            return
+
+        results = {}
+        for name, fn in (("regex", regex_way), ("bytes", bytes_way)):
+            best, size = min(_run(files, fn) for _ in range(args.repeat))
+            results[name] = best
+            print(f"{name:6s} {len(files):7d} files {size / 1e6:8.1f} MB {best:7.3f}s {size / 1e6 / best:8.1f} MB/s")
+
+        if scan_workers() > 1:
+            paths = [str(f) for f in files]
+            map_cpu(classify_job, paths[: scan_workers()])  # 워커 기동 비용 제외
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                map_cpu(classify_job, paths)
+                best = min(best, time.perf_counter() - start)
+            results["pool"] = best
+            print(f"{'pool':6s} {len(files):7d} files {size / 1e6:8.1f} MB {best:7.3f}s {size / 1e6 / best:8.1f} MB/s"
+                  f"  ({scan_workers()} workers)")
+
+        for name in results:
+            if name != "regex":
+                print(f"{name} speedup x{results['regex'] / results[name]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ ai-agent와 동일한 진입점. README 사용법 그대로 실행 가능.
   python scripts/run_agent.py https://github.com/org/repo.git
   python scripts/run_agent.py --erd --api ./my-project
   python scripts/run_agent.py -e -a -d https://github.com/org/repo.git
+  python scripts/run_agent.py --ref v1.2.0 https://github.com/org/repo.git
 """
 from __future__ import annotations
 
@@ -30,6 +31,7 @@ def main() -> None:
   python scripts/run_agent.py https://github.com/org/repo.git
   python scripts/run_agent.py --erd --api ./my-project
   python scripts/run_agent.py -e -a -d https://github.com/org/repo.git
+  python scripts/run_agent.py --ref v1.2.0 https://github.com/org/repo.git
         """.strip(),
     )
     parser.add_argument("repo", help="로컬 경로 또는 Git URL (예: https://github.com/org/repo.git)")
@@ -40,6 +42,7 @@ def main() -> None:
     parser.add_argument("--stack", "-s", action="store_true", help="기술 스택 문서 생성")
     parser.add_argument("--use-aoai", action="store_true", help="(ERD) 정적 모드 시 Azure OpenAI 스키마 보정")
     parser.add_argument("--ai-first", action="store_true", help="(ERD) AI-first 모드로 전체 분석")
+    parser.add_argument("--ref", default=None, help="브랜치/태그/커밋 SHA (Git URL 전용, 기본: 기본 브랜치)")
 
     args = parser.parse_args()
 
@@ -52,6 +55,7 @@ def main() -> None:
 
     from erd_agent.config import settings
     from erd_agent.commands import erd as cmd_erd
+    from erd_agent.repo_index import open_repo_index
     from api_agent import run_api
     from arch_agent import run_arch
     from ddl_agent import run_ddl
@@ -61,21 +65,24 @@ def main() -> None:
     if not any_opt:
         print("No options given → generating all docs.")
 
-    if erd:
-        cmd_erd.run_erd(
-            args.repo,
-            out_dir=base / "erd",
-            use_aoai=args.use_aoai,
-            ai_first=args.ai_first,
-        )
-    if api:
-        run_api(args.repo, out_dir=base / "api")
-    if arch:
-        run_arch(args.repo, out_dir=base / "arch")
-    if ddl:
-        run_ddl(args.repo, out_dir=base / "ddl")
-    if stack:
-        run_stack(args.repo, out_dir=base / "stack")
+    # 레포를 한 번만 스캔해 모든 에이전트가 공유 (선택한 문서에 필요한 파일만 받음)
+    modes = [m for m, on in (("erd", erd), ("api", api), ("arch", arch), ("ddl", ddl), ("stack", stack)) if on]
+    with open_repo_index(args.repo, ref=args.ref, modes=modes) as index:
+        if erd:
+            cmd_erd.run_erd(
+                index,
+                out_dir=base / "erd",
+                use_aoai=args.use_aoai,
+                ai_first=args.ai_first,
+            )
+        if api:
+            run_api(index, out_dir=base / "api")
+        if arch:
+            run_arch(index, out_dir=base / "arch")
+        if ddl:
+            run_ddl(index, out_dir=base / "ddl")
+        if stack:
+            run_stack(index, out_dir=base / "stack")
 
     print(f"Done. Output under {base}")
 
@@ -1,12 +1,15 @@
 """LLM 기반 API 스펙 추출기."""
 from __future__ import annotations
-import json
+import logging
+import re
 from pathlib import Path
 
-from erd_agent.config import settings
-from erd_agent.llm.aoai_client import build_aoai_client
+from erd_agent.llm.chat import chat_json
+from erd_agent.llm.dispatch import map_concurrent
 from api_agent.models import ExtractedApiSpec
 
+logger = logging.getLogger(__name__)
+
 SYSTEM_PROMPT = """You are a senior backend engineer specializing in REST API documentation.
 You extract API endpoint specifications from Java Spring Boot controller source code.
 Focus on: HTTP method, URL path, path/query/header parameters, request body, response body, status codes.
@@ -81,24 +84,11 @@ def _make_files_blob(chunk: list[tuple[Path, str]]) -> str:
 
 
 def _call_llm(files_blob: str) -> ExtractedApiSpec:
-    client = build_aoai_client()
-    if client is None:
-        raise RuntimeError("Azure OpenAI 설정이 없습니다. (.env의 AZURE_OPENAI_* 값을 설정하세요)")
-
-    resp = client.chat.completions.create(
-        model=settings.azure_openai_deployment,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": USER_PROMPT_TEMPLATE.format(files_blob=files_blob)},
-        ],
-        response_format={"type": "json_object"},
-        temperature=0,
-    )
-    data = json.loads(resp.choices[0].message.content)
+    data = chat_json(SYSTEM_PROMPT, USER_PROMPT_TEMPLATE.format(files_blob=files_blob))
     return ExtractedApiSpec.model_validate(data)
 
 
-def _merge_specs(chunks: list[ExtractedApiSpec]) -> ExtractedApiSpec:
+def merge_specs(chunks: list[ExtractedApiSpec]) -> ExtractedApiSpec:
     all_controllers: dict[str, dict] = {}
     for spec in chunks:
         for ctrl in spec.controllers:
@@ -113,7 +103,109 @@ def _merge_specs(chunks: list[ExtractedApiSpec]) -> ExtractedApiSpec:
     return ExtractedApiSpec.model_validate({"controllers": list(all_controllers.values())})
 
 
-def ai_extract_api(file_texts: list[tuple[Path, str]]) -> ExtractedApiSpec:
+def ai_extract_api(file_texts: list[tuple[Path, str]], max_in_flight: int | None = None) -> ExtractedApiSpec:
     chunks = _chunk_files(file_texts)
-    extracted = [_call_llm(_make_files_blob(ch)) for ch in chunks]
-    return _merge_specs(extracted)
+    extracted = map_concurrent(_call_llm, [_make_files_blob(ch) for ch in chunks], max_in_flight)
+    return merge_specs(extracted)
+
+
+# ---- 정적 추출 결과 요약 보강 (선택) ----
+
+ENRICH_SYSTEM_PROMPT = """You are a senior backend engineer writing REST API documentation.
+You write short summaries for endpoints whose routing was already extracted statically.
+Return ONLY valid JSON (no markdown, no explanation).
+"""
+
+ENRICH_PROMPT_TEMPLATE = """For each line below, write a one-line "summary" and (only if useful) a short "description".
+Lines starting with C are controllers (id, class name, base path); describe the controller's responsibility.
+Lines starting with E are endpoints (id, Controller.handlerMethod, METHOD path, params, request body, response).
+Do not invent parameters or paths. Keep the ids exactly as given.
+
+Output JSON schema:
+{{
+  "controllers": [{{"id": "C0", "description": "User management endpoints"}}],
+  "endpoints": [{{"id": "E0", "summary": "Get user by ID", "description": null}}]
+}}
+
+LINES:
+{lines}
+"""
+
+# 요청 하나에 담을 최대 줄 수 (엔드포인트 시그니처 한 줄 ≈ 수십 토큰)
+_ENRICH_BATCH_LINES = 150
+
+
+def _enrich_lines(spec: ExtractedApiSpec) -> list[list[str]]:
+    """요약이 비어 있는 controller/endpoint를 한 줄씩, controller 단위로 묶어 배치로 나눈다."""
+    batches: list[list[str]] = []
+    cur: list[str] = []
+    for ci, ctrl in enumerate(spec.controllers):
+        group = []
+        if not ctrl.description:
+            group.append(f"C{ci}\t{ctrl.name}\t{ctrl.base_path or '/'}")
+        for ei, ep in enumerate(ctrl.endpoints):
+            if ep.summary:
+                continue
+            params = ", ".join(f"{p.name}:{p.location}:{p.type}" for p in ep.parameters) or "-"
+            group.append(
+                f"E{ci}.{ei}\t{ctrl.name}.{ep.operation_id or '?'}\t{ep.method} {ep.path}\t"
+                f"params: {params}\tbody: {ep.request_body or '-'}\tresponse: {ep.response_body or '-'}"
+            )
+        if cur and len(cur) + len(group) > _ENRICH_BATCH_LINES:
+            batches.append(cur)
+            cur = []
+        cur.extend(group)
+    if cur:
+        batches.append(cur)
+    return batches
+
+
+def _call_enrich(lines: list[str]) -> dict:
+    return chat_json(ENRICH_SYSTEM_PROMPT, ENRICH_PROMPT_TEMPLATE.format(lines="\n".join(lines)))
+
+
+def _try_enrich(lines: list[str]) -> dict | None:
+    """배치 하나 호출. 실패하면 로그만 남기고 None (다른 배치·정적 결과는 그대로 사용)."""
+    try:
+        return _call_enrich(lines)
+    except Exception as exc:
+        logger.warning("API summary batch failed (%d lines): %s", len(lines), exc)
+        return None
+
+
+_CONTROLLER_ID_RE = re.compile(r"C(\d+)")
+_ENDPOINT_ID_RE = re.compile(r"E(\d+)\.(\d+)")
+
+
+def ai_enrich_api(spec: ExtractedApiSpec, max_in_flight: int | None = None) -> ExtractedApiSpec:
+    """
+    정적으로 추출한 스펙에 LLM으로 summary/description만 채운다.
+    소스 전체 대신 엔드포인트 시그니처 한 줄씩만 보내므로 요청이 작고, 경로/파라미터는 바꾸지 않는다.
+    실패한 배치나 형식이 맞지 않는 응답 항목은 건너뛴다 (해당 요약만 빈 채로 남음).
+    """
+    batches = _enrich_lines(spec)
+    if not batches:
+        return spec
+    for data in map_concurrent(_try_enrich, batches, max_in_flight):
+        if not isinstance(data, dict):
+            continue
+        for item in data.get("controllers") or []:
+            m = _CONTROLLER_ID_RE.fullmatch(str(item.get("id", ""))) if isinstance(item, dict) else None
+            if m is None or int(m.group(1)) >= len(spec.controllers):
+                continue
+            ctrl = spec.controllers[int(m.group(1))]
+            if not ctrl.description and item.get("description"):
+                ctrl.description = str(item["description"])
+        for item in data.get("endpoints") or []:
+            m = _ENDPOINT_ID_RE.fullmatch(str(item.get("id", ""))) if isinstance(item, dict) else None
+            if m is None:
+                continue
+            ci, ei = int(m.group(1)), int(m.group(2))
+            if ci >= len(spec.controllers) or ei >= len(spec.controllers[ci].endpoints):
+                continue
+            ep = spec.controllers[ci].endpoints[ei]
+            if not ep.summary and item.get("summary"):
+                ep.summary = str(item["summary"])
+            if not ep.description and item.get("description"):
+                ep.description = str(item["description"])
+    return spec
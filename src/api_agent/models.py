@@ -34,6 +34,7 @@ class EndpointModel(BaseModel):
     response_body: Optional[str] = None  # JSON 예시 or 타입 설명
     response_status: int = 200
     tags: list[str] = Field(default_factory=list)
+    operation_id: Optional[str] = None   # 핸들러 메서드명 (정적 추출 시)
 
     @field_validator("request_body", "response_body", mode="before")
     @classmethod
@@ -1,44 +1,66 @@
-"""API 스펙 문서 생성: Controller 스캔 → LLM 분석 → Markdown 출력."""
+"""API 스펙 문서 생성: Controller 스캔 → 정적 추출(+ 선택적 LLM 보강) → Markdown 출력."""
 from __future__ import annotations
 from pathlib import Path
 
 from rich.console import Console
 
 from erd_agent.config import settings
-from erd_agent.repo import prepare_repo
-from api_agent.scanner import scan_controller_files
-from api_agent.extractor import ai_extract_api
+from erd_agent.llm.aoai_client import get_aoai_client
+from erd_agent.repo_index import RepoIndex, scoped_repo_index
+from api_agent.extractor import ai_enrich_api, ai_extract_api, merge_specs
+from api_agent.static_extractor import extract_api_static
 from api_agent.writer import write_api_spec
 
 console = Console()
 
 
-def _load(p: Path) -> str:
-    return p.read_text(encoding="utf-8", errors="ignore")
-
-
 def run_api(
-    repo: str,
+    repo: str | RepoIndex,
     out_dir: Path | None = None,
     out_file: str = "api_spec.md",
+    mode: str | None = None,
 ) -> Path:
-    repo_path = prepare_repo(repo)
-    base = out_dir or settings.doc_output_dir / "api"
-    base.mkdir(parents=True, exist_ok=True)
-    out_path = base / out_file
+    """
+    mode: static / hybrid / ai (기본: settings.api_extract_mode)
+    """
+    with scoped_repo_index(repo) as index:
+        repo_path = index.root
+        base = out_dir or settings.doc_output_dir / "api"
+        base.mkdir(parents=True, exist_ok=True)
+        out_path = base / out_file
+        mode = (mode or settings.api_extract_mode).lower()
 
-    console.print(f"[bold]Repo:[/bold] {repo_path}")
+        console.print(f"[bold]Repo:[/bold] {repo_path}")
 
-    controller_files = scan_controller_files(repo_path)
-    console.print(f"Found [green]{len(controller_files)}[/green] controller candidates")
+        controller_files = index.controller_files
+        console.print(f"Found [green]{len(controller_files)}[/green] controller candidates")
 
-    if not controller_files:
-        out_path.write_text("# API Specification\n\nNo controllers found.\n", encoding="utf-8")
+        if not controller_files:
+            out_path.write_text("# API Specification\n\nNo controllers found.\n", encoding="utf-8")
+            console.print(f"[bold green]API spec:[/bold green] {out_path}")
+            return out_path
+
+        file_texts = [(f, index.read_text(f)) for f in controller_files]
+        if mode == "ai":
+            spec = ai_extract_api(file_texts)
+        else:
+            spec, unparsed = extract_api_static(file_texts)
+            console.print(
+                f"Static endpoints: [green]{sum(len(c.endpoints) for c in spec.controllers)}[/green]"
+                f" in {len(spec.controllers)} controllers"
+            )
+            use_llm = mode == "hybrid" and get_aoai_client() is not None
+            if unparsed:
+                console.print(f"[yellow]{len(unparsed)} file(s) could not be parsed statically[/yellow]")
+                if use_llm:
+                    try:
+                        spec = merge_specs([spec, ai_extract_api(unparsed)])
+                    except Exception as exc:
+                        # LLM 보완은 선택 단계 — 실패해도 정적 결과로 문서를 쓴다
+                        console.print(f"[yellow]LLM extraction of unparsed files failed, keeping static spec: {exc}[/yellow]")
+            if use_llm:
+                console.print("[yellow]Enriching summaries with Azure OpenAI[/yellow]")
+                spec = ai_enrich_api(spec)
+        write_api_spec(spec, out_path)
         console.print(f"[bold green]API spec:[/bold green] {out_path}")
         return out_path
-
-    file_texts = [(f, _load(f)) for f in controller_files]
-    spec = ai_extract_api(file_texts)
-    write_api_spec(spec, out_path)
-    console.print(f"[bold green]API spec:[/bold green] {out_path}")
-    return out_path
@@ -3,28 +3,31 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
-CONTROLLER_ANN_RE = re.compile(
-    r"@\s*(RestController|Controller|RequestMapping|GetMapping|PostMapping|PutMapping|DeleteMapping|PatchMapping)\b"
+from erd_agent.walker import iter_repo_files
+
+CONTROLLER_ANNOTATIONS = (
+    "RestController", "Controller", "RequestMapping",
+    "GetMapping", "PostMapping", "PutMapping", "DeleteMapping", "PatchMapping",
 )
 
+CONTROLLER_ANN_RE = re.compile(rf"@\s*({'|'.join(CONTROLLER_ANNOTATIONS)})\b")
+
 CONTROLLER_NAME_RE = re.compile(r".*(Controller|Resource|Api)\.java$", re.IGNORECASE)
 
 
+def is_controller_candidate(path: Path, text: str) -> bool:
+    """단일 Java 파일이 Controller 후보인지 판별한다. (scan_controller_files / RepoIndex 공용)"""
+    return bool(CONTROLLER_ANN_RE.search(text) or CONTROLLER_NAME_RE.match(path.name))
+
+
 def scan_controller_files(repo_path: Path) -> list[Path]:
     """@RestController, @Controller 등이 포함된 Java 파일을 찾는다."""
-    candidates: set[Path] = set()
+    from erd_agent.scan_cache import iter_file_signals
 
-    for f in repo_path.rglob("*.java"):
-        if not f.is_file():
-            continue
-        try:
-            text = f.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
+    candidates: set[Path] = set()
 
-        if CONTROLLER_ANN_RE.search(text):
-            candidates.add(f)
-        elif CONTROLLER_NAME_RE.match(f.name):
+    for f, sig, _ in iter_file_signals(iter_repo_files(repo_path, suffixes=(".java",))):
+        if sig.controller_ann or CONTROLLER_NAME_RE.match(f.name):
             candidates.add(f)
 
     return sorted(candidates)
@@ -0,0 +1,372 @@
+"""
+정적 API 스펙 추출기: Spring Controller 소스 → ExtractedApiSpec (LLM 불필요).
+
+@RequestMapping/@GetMapping 등의 경로·HTTP 메서드, @PathVariable/@RequestParam/@RequestHeader 파라미터,
+@RequestBody 타입, 반환 타입, @ResponseStatus, Swagger(@Operation/@Tag, @ApiOperation/@Api) 정보는
+모두 애너테이션에 그대로 적혀 있으므로 선언부 AST(java_lite, 실패 시 javalang)에서 직접 채운다.
+경로에 쓰인 문자열 상수(static final String BASE = "/api")는 같은 입력 파일들 안에서 해석한다.
+요약/설명 보강이 필요하면 extractor.ai_enrich_api()로 작은 배치 요청을 따로 보낸다.
+"""
+from __future__ import annotations
+import re
+from pathlib import Path
+from typing import Any
+
+from erd_agent.parsers.jpa_java import parse_java
+from api_agent.models import ControllerModel, EndpointModel, ExtractedApiSpec, ParamModel
+
+MAPPING_METHODS = {
+    "GetMapping": "GET",
+    "PostMapping": "POST",
+    "PutMapping": "PUT",
+    "DeleteMapping": "DELETE",
+    "PatchMapping": "PATCH",
+    "RequestMapping": None,  # method 속성으로 결정 (없으면 ANY)
+}
+
+PARAM_LOCATIONS = {
+    "PathVariable": "path",
+    "RequestParam": "query",
+    "RequestHeader": "header",
+    "CookieValue": "cookie",
+    "RequestPart": "form",
+    "ModelAttribute": "query",
+}
+
+# 응답 본문 타입을 감싸는 래퍼 (첫 타입 인자를 응답 타입으로 사용)
+RESPONSE_WRAPPERS = {
+    "ResponseEntity", "HttpEntity", "Mono", "Optional",
+    "CompletableFuture", "CompletionStage", "Callable", "DeferredResult", "WebAsyncTask",
+}
+
+HTTP_STATUS = {
+    "OK": 200, "CREATED": 201, "ACCEPTED": 202, "NO_CONTENT": 204,
+    "MOVED_PERMANENTLY": 301, "FOUND": 302, "SEE_OTHER": 303, "NOT_MODIFIED": 304,
+    "BAD_REQUEST": 400, "UNAUTHORIZED": 401, "FORBIDDEN": 403, "NOT_FOUND": 404,
+    "METHOD_NOT_ALLOWED": 405, "CONFLICT": 409, "GONE": 410, "UNPROCESSABLE_ENTITY": 422,
+    "TOO_MANY_REQUESTS": 429, "INTERNAL_SERVER_ERROR": 500, "NOT_IMPLEMENTED": 501,
+    "SERVICE_UNAVAILABLE": 503,
+}
+
+_CONCAT_SPLIT_RE = re.compile(r'"(?:\\.|[^"\\])*"|[^+"]+')
+
+
+# ---- AST 헬퍼 (java_lite / javalang 공용) ----
+
+def _ann_name(ann: Any) -> str:
+    return ann.name.rsplit(".", 1)[-1]
+
+
+def _find_ann(annotations: list, *names: str) -> Any:
+    for ann in annotations or []:
+        if _ann_name(ann) in names:
+            return ann
+    return None
+
+
+def _ann_attr(ann: Any, *names: str) -> Any:
+    """애너테이션 속성 값 (단일 값 형태 @X("a")는 'value'로 취급). 없으면 None."""
+    if ann is None or ann.element is None:
+        return None
+    element = ann.element
+    if isinstance(element, list):
+        for pair in element:
+            if pair.name in names:
+                return pair.value
+        return None
+    return element if "value" in names else None
+
+
+def _unquote(raw: str) -> str:
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+        return re.sub(r"\\(.)", r"\1", raw[1:-1])
+    return raw
+
+
+class _Constants:
+    """입력 파일들의 문자열 상수 (타입명.이름 → 값, 파일 내 이름 → 값)."""
+
+    def __init__(self) -> None:
+        self.qualified: dict[tuple[str, str], str] = {}
+
+    def collect(self, tree: Any) -> dict[str, str]:
+        local: dict[str, str] = {}
+        for t in _iter_types(getattr(tree, "types", None) or []):
+            in_interface = type(t).__name__ == "InterfaceDeclaration" or getattr(t, "kind", "") == "interface"
+            for f in getattr(t, "fields", []) or []:
+                mods = getattr(f, "modifiers", set()) or set()
+                if not (in_interface or {"static", "final"} <= set(mods)):
+                    continue
+                for d in getattr(f, "declarators", []) or []:
+                    init = getattr(d, "initializer", None)
+                    raw = getattr(init, "value", None)
+                    if isinstance(raw, str) and raw.startswith('"'):
+                        local[d.name] = self.qualified[(t.name, d.name)] = _unquote(raw)
+        return local
+
+    def resolve(self, node: Any, local: dict[str, str]) -> str | None:
+        """문자열 값으로 해석 (리터럴 / 상수 참조 / '+' 연결). 해석 불가면 None."""
+        if node is None:
+            return None
+        kind = type(node).__name__
+        if kind == "Literal":
+            return _unquote(node.value)
+        if kind == "MemberReference":
+            qualifier = (node.qualifier or "").rsplit(".", 1)[-1]
+            if qualifier:
+                return self.qualified.get((qualifier, node.member))
+            return local.get(node.member)
+        if kind == "BinaryOperation" and node.operator == "+":  # javalang
+            left, right = self.resolve(node.operandl, local), self.resolve(node.operandr, local)
+            return None if left is None or right is None else left + right
+        if kind == "Expression":  # java_lite: "/api" + BASE
+            parts = []
+            for token in _CONCAT_SPLIT_RE.findall(node.text):
+                token = token.strip()
+                if not token:
+                    continue
+                if token.startswith('"'):
+                    parts.append(_unquote(token))
+                    continue
+                qualifier, _, member = token.rpartition(".")
+                value = self.qualified.get((qualifier.rsplit(".", 1)[-1], member)) if qualifier else local.get(member)
+                if value is None:
+                    return None
+                parts.append(value)
+            return "".join(parts) if parts else None
+        return None
+
+    def strings(self, node: Any, local: dict[str, str]) -> list[str]:
+        """배열/단일 값을 문자열 목록으로. 해석하지 못한 상수는 ${이름} 자리표시자로 남긴다."""
+        if node is None:
+            return []
+        if hasattr(node, "values"):  # ElementArrayValue
+            return [s for v in node.values for s in self.strings(v, local)]
+        value = self.resolve(node, local)
+        if value is None:
+            if type(node).__name__ == "MemberReference":
+                return [f"${{{node.qualifier + '.' if node.qualifier else ''}{node.member}}}"]
+            return [f"${{{getattr(node, 'text', '?')}}}"]
+        return [value]
+
+
+def _iter_types(types: list) -> list:
+    """최상위 + 중첩 타입 선언 (java_lite .types / javalang .body)."""
+    out = []
+    for t in types:
+        if not hasattr(t, "methods"):
+            continue
+        out.append(t)
+        nested = getattr(t, "types", None)
+        if nested is None:
+            body = getattr(t, "body", None)
+            nested = body if isinstance(body, list) else []
+        out.extend(_iter_types(nested))
+    return out
+
+
+def type_to_str(t: Any) -> str:
+    """타입 노드 → 'List<UserDto>' 형태 문자열."""
+    if t is None:
+        return "void"
+    while getattr(t, "sub_type", None) is not None:  # javalang: java.util.List → sub_type 체인
+        t = t.sub_type
+    s = t.name
+    args = getattr(t, "arguments", None)
+    if args:
+        rendered = []
+        for a in args:
+            if a.type is None:
+                rendered.append("?")
+            elif a.pattern_type in ("extends", "super"):
+                rendered.append(f"? {a.pattern_type} {type_to_str(a.type)}")
+            else:
+                rendered.append(type_to_str(a.type))
+        s += f"<{', '.join(rendered)}>"
+    dims = getattr(t, "dimensions", 0)
+    return s + "[]" * (len(dims) if isinstance(dims, list) else (dims or 0))
+
+
+def _response_type(t: Any) -> str | None:
+    while t is not None and t.name in RESPONSE_WRAPPERS:
+        args = getattr(t, "arguments", None)
+        if not args:
+            return None
+        t = args[0].type
+    if t is None or t.name == "Void":
+        return None
+    return type_to_str(t)
+
+
+def join_paths(base: str, path: str) -> str:
+    parts = [p.strip("/") for p in (base, path) if p and p.strip("/")]
+    return "/" + "/".join(parts)
+
+
+# ---- 추출 ----
+
+def _status(annotations: list) -> int:
+    ann = _find_ann(annotations, "ResponseStatus")
+    value = _ann_attr(ann, "value", "code")
+    if value is not None and type(value).__name__ == "MemberReference":
+        return HTTP_STATUS.get(value.member, 200)
+    return 200
+
+
+def _param(p: Any, consts: _Constants, local: dict[str, str]) -> tuple[str, ParamModel | str] | None:
+    """('param', ParamModel) / ('body', 타입 문자열) / None(바인딩 애너테이션 없음)."""
+    annotations = getattr(p, "annotations", []) or []
+    if _find_ann(annotations, "RequestBody"):
+        return "body", type_to_str(p.type)
+    for ann in annotations:
+        location = PARAM_LOCATIONS.get(_ann_name(ann))
+        if location is None:
+            continue
+        names = consts.strings(_ann_attr(ann, "value", "name"), local)
+        required_node = _ann_attr(ann, "required")
+        required = not (
+            getattr(required_node, "value", None) == "false"
+            or _ann_attr(ann, "defaultValue") is not None
+            or p.type.name == "Optional"
+        )
+        doc = _find_ann(annotations, "Parameter", "ApiParam")
+        description = None
+        if doc is not None:
+            key = "description" if _ann_name(doc) == "Parameter" else "value"
+            description = consts.resolve(_ann_attr(doc, key), local)
+        return "param", ParamModel(
+            name=names[0] if names else p.name,
+            location=location,
+            type=type_to_str(p.type),
+            required=required,
+            description=description,
+        )
+    return None
+
+
+def _endpoints(
+    m: Any,
+    bases: list[str],
+    class_tags: list[str],
+    consts: _Constants,
+    local: dict[str, str],
+) -> list[EndpointModel]:
+    annotations = getattr(m, "annotations", []) or []
+    mapping = next((a for a in annotations if _ann_name(a) in MAPPING_METHODS), None)
+    if mapping is None:
+        return []
+    http = MAPPING_METHODS[_ann_name(mapping)]
+    methods = [http] if http else [
+        v.member for v in _flatten(_ann_attr(mapping, "method")) if type(v).__name__ == "MemberReference"
+    ] or ["ANY"]
+    paths = consts.strings(_ann_attr(mapping, "value", "path"), local) or [""]
+
+    summary = description = None
+    tags = list(class_tags)
+    op = _find_ann(annotations, "Operation", "ApiOperation")
+    if op is not None:
+        if _ann_name(op) == "Operation":
+            summary = consts.resolve(_ann_attr(op, "summary"), local)
+            description = consts.resolve(_ann_attr(op, "description"), local)
+        else:
+            summary = consts.resolve(_ann_attr(op, "value"), local)
+            description = consts.resolve(_ann_attr(op, "notes"), local)
+        tags += [t for t in consts.strings(_ann_attr(op, "tags"), local) if t not in tags]
+
+    parameters: list[ParamModel] = []
+    request_body = None
+    for p in getattr(m, "parameters", []) or []:
+        got = _param(p, consts, local)
+        if got is None:
+            continue
+        kind, value = got
+        if kind == "body":
+            request_body = value
+        else:
+            parameters.append(value)
+
+    # value = {"", "/"}처럼 정규화 후 같은 경로가 되는 조합은 (verb, 경로)당 하나만
+    routes = dict.fromkeys(
+        (verb, join_paths(base, path)) for base in bases for path in paths for verb in methods
+    )
+    return [
+        EndpointModel(
+            method=verb,
+            path=path,
+            summary=summary,
+            description=description,
+            parameters=[p.model_copy() for p in parameters],
+            request_body=request_body,
+            response_body=_response_type(m.return_type),
+            response_status=_status(annotations),
+            tags=tags,
+            operation_id=m.name,
+        )
+        for verb, path in routes
+    ]
+
+
+def _flatten(node: Any) -> list:
+    if node is None:
+        return []
+    if hasattr(node, "values"):
+        return [x for v in node.values for x in _flatten(v)]
+    return [node]
+
+
+def _controller(t: Any, consts: _Constants, local: dict[str, str]) -> ControllerModel | None:
+    annotations = getattr(t, "annotations", []) or []
+    is_controller = _find_ann(annotations, "RestController", "Controller") is not None
+    mapping = _find_ann(annotations, "RequestMapping")
+    bases = consts.strings(_ann_attr(mapping, "value", "path"), local) or [""]
+
+    tag = _find_ann(annotations, "Tag", "Api")
+    class_tags: list[str] = []
+    description = None
+    if tag is not None:
+        if _ann_name(tag) == "Tag":
+            class_tags = consts.strings(_ann_attr(tag, "name"), local)
+            description = consts.resolve(_ann_attr(tag, "description"), local)
+        else:
+            class_tags = consts.strings(_ann_attr(tag, "tags"), local) or consts.strings(_ann_attr(tag, "value"), local)
+            description = consts.resolve(_ann_attr(tag, "description"), local)
+
+    endpoints = [
+        ep
+        for m in getattr(t, "methods", []) or []
+        for ep in _endpoints(m, bases, class_tags, consts, local)
+    ]
+    if not endpoints and not is_controller:
+        return None
+    return ControllerModel(
+        name=t.name,
+        base_path=join_paths(bases[0], "") if bases[0] else None,
+        description=description,
+        endpoints=endpoints,
+    )
+
+
+def extract_api_static(
+    file_texts: list[tuple[Path, str]],
+) -> tuple[ExtractedApiSpec, list[tuple[Path, str]]]:
+    """
+    Controller 후보 파일들에서 API 스펙을 정적으로 추출한다.
+    반환: (spec, 파싱하지 못한 파일 목록) — 후자는 호출 측이 LLM 추출로 넘길 수 있다.
+    """
+    consts = _Constants()
+    parsed: list[tuple[Any, dict[str, str]]] = []
+    failed: list[tuple[Path, str]] = []
+    for path, text in file_texts:
+        tree = parse_java(text, path)
+        if tree is None:
+            failed.append((path, text))
+            continue
+        parsed.append((tree, consts.collect(tree)))
+
+    controllers: list[ControllerModel] = []
+    for tree, local in parsed:
+        for t in _iter_types(getattr(tree, "types", None) or []):
+            ctrl = _controller(t, consts, local)
+            if ctrl is not None:
+                controllers.append(ctrl)
+    return ExtractedApiSpec(controllers=controllers), failed
@@ -1,12 +1,13 @@
-"""LLM 기반 아키텍처 분석."""
+"""LLM 기반 아키텍처 분석 (ai 모드: 소스 전체 / hybrid 모드: 정적 그래프 요약으로 서술만)."""
 from __future__ import annotations
-import json
+import logging
 from pathlib import Path
 
-from erd_agent.config import settings
-from erd_agent.llm.aoai_client import build_aoai_client
+from erd_agent.llm.chat import chat_json
 from arch_agent.models import ExtractedArchitecture
 
+logger = logging.getLogger(__name__)
+
 SYSTEM_PROMPT = """You are a senior software architect.
 You analyze project source code and configuration to produce an architecture diagram document.
 Return ONLY valid JSON (no markdown, no explanation).
@@ -73,21 +74,58 @@ def ai_extract_architecture(
     file_texts: list[tuple[Path, str]],
     dir_tree: str,
 ) -> ExtractedArchitecture:
-    client = build_aoai_client()
-    if client is None:
-        raise RuntimeError("Azure OpenAI 설정이 없습니다.")
-
     files_blob = _make_files_blob(file_texts)
     user_prompt = USER_PROMPT_TEMPLATE.format(dir_tree=dir_tree, files_blob=files_blob)
 
-    resp = client.chat.completions.create(
-        model=settings.azure_openai_deployment,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        response_format={"type": "json_object"},
-        temperature=0,
-    )
-    data = json.loads(resp.choices[0].message.content)
+    data = chat_json(SYSTEM_PROMPT, user_prompt)
     return ExtractedArchitecture.model_validate(data)
+
+
+NARRATE_SYSTEM_PROMPT = """You are a senior software architect writing architecture documentation.
+The layers, dependencies and external systems were already extracted statically from import statements.
+Return ONLY valid JSON (no markdown, no explanation).
+"""
+
+NARRATE_PROMPT_TEMPLATE = """Write a one-paragraph "summary" of this architecture for new team members, based only on the
+graph digest below (nodes are layers, or "module / layer" in multi-module builds; edge counts are import statements).
+Mention the overall style, the main request flow and notable couplings (e.g. dependencies that skip or invert layers).
+Do not invent components that are not in the digest.
+
+Output JSON schema:
+{{"summary": "..."}}
+
+DIGEST:
+{digest}
+"""
+
+# 다이제스트에 나열할 레이어별 클래스 수
+_DIGEST_COMPONENTS = 8
+
+
+def architecture_digest(arch: ExtractedArchitecture) -> str:
+    """정적 분석 결과를 LLM 입력용으로 압축한다 (소스 본문 없이 수 KB 이내)."""
+    lines = [f"project: {arch.project_name or '-'}", f"detected style: {arch.architecture_style or 'unknown'}", "", "nodes:"]
+    for layer in arch.layers:
+        sample = ", ".join(c for c in layer.components[:_DIGEST_COMPONENTS] if not c.startswith("…"))
+        lines.append(f"- {layer.name}: {layer.description or ''}; e.g. {sample or '-'}")
+    lines += ["", "edges:"]
+    lines += [f"- {d.source} -> {d.target}: {d.description or ''}" for d in arch.dependencies] or ["- none"]
+    lines += ["", "external systems:"]
+    lines += [f"- {e.name} ({e.type}): {e.description or ''}" for e in arch.external_systems] or ["- none"]
+    return "\n".join(lines)
+
+
+def ai_narrate_architecture(arch: ExtractedArchitecture) -> ExtractedArchitecture:
+    """
+    정적으로 만든 그래프는 그대로 두고 summary만 LLM 서술로 바꾼다.
+    호출이 실패하거나 응답 형식이 맞지 않으면 로그만 남기고 정적 summary를 유지한다.
+    """
+    try:
+        data = chat_json(NARRATE_SYSTEM_PROMPT, NARRATE_PROMPT_TEMPLATE.format(digest=architecture_digest(arch)))
+    except Exception as exc:
+        logger.warning("Architecture summary request failed, keeping static summary: %s", exc)
+        return arch
+    summary = data.get("summary") if isinstance(data, dict) else None
+    if summary:
+        arch.summary = str(summary)
+    return arch
@@ -1,48 +1,72 @@
-"""아키텍처 문서 생성: 프로젝트 스캔 → LLM 분석 → Mermaid/Markdown 출력."""
+"""아키텍처 문서 생성: 프로젝트 스캔 → 정적 import 그래프(+ 선택적 LLM 서술) → Mermaid/Markdown 출력."""
 from __future__ import annotations
 from pathlib import Path
 
 from rich.console import Console
 
 from erd_agent.config import settings
-from erd_agent.repo import prepare_repo
-from arch_agent.scanner import scan_arch_files, collect_directory_tree
-from arch_agent.extractor import ai_extract_architecture
+from erd_agent.llm.aoai_client import get_aoai_client
+from erd_agent.repo_index import RepoIndex, scoped_repo_index
+from arch_agent.scanner import collect_directory_tree, collect_directory_tree_from_paths, is_arch_config_file
+from arch_agent.extractor import ai_extract_architecture, ai_narrate_architecture
+from arch_agent.static_extractor import analyze_architecture
 from arch_agent.writer import write_architecture
 
 console = Console()
 
 
-def _load(p: Path) -> str:
-    return p.read_text(encoding="utf-8", errors="ignore")
-
-
 def run_arch(
-    repo: str,
+    repo: str | RepoIndex,
     out_dir: Path | None = None,
     out_file: str = "architecture.md",
+    mode: str | None = None,
 ) -> Path:
-    repo_path = prepare_repo(repo)
-    base = out_dir or settings.doc_output_dir / "arch"
-    base.mkdir(parents=True, exist_ok=True)
-    out_path = base / out_file
-
-    console.print(f"[bold]Repo:[/bold] {repo_path}")
-
-    arch_files = scan_arch_files(repo_path)
-    dir_tree = collect_directory_tree(repo_path)
-    console.print(f"Found [green]{len(arch_files)}[/green] architecture-relevant files")
-
-    if not arch_files:
-        out_path.write_text(
-            f"# Architecture\n\nNo architecture-relevant files found in {repo_path}.\n",
-            encoding="utf-8",
-        )
+    """
+    mode: static / hybrid / ai (기본: settings.arch_extract_mode)
+    """
+    with scoped_repo_index(repo) as index:
+        repo_path = index.root
+        base = out_dir or settings.doc_output_dir / "arch"
+        base.mkdir(parents=True, exist_ok=True)
+        out_path = base / out_file
+        mode = (mode or settings.arch_extract_mode).lower()
+
+        console.print(f"[bold]Repo:[/bold] {repo_path}")
+
+        arch_files = index.arch_files
+        console.print(f"Found [green]{len(arch_files)}[/green] architecture-relevant files")
+
+        if not arch_files:
+            out_path.write_text(
+                f"# Architecture\n\nNo architecture-relevant files found in {repo_path}.\n",
+                encoding="utf-8",
+            )
+            console.print(f"[bold green]Architecture:[/bold green] {out_path}")
+            return out_path
+
+        java_files = [f for f in index.files if f.suffix == ".java"]
+        use_llm = mode != "static" and get_aoai_client() is not None
+        if mode == "ai" or (not java_files and use_llm):
+            if index.fs.is_local_dir:
+                dir_tree = collect_directory_tree(repo_path)
+            else:
+                dir_tree = collect_directory_tree_from_paths(repo_path, index.files)
+            file_texts = [(f, index.read_text(f)) for f in arch_files]
+            arch = ai_extract_architecture(file_texts, dir_tree)
+        else:
+            config_files = [f for f in arch_files if is_arch_config_file(f)]
+            arch = analyze_architecture(
+                [(f.relative_to(repo_path).as_posix(), index.read_text(f)) for f in java_files],
+                [(f.relative_to(repo_path).as_posix(), index.read_text(f)) for f in config_files],
+                repo_path,
+            )
+            console.print(
+                f"Static import graph: [green]{len(arch.layers)}[/green] layer/module nodes,"
+                f" {len(arch.dependencies)} edges"
+            )
+            if use_llm:
+                console.print("[yellow]Writing summary with Azure OpenAI[/yellow]")
+                arch = ai_narrate_architecture(arch)
+        write_architecture(arch, out_path)
         console.print(f"[bold green]Architecture:[/bold green] {out_path}")
         return out_path
-
-    file_texts = [(f, _load(f)) for f in arch_files]
-    arch = ai_extract_architecture(file_texts, dir_tree)
-    write_architecture(arch, out_path)
-    console.print(f"[bold green]Architecture:[/bold green] {out_path}")
-    return out_path
@@ -3,14 +3,18 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
-ARCH_HINTS_RE = re.compile(
-    r"@\s*(SpringBootApplication|Configuration|EnableAutoConfiguration"
-    r"|Component|Service|Repository|Controller|RestController"
-    r"|EnableFeignClients|EnableEurekaClient|EnableDiscoveryClient"
-    r"|EnableCircuitBreaker|EnableKafka|EnableCaching"
-    r"|EnableJpaRepositories|EnableWebSecurity)\b"
+from erd_agent.walker import iter_repo_files
+
+ARCH_ANNOTATIONS = (
+    "SpringBootApplication", "Configuration", "EnableAutoConfiguration",
+    "Component", "Service", "Repository", "Controller", "RestController",
+    "EnableFeignClients", "EnableEurekaClient", "EnableDiscoveryClient",
+    "EnableCircuitBreaker", "EnableKafka", "EnableCaching",
+    "EnableJpaRepositories", "EnableWebSecurity",
 )
 
+ARCH_HINTS_RE = re.compile(rf"@\s*({'|'.join(ARCH_ANNOTATIONS)})\b")
+
 CONFIG_FILES = {
     "pom.xml", "build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts",
     "application.yml", "application.yaml", "application.properties",
@@ -20,30 +24,40 @@ CONFIG_FILES = {
 }
 
 
+def is_arch_config_file(path: Path) -> bool:
+    return path.name in CONFIG_FILES
+
+
+def has_arch_hint(text: str) -> bool:
+    return bool(ARCH_HINTS_RE.search(text))
+
+
 def scan_arch_files(repo_path: Path) -> list[Path]:
     """아키텍처 파악에 유용한 파일들을 수집한다."""
+    from erd_agent.scan_cache import iter_file_signals
+
     candidates: set[Path] = set()
+    java_files: list[Path] = []
 
-    for f in repo_path.rglob("*"):
-        if not f.is_file():
-            continue
-        if f.name in CONFIG_FILES:
+    for f in iter_repo_files(repo_path):
+        if is_arch_config_file(f):
+            candidates.add(f)
+        elif f.suffix == ".java":
+            java_files.append(f)
+
+    for f, sig, _ in iter_file_signals(java_files):
+        if sig.arch_hint:
             candidates.add(f)
-            continue
-        if f.suffix == ".java":
-            try:
-                text = f.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
-                continue
-            if ARCH_HINTS_RE.search(text):
-                candidates.add(f)
 
     return sorted(candidates)
 
 
+TREE_SKIP_DIRS = {".git", "node_modules", "target", "build", ".gradle", ".idea", ".vscode", "__pycache__", ".cache", "out"}
+
+
 def collect_directory_tree(repo_path: Path, max_depth: int = 4) -> str:
     """디렉터리 트리를 문자열로 생성한다 (숨김 폴더, 빌드 산출물 제외)."""
-    skip = {".git", "node_modules", "target", "build", ".gradle", ".idea", ".vscode", "__pycache__", ".cache", "out"}
+    skip = TREE_SKIP_DIRS
     lines: list[str] = []
 
     def _walk(p: Path, prefix: str, depth: int):
@@ -63,3 +77,35 @@ def collect_directory_tree(repo_path: Path, max_depth: int = 4) -> str:
     lines.append(repo_path.name + "/")
     _walk(repo_path, "", 1)
     return "\n".join(lines)
+
+
+def collect_directory_tree_from_paths(repo_path: Path, files: list[Path], max_depth: int = 4) -> str:
+    """
+    파일 목록만으로 collect_directory_tree와 같은 형식의 트리를 만든다.
+    (zip 아카이브처럼 실제 디렉터리가 없는 레포용)
+    """
+    tree: dict = {}
+    for f in files:
+        parts = f.relative_to(repo_path).parts
+        if any(part in TREE_SKIP_DIRS or part.startswith(".") for part in parts):
+            continue
+        node = tree
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node.setdefault(parts[-1], None)
+
+    lines: list[str] = [repo_path.name + "/"]
+
+    def _walk(node: dict, prefix: str, depth: int):
+        if depth > max_depth:
+            return
+        entries = sorted(node.items(), key=lambda kv: (kv[1] is None, kv[0]))
+        for i, (name, child) in enumerate(entries):
+            connector = "└── " if i == len(entries) - 1 else "├── "
+            lines.append(f"{prefix}{connector}{name}")
+            if child is not None:
+                extension = "    " if i == len(entries) - 1 else "│   "
+                _walk(child, prefix + extension, depth + 1)
+
+    _walk(tree, "", 1)
+    return "\n".join(lines)
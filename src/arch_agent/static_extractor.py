@@ -0,0 +1,379 @@
+"""
+정적 아키텍처 분석기: Java import 그래프 + Spring 스테레오타입 → ExtractedArchitecture (LLM 불필요).
+
+- 파일마다 첫 타입 선언 앞부분(헤더)만 본다: package, import, 타입 애너테이션(ARCH_HINTS_RE)
+- 클래스 → (빌드 모듈, 레이어)로 접어서 노드를 만들고, 레포 내부 import를 노드 간 간선으로 집계
+- 외부 시스템은 빌드 파일 의존성/compose 이미지(stack_agent.build_parsers)에서 찾고,
+  그 라이브러리 패키지를 import하는 레이어와 연결
+- Mermaid 다이어그램은 위 그래프에서 결정적으로 생성
+"""
+from __future__ import annotations
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+from arch_agent.models import DependencyModel, ExternalSystemModel, ExtractedArchitecture, LayerModel
+from arch_agent.scanner import ARCH_HINTS_RE
+
+# 다이어그램/문서에서 위에서 아래로 놓는 순서
+LAYER_ORDER = [
+    "Presentation", "Service", "Domain", "Repository", "Infrastructure", "Configuration", "Common", "Other",
+]
+
+# 타입 애너테이션 → 레이어 (Component는 패키지/이름 규칙으로 넘긴다)
+_STEREOTYPE_LAYERS = {
+    "RestController": "Presentation", "Controller": "Presentation",
+    "Service": "Service", "Repository": "Repository",
+    "SpringBootApplication": "Configuration", "Configuration": "Configuration",
+    "EnableAutoConfiguration": "Configuration",
+}
+_DOMAIN_ANN_RE = re.compile(r"@\s*(?:Entity|Embeddable|MappedSuperclass|Document)\b")
+
+# 클래스 이름 접미사 → 레이어
+_NAME_LAYERS = [
+    (re.compile(r"(?:Controller|RestController|Resource|Endpoint)$"), "Presentation"),
+    (re.compile(r"(?:Service|ServiceImpl|UseCase|Facade)$"), "Service"),
+    (re.compile(r"(?:Repository|RepositoryImpl|Dao|Mapper)$"), "Repository"),
+    (re.compile(r"(?:Client|Gateway|Adapter|Producer|Consumer|Listener|Publisher)$"), "Infrastructure"),
+    (re.compile(r"(?:Config|Configuration|Properties)$"), "Configuration"),
+    (re.compile(r"(?:Entity|Dto|DTO|Vo|VO)$"), "Domain"),
+    (re.compile(r"(?:Util|Utils|Exception|Constants)$"), "Common"),
+]
+
+# 패키지 세그먼트 → 레이어 (가장 안쪽 세그먼트부터 확인)
+_PACKAGE_LAYERS = {
+    **dict.fromkeys(("controller", "controllers", "web", "api", "rest", "presentation", "ui", "endpoint",
+                     "endpoints", "resource", "resources"), "Presentation"),
+    **dict.fromkeys(("service", "services", "application", "usecase", "usecases", "facade"), "Service"),
+    **dict.fromkeys(("domain", "entity", "entities", "model", "models", "dto", "dtos", "vo"), "Domain"),
+    **dict.fromkeys(("repository", "repositories", "repo", "dao", "persistence", "mapper", "mappers"), "Repository"),
+    **dict.fromkeys(("infrastructure", "infra", "adapter", "adapters", "client", "clients", "gateway",
+                     "messaging", "external", "integration"), "Infrastructure"),
+    **dict.fromkeys(("config", "configuration", "security", "bootstrap"), "Configuration"),
+    **dict.fromkeys(("util", "utils", "common", "support", "shared", "exception", "exceptions"), "Common"),
+}
+
+# (빌드 의존성/이미지 이름 패턴, 외부 시스템, 종류, 사용 여부를 판단할 import 접두사)
+_JDBC_IMPORTS = (
+    "jakarta.persistence", "javax.persistence", "org.springframework.data.jpa", "org.springframework.jdbc",
+    "org.springframework.data.jdbc", "org.springframework.data.r2dbc", "java.sql", "javax.sql", "org.hibernate",
+    "org.apache.ibatis", "org.mybatis", "org.jooq", "com.querydsl",
+)
+EXTERNAL_SYSTEMS = [
+    (re.compile(r"postgres"), "PostgreSQL", "database", _JDBC_IMPORTS),
+    (re.compile(r"mysql"), "MySQL", "database", _JDBC_IMPORTS),
+    (re.compile(r"mariadb"), "MariaDB", "database", _JDBC_IMPORTS),
+    (re.compile(r"ojdbc|oracle"), "Oracle", "database", _JDBC_IMPORTS),
+    (re.compile(r"mssql|sqlserver"), "SQL Server", "database", _JDBC_IMPORTS),
+    (re.compile(r"(?:^|:)h2$|h2database"), "H2", "database", _JDBC_IMPORTS),
+    (re.compile(r"mongo"), "MongoDB", "database", ("org.springframework.data.mongodb", "com.mongodb")),
+    (re.compile(r"elasticsearch|opensearch"), "Elasticsearch", "database",
+     ("org.springframework.data.elasticsearch", "org.elasticsearch", "co.elastic", "org.opensearch")),
+    (re.compile(r"redis|jedis|lettuce|redisson"), "Redis", "cache",
+     ("org.springframework.data.redis", "redis.clients", "io.lettuce", "org.redisson")),
+    (re.compile(r"kafka"), "Kafka", "message-broker", ("org.springframework.kafka", "org.apache.kafka")),
+    (re.compile(r"amqp|rabbit"), "RabbitMQ", "message-broker", ("org.springframework.amqp", "com.rabbitmq")),
+    (re.compile(r"openfeign"), "External HTTP APIs", "external-api",
+     ("org.springframework.cloud.openfeign", "feign")),
+]
+
+_MODULE_BUILD_FILES = {"pom.xml", "build.gradle", "build.gradle.kts"}
+
+# 레이어당 문서에 나열할 최대 클래스 수
+_MAX_COMPONENTS = 40
+
+# 주석과 문자열 리터럴 (문자열은 비워서 남긴다 — "http://" 같은 값이 주석으로 오인되지 않게)
+_COMMENT_OR_STRING_RE = re.compile(r'"(?:\\.|[^"\\\n])*"|/\*.*?\*/|//[^\n]*', re.S)
+_PACKAGE_RE = re.compile(r"^\s*package\s+([\w.]+)\s*;", re.M)
+_IMPORT_RE = re.compile(r"^\s*import\s+(?:static\s+)?([\w.]+?)(\.\*)?\s*;", re.M)
+_TYPE_RE = re.compile(r"\b(?:class|interface|enum|record)\s+([A-Za-z_$][\w$]*)")
+_HEADER_PROBE = 16_384
+
+
+@dataclass
+class JavaHeader:
+    path: str
+    package: str
+    name: str
+    imports: list[tuple[str, bool]] = field(default_factory=list)   # (이름, 와일드카드 여부)
+    stereotypes: list[str] = field(default_factory=list)
+    domain: bool = False
+
+    @property
+    def fqn(self) -> str:
+        return f"{self.package}.{self.name}" if self.package else self.name
+
+
+def _strip(text: str) -> str:
+    return _COMMENT_OR_STRING_RE.sub(lambda m: '""' if m.group(0).startswith('"') else " ", text)
+
+
+def parse_java_header(path: str, text: str) -> JavaHeader | None:
+    """첫 타입 선언까지의 package/import/애너테이션만 읽는다. 타입 선언이 없으면 None."""
+    clean = _strip(text[:_HEADER_PROBE])
+    m = _TYPE_RE.search(clean)
+    if m is None and len(text) > _HEADER_PROBE:
+        clean = _strip(text)
+        m = _TYPE_RE.search(clean)
+    if m is None:
+        return None
+    header = clean[:m.start()]
+    pkg = _PACKAGE_RE.search(header)
+    return JavaHeader(
+        path=path,
+        package=pkg.group(1) if pkg else "",
+        name=m.group(1),
+        imports=[(name, bool(star)) for name, star in _IMPORT_RE.findall(header)],
+        stereotypes=ARCH_HINTS_RE.findall(header),
+        domain=bool(_DOMAIN_ANN_RE.search(header)),
+    )
+
+
+def classify_layer(h: JavaHeader) -> str:
+    """스테레오타입 > 클래스 이름 접미사 > 패키지 세그먼트(안쪽부터) 순으로 레이어를 정한다."""
+    for ann in h.stereotypes:
+        if ann in _STEREOTYPE_LAYERS:
+            return _STEREOTYPE_LAYERS[ann]
+        if ann.startswith("Enable"):
+            return "Configuration"
+    if h.domain:
+        return "Domain"
+    for rx, layer in _NAME_LAYERS:
+        if rx.search(h.name):
+            return layer
+    for seg in reversed(h.package.split(".")):
+        if seg.lower() in _PACKAGE_LAYERS:
+            return _PACKAGE_LAYERS[seg.lower()]
+    return "Other"
+
+
+def is_test_source(rel: str) -> bool:
+    parts = PurePosixPath(rel).parts
+    return any(a == "src" and "test" in b.lower() for a, b in zip(parts, parts[1:]))
+
+
+def _module_of(rel: str, module_dirs: set[str]) -> str:
+    """파일을 포함하는 가장 가까운 빌드 모듈 디렉터리 (루트는 ".")."""
+    for parent in PurePosixPath(rel).parents:
+        key = parent.as_posix()
+        if key in module_dirs:
+            return key
+    return "."
+
+
+def _project_name(config_texts: list[tuple[str, str]], root: Path) -> str:
+    for rel, text in sorted(config_texts, key=lambda x: (len(PurePosixPath(x[0]).parts), x[0])):
+        name = PurePosixPath(rel).name
+        if name.startswith("settings.gradle"):
+            m = re.search(r"rootProject\.name\s*=\s*[\"']([^\"']+)", text)
+        elif name == "pom.xml":
+            m = re.search(r"<artifactId>\s*([^<\s]+)\s*</artifactId>", re.sub(r"<parent>.*?</parent>", "", text, flags=re.S))
+        else:
+            continue
+        if m:
+            return m.group(1)
+    return root.name
+
+
+def _external_systems(config_texts: list[tuple[str, str]], root: Path) -> list[tuple[str, str, tuple[str, ...]]]:
+    """빌드 파일 의존성(테스트 범위 제외)과 compose 이미지에서 외부 시스템을 찾는다."""
+    from stack_agent.build_parsers import parse_build_files
+
+    info = parse_build_files([(root / rel, text) for rel, text in config_texts], root)
+    found: dict[str, tuple[str, str, tuple[str, ...]]] = {}
+    for d in info.dependencies:
+        if d.scope == "test":
+            continue
+        coord = f"{d.group or ''}:{d.name}".lower()
+        for rx, name, kind, prefixes in EXTERNAL_SYSTEMS:
+            if rx.search(coord) and name not in found:
+                found[name] = (name, kind, prefixes)
+    order = [name for _, name, _, _ in EXTERNAL_SYSTEMS]
+    return sorted(found.values(), key=lambda x: order.index(x[0]))
+
+
+def _node_name(module: str, layer: str, multi_module: bool) -> str:
+    return f"{module} / {layer}" if multi_module else layer
+
+
+def _architecture_style(
+    headers: list[JavaHeader], layers: set[str], modules: dict[str, str], apps_per_module: Counter
+) -> str | None:
+    segments = {seg for h in headers for seg in h.package.split(".")}
+    if sum(1 for n in apps_per_module.values() if n) >= 2:
+        return "Microservice"
+    if {"port", "ports"} & segments and {"adapter", "adapters"} & segments:
+        return "Hexagonal"
+    if len(layers & {"Presentation", "Service", "Repository"}) >= 2:
+        return "Layered (multi-module)" if len(set(modules.values())) > 1 else "Layered"
+    return None
+
+
+def _mermaid_label(text: str) -> str:
+    return text.replace('"', "'")
+
+
+def analyze_architecture(
+    java_texts: list[tuple[str, str]],
+    config_texts: list[tuple[str, str]],
+    root: Path,
+) -> ExtractedArchitecture:
+    """
+    java_texts / config_texts: (레포 기준 상대 경로, 본문). 테스트 소스(src/test*)는 제외한다.
+    summary는 결정적인 한 문단으로 채우며, hybrid 모드에서 LLM 서술로 교체된다.
+    """
+    module_dirs = {
+        PurePosixPath(rel).parent.as_posix() for rel, _ in config_texts
+        if PurePosixPath(rel).name in _MODULE_BUILD_FILES
+    }
+    headers: list[JavaHeader] = []
+    for rel, text in sorted(java_texts):
+        if is_test_source(rel):
+            continue
+        h = parse_java_header(rel, text)
+        if h is not None:
+            headers.append(h)
+
+    by_fqn = {h.fqn: h for h in headers}
+    by_package: dict[str, list[JavaHeader]] = defaultdict(list)
+    for h in headers:
+        by_package[h.package].append(h)
+
+    modules = {h.fqn: _module_of(h.path, module_dirs) for h in headers}
+    multi_module = len(set(modules.values())) > 1
+    layer_of = {h.fqn: classify_layer(h) for h in headers}
+    node_of = {fqn: (modules[fqn], layer_of[fqn]) for fqn in by_fqn}
+
+    externals = _external_systems(config_texts, root)
+
+    def resolve(name: str, star: bool) -> list[JavaHeader]:
+        if star and name in by_package:
+            return by_package[name]
+        parts = name.split(".")
+        while len(parts) >= 2:   # 중첩 클래스 / static import 멤버는 바깥 타입으로
+            hit = by_fqn.get(".".join(parts))
+            if hit is not None:
+                return [hit]
+            parts.pop()
+        return []
+
+    edges: Counter = Counter()
+    examples: dict[tuple, tuple[str, str]] = {}
+    uses: set[tuple[tuple[str, str], str]] = set()
+    for h in headers:
+        src = node_of[h.fqn]
+        for name, star in h.imports:
+            targets = resolve(name, star)
+            for dst in {node_of[t.fqn] for t in targets} - {src}:
+                edges[(src, dst)] += 1
+                example = next(t.name for t in targets if node_of[t.fqn] == dst)
+                examples.setdefault((src, dst), (h.name, example))
+            if not targets:
+                for ext_name, _, prefixes in externals:
+                    if any(name == p or name.startswith(p + ".") for p in prefixes):
+                        uses.add((src, ext_name))
+
+    nodes = sorted(
+        set(node_of.values()),
+        key=lambda n: (n[0] != ".", n[0], LAYER_ORDER.index(n[1])),
+    )
+    members: dict[tuple[str, str], list[JavaHeader]] = defaultdict(list)
+    for h in headers:
+        members[node_of[h.fqn]].append(h)
+
+    layers: list[LayerModel] = []
+    for node in nodes:
+        classes = members[node]
+        packages = Counter(h.package for h in classes)
+        top = ", ".join(p or "(default)" for p, _ in packages.most_common(3))
+        more = f" (+{len(packages) - 3})" if len(packages) > 3 else ""
+        names = sorted({h.name for h in classes})
+        components = names[:_MAX_COMPONENTS]
+        if len(names) > _MAX_COMPONENTS:
+            components.append(f"… (+{len(names) - _MAX_COMPONENTS} more)")
+        layers.append(LayerModel(
+            name=_node_name(*node, multi_module),
+            description=f"{len(classes)} class{'es' if len(classes) != 1 else ''} — packages: {top}{more}",
+            components=components,
+        ))
+
+    dependencies = [
+        DependencyModel(
+            source=_node_name(*src, multi_module),
+            target=_node_name(*dst, multi_module),
+            description=f"{n} import(s), e.g. {examples[(src, dst)][0]} → {examples[(src, dst)][1]}",
+        )
+        for (src, dst), n in sorted(
+            edges.items(), key=lambda kv: (nodes.index(kv[0][0]), nodes.index(kv[0][1]))
+        )
+    ]
+    external_systems: list[ExternalSystemModel] = []
+    for name, kind, _ in externals:
+        users = [_node_name(*n, multi_module) for n in nodes if (n, name) in uses]
+        external_systems.append(ExternalSystemModel(
+            name=name, type=kind,
+            description=f"used by {', '.join(users)}" if users else "declared in build files",
+        ))
+
+    apps = Counter(modules[h.fqn] for h in headers if "SpringBootApplication" in h.stereotypes)
+    style = _architecture_style(headers, {n[1] for n in nodes}, modules, apps)
+    project = _project_name(config_texts, root)
+
+    summary_parts = [f"{project}: {len(headers)} classes"]
+    if multi_module:
+        summary_parts[0] += f" in {len(set(modules.values()))} modules"
+    if style:
+        summary_parts.append(f"{style} architecture")
+    main_layers = [l for l in LAYER_ORDER if l in {n[1] for n in nodes} and l not in ("Configuration", "Common", "Other")]
+    if main_layers:
+        summary_parts.append(" → ".join(main_layers))
+    if externals:
+        summary_parts.append("external systems: " + ", ".join(name for name, _, _ in externals))
+
+    return ExtractedArchitecture(
+        project_name=project,
+        architecture_style=style,
+        summary="; ".join(summary_parts) + ".",
+        layers=layers,
+        dependencies=dependencies,
+        external_systems=external_systems,
+        mermaid_diagram=to_mermaid(nodes, edges, externals, uses, multi_module, members),
+    )
+
+
+def to_mermaid(
+    nodes: list[tuple[str, str]],
+    edges: Counter,
+    externals: list[tuple[str, str, tuple[str, ...]]],
+    uses: set[tuple[tuple[str, str], str]],
+    multi_module: bool,
+    members: dict[tuple[str, str], list[JavaHeader]],
+) -> str:
+    """노드(모듈·레이어) → import 개수 라벨 간선, 외부 시스템은 DB/캐시는 원통, 나머지는 둥근 상자."""
+    ids = {node: f"N{i}" for i, node in enumerate(nodes)}
+    lines = ["graph TD"]
+
+    def node_line(node: tuple[str, str], indent: str) -> str:
+        return f'{indent}{ids[node]}["{_mermaid_label(node[1])} ({len(members[node])})"]'
+
+    if multi_module:
+        for mi, module in enumerate(dict.fromkeys(n[0] for n in nodes)):
+            lines.append(f'  subgraph M{mi}["{_mermaid_label(module)}"]')
+            lines.extend(node_line(n, "    ") for n in nodes if n[0] == module)
+            lines.append("  end")
+    else:
+        lines.extend(node_line(n, "  ") for n in nodes)
+
+    ext_ids = {name: f"X{i}" for i, (name, _, _) in enumerate(externals)}
+    for name, kind, _ in externals:
+        shape = ('[("', '")]') if kind in ("database", "cache") else ('(["', '"])')
+        lines.append(f"  {ext_ids[name]}{shape[0]}{_mermaid_label(name)}{shape[1]}")
+
+    for (src, dst), n in sorted(edges.items(), key=lambda kv: (nodes.index(kv[0][0]), nodes.index(kv[0][1]))):
+        lines.append(f"  {ids[src]} -->|{n}| {ids[dst]}")
+    for node in nodes:
+        for name, _, _ in externals:
+            if (node, name) in uses:
+                lines.append(f"  {ids[node]} --> {ext_ids[name]}")
+    return "\n".join(lines)
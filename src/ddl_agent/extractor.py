@@ -1,10 +1,9 @@
 """LLM 기반 DDL 추출기."""
 from __future__ import annotations
-import json
 from pathlib import Path
 
-from erd_agent.config import settings
-from erd_agent.llm.aoai_client import build_aoai_client
+from erd_agent.llm.chat import chat_json
+from erd_agent.llm.dispatch import map_concurrent
 from ddl_agent.models import ExtractedDDL
 
 SYSTEM_PROMPT = """You are a senior DBA and data modeler.
@@ -98,20 +97,7 @@ def _make_files_blob(chunk: list[tuple[Path, str]]) -> str:
 
 
 def _call_llm(files_blob: str) -> ExtractedDDL:
-    client = build_aoai_client()
-    if client is None:
-        raise RuntimeError("Azure OpenAI 설정이 없습니다.")
-
-    resp = client.chat.completions.create(
-        model=settings.azure_openai_deployment,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": USER_PROMPT_TEMPLATE.format(files_blob=files_blob)},
-        ],
-        response_format={"type": "json_object"},
-        temperature=0,
-    )
-    data = json.loads(resp.choices[0].message.content)
+    data = chat_json(SYSTEM_PROMPT, USER_PROMPT_TEMPLATE.format(files_blob=files_blob))
     return ExtractedDDL.model_validate(data)
 
 
@@ -126,7 +112,7 @@ def _merge_ddls(chunks: list[ExtractedDDL]) -> ExtractedDDL:
     return ExtractedDDL.model_validate({"dialect": dialect, "tables": list(tables.values())})
 
 
-def ai_extract_ddl(file_texts: list[tuple[Path, str]]) -> ExtractedDDL:
+def ai_extract_ddl(file_texts: list[tuple[Path, str]], max_in_flight: int | None = None) -> ExtractedDDL:
     chunks = _chunk_files(file_texts)
-    extracted = [_call_llm(_make_files_blob(ch)) for ch in chunks]
+    extracted = map_concurrent(_call_llm, [_make_files_blob(ch) for ch in chunks], max_in_flight)
     return _merge_ddls(extracted)
@@ -3,6 +3,10 @@ from __future__ import annotations
 from pydantic import BaseModel, Field
 from typing import Optional
 
+DIALECTS = ("mysql", "postgresql", "h2")
+
+DIALECT_ALIASES = {"postgres": "postgresql", "pg": "postgresql", "mariadb": "mysql"}
+
 
 class DDLColumnModel(BaseModel):
     name: str
@@ -1,64 +1,96 @@
-"""DDL 문서 생성: JPA Entity 스캔 → LLM 분석 → SQL 출력."""
+"""DDL 문서 생성: JPA Entity 스캔 → 정적 스키마(기본) 또는 LLM 분석 → SQL 출력."""
 from __future__ import annotations
 from pathlib import Path
 
 from rich.console import Console
 
 from erd_agent.config import settings
-from erd_agent.repo import prepare_repo
+from erd_agent.normalize import normalize_schema
+from erd_agent.repo_index import RepoIndex, scoped_repo_index
 from erd_agent.scanner import (
-    scan_repo,
     find_enum_type_names_in_entity_text,
-    find_enum_definition_files,
     find_embedded_id_type_names_in_entity_text,
-    find_embeddable_definition_files,
 )
 from ddl_agent.extractor import ai_extract_ddl
+from ddl_agent.static_extractor import (
+    DIALECT_HINT_FILES,
+    detect_dialect,
+    drop_unresolved_refs,
+    mark_join_table_keys,
+    normalize_dialect,
+    schema_to_ddl,
+)
 from ddl_agent.writer import write_ddl
 
 console = Console()
 
 
-def _load(p: Path) -> str:
-    return p.read_text(encoding="utf-8", errors="ignore")
+def _resolve_dialect(index: RepoIndex, dialect: str | None) -> str:
+    dialect = (dialect or settings.ddl_dialect).lower()
+    if dialect != "auto":
+        return normalize_dialect(dialect)
+    hints = [f for f in index.build_files if f.name in DIALECT_HINT_FILES]
+    return detect_dialect(index.read_text(f) for f in hints)
 
 
 def run_ddl(
-    repo: str,
+    repo: str | RepoIndex,
     out_dir: Path | None = None,
     out_file: str = "schema.sql",
+    mode: str | None = None,
+    dialect: str | None = None,
 ) -> Path:
-    repo_path = prepare_repo(repo)
-    base = out_dir or settings.doc_output_dir / "ddl"
-    base.mkdir(parents=True, exist_ok=True)
-    out_path = base / out_file
+    """
+    mode: static(정적 스키마 → DDL, LLM 호출 없음) / ai(엔티티 소스 LLM 분석) — 기본: settings.ddl_extract_mode
+    dialect: mysql / postgresql / h2 / auto — 기본: settings.ddl_dialect (static 모드에서만 사용)
+    """
+    with scoped_repo_index(repo) as index:
+        repo_path = index.root
+        base = out_dir or settings.doc_output_dir / "ddl"
+        base.mkdir(parents=True, exist_ok=True)
+        out_path = base / out_file
+        mode = (mode or settings.ddl_extract_mode).lower()
 
-    console.print(f"[bold]Repo:[/bold] {repo_path}")
+        console.print(f"[bold]Repo:[/bold] {repo_path}")
 
-    entity_files = scan_repo(repo_path)
-    console.print(f"Found [green]{len(entity_files)}[/green] JPA entity candidates")
+        entity_files = index.entity_files
+        console.print(f"Found [green]{len(entity_files)}[/green] JPA entity candidates")
 
-    if not entity_files:
-        out_path.write_text("-- No JPA entities found.\n", encoding="utf-8")
-        console.print(f"[bold green]DDL:[/bold green] {out_path}")
-        return out_path
+        if not entity_files:
+            out_path.write_text("-- No JPA entities found.\n", encoding="utf-8")
+            console.print(f"[bold green]DDL:[/bold green] {out_path}")
+            return out_path
 
-    entity_texts = [(f.relative_to(repo_path), _load(f)) for f in entity_files]
+        if mode != "ai":
+            from erd_agent.parsers.jpa_java import parse_entities
+            schema = parse_entities([(f, index.read_text(f)) for f in entity_files])
+            mark_join_table_keys(schema)
+            dropped = drop_unresolved_refs(schema)
+            if dropped:
+                console.print(f"[yellow]FK skipped — not a scanned entity: {', '.join(dropped)}[/yellow]")
+            normalize_schema(schema)
+            ddl = schema_to_ddl(schema, _resolve_dialect(index, dialect))
+            console.print(f"Static DDL: [green]{len(ddl.tables)}[/green] tables (dialect: {ddl.dialect})")
+            write_ddl(ddl, out_path)
+            console.print(f"[bold green]DDL:[/bold green] {out_path}")
+            return out_path
 
-    enum_names: set[str] = set()
-    embedded_id_names: set[str] = set()
-    for _, txt in entity_texts:
-        enum_names |= find_enum_type_names_in_entity_text(txt)
-        embedded_id_names |= find_embedded_id_type_names_in_entity_text(txt)
+        entity_texts = [(f.relative_to(repo_path), index.read_text(f)) for f in entity_files]
 
-    enum_files = find_enum_definition_files(repo_path, enum_names)
-    embeddable_files = find_embeddable_definition_files(repo_path, embedded_id_names)
-    enum_texts = [(f.relative_to(repo_path), _load(f)) for f in enum_files]
-    embeddable_texts = [(f.relative_to(repo_path), _load(f)) for f in embeddable_files]
+        enum_names: set[str] = set()
+        embedded_id_names: set[str] = set()
+        for _, txt in entity_texts:
+            enum_names |= find_enum_type_names_in_entity_text(txt)
+            embedded_id_names |= find_embedded_id_type_names_in_entity_text(txt)
 
-    all_inputs = [(repo_path / p, txt) for p, txt in entity_texts + enum_texts + embeddable_texts]
+        enum_files = index.find_enum_definition_files(enum_names)
+        embeddable_files = index.find_embeddable_definition_files(embedded_id_names)
+        enum_texts = [(f.relative_to(repo_path), index.read_text(f)) for f in enum_files]
+        embeddable_texts = [(f.relative_to(repo_path), index.read_text(f)) for f in embeddable_files]
 
-    ddl = ai_extract_ddl(all_inputs)
-    write_ddl(ddl, out_path)
-    console.print(f"[bold green]DDL:[/bold green] {out_path}")
-    return out_path
+        all_inputs = [(repo_path / p, txt) for p, txt in entity_texts + enum_texts + embeddable_texts]
+
+        ddl = ai_extract_ddl(all_inputs)
+        write_ddl(ddl, out_path)
+        console.print(f"[bold green]DDL:[/bold green] {out_path}")
+        return out_path
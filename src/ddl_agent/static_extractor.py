@@ -0,0 +1,199 @@
+"""
+정적 DDL 추출기: erd_agent.model.Schema → ExtractedDDL (LLM 불필요).
+
+정적 ERD와 같은 파서(parse_entities + normalize_schema)로 만든 스키마를 dialect별 컬럼 타입,
+PK/UNIQUE 제약, Schema.refs 기반 FK 제약으로 옮긴다 (FK 대상은 엔티티 클래스 → @Table 이름으로 해석된 값,
+파싱된 엔티티가 아닌 대상은 drop_unresolved_refs로 제외). SQL 문자열은 writer.to_sql이 만든다.
+dialect는 설정(DDL_DIALECT)이 auto면 빌드/설정 파일의 JDBC URL·드라이버 의존성으로 감지한다.
+"""
+from __future__ import annotations
+import hashlib
+import re
+from typing import Iterable
+
+from erd_agent.model import Schema
+from ddl_agent.models import (
+    DIALECT_ALIASES,
+    DIALECTS,
+    DDLColumnModel,
+    DDLConstraintModel,
+    DDLTableModel,
+    ExtractedDDL,
+)
+
+# dialect 감지에 읽는 파일 (RepoIndex.build_files 중 이름이 일치하는 것)
+DIALECT_HINT_FILES = {
+    "application.yml", "application.yaml", "application.properties",
+    "application-dev.yml", "application-prod.yml",
+    "pom.xml", "build.gradle", "build.gradle.kts",
+}
+
+_JDBC_URL_RE = re.compile(r"jdbc:(mysql|mariadb|postgresql|h2):", re.IGNORECASE)
+
+# 드라이버 의존성 → dialect (H2는 테스트용으로 같이 있는 경우가 많아 마지막에 본다)
+_DRIVER_HINTS = (
+    ("postgresql", re.compile(r"org\.postgresql|<artifactId>postgresql</artifactId>")),
+    ("mysql", re.compile(r"mysql-connector|mariadb-java-client")),
+    ("h2", re.compile(r"com\.h2database")),
+)
+
+# Schema.db_type → dialect별 SQL 타입 (varchar(N)은 길이 유지)
+TYPE_MAP = {
+    "mysql": {
+        "varchar": "VARCHAR(255)", "int": "INT", "bigint": "BIGINT", "boolean": "TINYINT(1)",
+        "date": "DATE", "timestamp": "DATETIME(6)", "datetime": "DATETIME(6)",
+        "decimal": "DECIMAL(19,2)", "uuid": "BINARY(16)",
+    },
+    "postgresql": {
+        "varchar": "VARCHAR(255)", "int": "INTEGER", "bigint": "BIGINT", "boolean": "BOOLEAN",
+        "date": "DATE", "timestamp": "TIMESTAMP(6)", "datetime": "TIMESTAMP(6)",
+        "decimal": "NUMERIC(19,2)", "uuid": "UUID",
+    },
+    "h2": {
+        "varchar": "VARCHAR(255)", "int": "INTEGER", "bigint": "BIGINT", "boolean": "BOOLEAN",
+        "date": "DATE", "timestamp": "TIMESTAMP(6)", "datetime": "TIMESTAMP(6)",
+        "decimal": "NUMERIC(19,2)", "uuid": "UUID",
+    },
+}
+
+# 제약 이름 최대 길이 (PostgreSQL 63, MySQL 64)
+_MAX_IDENT = 60
+
+
+def normalize_dialect(dialect: str | None) -> str:
+    d = (dialect or "mysql").lower()
+    d = DIALECT_ALIASES.get(d, d)
+    return d if d in DIALECTS else "mysql"
+
+
+def detect_dialect(texts: Iterable[str]) -> str:
+    """
+    설정/빌드 파일 본문에서 dialect를 추정한다.
+    JDBC URL이 있으면 그것을 우선하고, 없으면 드라이버 의존성, 둘 다 없으면 mysql.
+    """
+    texts = list(texts)
+    for text in texts:
+        m = _JDBC_URL_RE.search(text)
+        if m:
+            return normalize_dialect(m.group(1))
+    for dialect, rx in _DRIVER_HINTS:
+        if any(rx.search(t) for t in texts):
+            return dialect
+    return "mysql"
+
+
+def sql_type(db_type: str, dialect: str) -> str:
+    t = db_type.strip().lower()
+    m = re.fullmatch(r"varchar\((\d+)\)", t)
+    if m:
+        return f"VARCHAR({m.group(1)})"
+    return TYPE_MAP[dialect].get(t, db_type.upper())
+
+
+def _ident(name: str) -> str:
+    name = re.sub(r"\W", "_", name)
+    if len(name) <= _MAX_IDENT:
+        return name
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+    return f"{name[:_MAX_IDENT - 9]}_{digest}"
+
+
+def _split_table(name: str) -> tuple[str | None, str]:
+    schema_name, _, table = name.rpartition(".")
+    return schema_name or None, table
+
+
+def mark_join_table_keys(schema: Schema) -> None:
+    """
+    PK가 없고 모든 컬럼이 FK인 테이블(@JoinTable 조인 테이블)은 FK 컬럼들을 복합 PK로 지정한다.
+    normalize_schema 전에 호출해야 placeholder id PK가 붙지 않는다.
+    """
+    fk_cols: dict[str, set[str]] = {}
+    for r in schema.refs:
+        fk_cols.setdefault(r.child_table, set()).add(r.child_column)
+    for name, table in schema.tables.items():
+        cols = table.columns.values()
+        if len(table.columns) >= 2 and not any(c.pk for c in cols) and set(table.columns) <= fk_cols.get(name, set()):
+            for c in cols:
+                c.pk = True
+                c.nullable = False
+
+
+def drop_unresolved_refs(schema: Schema) -> list[str]:
+    """
+    부모 테이블이 파싱된 엔티티가 아닌 Ref를 뺀다 (normalize_schema 전에 호출).
+    ERD는 placeholder 테이블로 관계를 보여 주지만, DDL에 지어낸 CREATE TABLE을 넣을 수는 없다.
+    FK 컬럼은 남고 제약만 생략된다. 뺀 부모 테이블 이름을 반환한다.
+    """
+    dropped = sorted({r.parent_table for r in schema.refs if r.parent_table not in schema.tables})
+    schema.refs = [r for r in schema.refs if r.parent_table in schema.tables]
+    return dropped
+
+
+def schema_to_ddl(schema: Schema, dialect: str = "mysql") -> ExtractedDDL:
+    """
+    정적 스키마를 DDL 모델로 변환한다 (normalize_schema 이후 호출).
+    FK는 자식/부모 컬럼이 모두 있는 Ref만 만들고, 같은 (자식 컬럼 → 부모 컬럼) 관계는 한 번만.
+    """
+    dialect = normalize_dialect(dialect)
+    tables: list[DDLTableModel] = []
+    by_name: dict[str, DDLTableModel] = {}
+
+    for tname in sorted(schema.tables):
+        table = schema.tables[tname]
+        schema_name, name = _split_table(tname)
+        cols = sorted(table.columns.values(), key=lambda c: not c.pk)  # PK 먼저, 나머지는 선언 순서
+        pk_cols = [c.name for c in cols if c.pk]
+        ddl_table = DDLTableModel(
+            name=name,
+            schema_name=schema_name,
+            columns=[
+                DDLColumnModel(
+                    name=c.name,
+                    type=sql_type(c.db_type, dialect),
+                    pk=c.pk,
+                    nullable=c.nullable and not c.pk,
+                    unique=c.unique and not (c.pk and len(pk_cols) == 1),
+                    auto_increment=c.increment and c.db_type in ("int", "bigint"),
+                    default=c.default,
+                    comment=c.note,
+                )
+                for c in cols
+            ],
+            comment=table.note,
+        )
+        if pk_cols:
+            ddl_table.constraints.append(
+                DDLConstraintModel(name=_ident(f"pk_{name}"), type="PRIMARY KEY", columns=pk_cols)
+            )
+        tables.append(ddl_table)
+        by_name[tname] = ddl_table
+
+    seen: set[tuple[str, str, str, str]] = set()
+    fk_names: set[str] = set()
+    for r in schema.refs:
+        child = schema.tables.get(r.child_table)
+        parent = schema.tables.get(r.parent_table)
+        if child is None or parent is None:
+            continue
+        if r.child_column not in child.columns or r.parent_column not in parent.columns:
+            continue
+        key = (r.child_table, r.child_column, r.parent_table, r.parent_column)
+        if key in seen:
+            continue
+        seen.add(key)
+        fk_name = _ident(f"fk_{_split_table(r.child_table)[1]}_{r.child_column}")
+        if fk_name in fk_names:  # 같은 컬럼이 여러 부모를 참조
+            fk_name = _ident(f"{fk_name}_{_split_table(r.parent_table)[1]}")
+        fk_names.add(fk_name)
+        by_name[r.child_table].constraints.append(
+            DDLConstraintModel(
+                name=fk_name,
+                type="FOREIGN KEY",
+                columns=[r.child_column],
+                ref_table=r.parent_table,
+                ref_columns=[r.parent_column],
+            )
+        )
+
+    return ExtractedDDL(dialect=dialect, tables=tables)
@@ -1,24 +1,80 @@
 """DDL 분석 결과 → SQL 파일 생성."""
 from __future__ import annotations
 from pathlib import Path
-from ddl_agent.models import ExtractedDDL
+import re
+from ddl_agent.models import DIALECT_ALIASES, ExtractedDDL
+
+# MySQL / PostgreSQL / H2 예약어 중 테이블·컬럼 이름으로 자주 쓰이는 것 (식별자로 쓰면 따옴표 필요)
+RESERVED_WORDS = frozenset("""
+    add all alter analyse analyze and any array as asc asymmetric authorization between bigint binary both by
+    call case cast change char character check collate column condition constraint create cross current_date
+    current_time current_timestamp current_user cursor database databases day decimal declare default delete
+    desc describe distinct div do double drop each else elseif end except exists explain false fetch float for
+    force foreign from full fulltext function generated grant group groups having hour if ignore ilike in index
+    inner insert int integer intersect interval into is iterate join key keys kill lateral leading leave left like
+    limit lines load localtime localtimestamp lock long loop match minus minute mod month natural not null numeric
+    of offset on only optimize option or order outer over partition placing precision primary procedure qualify
+    range rank read real references regexp release rename repeat replace require restrict return returning revoke
+    right rlike row rownum rows schema schemas second select session_user show similar some sql stored
+    straight_join system table tablesample then to top trailing trigger true union unique unlock unsigned update
+    usage use user using value values varchar varying verbose virtual when where while window with write year
+""".split())
+
+_PLAIN_IDENT_RE = re.compile(r"[a-z_][a-z0-9_]*")
+
+
+def _quote(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+def quote_ident(name: str, dialect: str) -> str:
+    """
+    예약어이거나 소문자·숫자·_ 외 문자가 있는 식별자만 dialect별로 감싼다 (MySQL `x`, 그 외 "x").
+    schema.table 형태는 부분마다 판단한다.
+    """
+    parts = []
+    for part in name.split("."):
+        if part.lower() in RESERVED_WORDS or not _PLAIN_IDENT_RE.fullmatch(part):
+            q = "`" if dialect == "mysql" else '"'
+            part = f"{q}{part.replace(q, q * 2)}{q}"
+        parts.append(part)
+    return ".".join(parts)
 
 
 def to_sql(ddl: ExtractedDDL) -> str:
+    """
+    CREATE TABLE 문을 먼저 모두 쓰고 FK는 마지막에 ALTER TABLE로 추가한다
+    (테이블 생성 순서와 무관하게 실행 가능).
+    - 자동 증가: MySQL AUTO_INCREMENT / PostgreSQL SERIAL·BIGSERIAL / H2 IDENTITY
+    - 주석: MySQL은 인라인 COMMENT, 그 외는 COMMENT ON
+    - 식별자: 예약어(user, order ...)나 특수 문자가 있으면 quote_ident로 감싼다
+    """
+    dialect = DIALECT_ALIASES.get(ddl.dialect.lower(), ddl.dialect.lower())
+
+    def q(name: str) -> str:
+        return quote_ident(name, dialect)
+
+    def cols(names: list[str]) -> str:
+        return ", ".join(q(c) for c in names)
+
     lines: list[str] = []
     lines.append(f"-- DDL generated by ddl-agent (dialect: {ddl.dialect})")
     lines.append("")
 
+    foreign_keys: list[str] = []
     for table in ddl.tables:
-        tname = f"{table.schema_name}.{table.name}" if table.schema_name else table.name
+        tname = q(f"{table.schema_name}.{table.name}" if table.schema_name else table.name)
         lines.append(f"CREATE TABLE {tname} (")
 
         col_defs: list[str] = []
+        comments: list[str] = []
         for col in table.columns:
-            parts = [f"  {col.name}", col.type]
+            parts = [f"  {q(col.name)}", col.type]
             if col.auto_increment:
-                if ddl.dialect in ("postgresql", "postgres"):
+                if dialect == "postgresql":
                     parts[1] = "SERIAL" if col.type.upper() in ("INT", "INTEGER") else "BIGSERIAL"
+                elif dialect == "h2":
+                    parts.append("GENERATED BY DEFAULT AS IDENTITY")
                 else:
                     parts.append("AUTO_INCREMENT")
             if not col.nullable:
@@ -28,26 +84,36 @@ def to_sql(ddl: ExtractedDDL) -> str:
             if col.default is not None:
                 parts.append(f"DEFAULT {col.default}")
             if col.comment:
-                parts.append(f"COMMENT '{col.comment}'")
+                if dialect == "mysql":
+                    parts.append(f"COMMENT {_quote(col.comment)}")
+                else:
+                    comments.append(f"COMMENT ON COLUMN {tname}.{q(col.name)} IS {_quote(col.comment)};")
             col_defs.append(" ".join(parts))
 
         for cst in table.constraints:
             if cst.type == "PRIMARY KEY":
-                col_defs.append(f"  CONSTRAINT {cst.name} PRIMARY KEY ({', '.join(cst.columns)})")
+                col_defs.append(f"  CONSTRAINT {q(cst.name)} PRIMARY KEY ({cols(cst.columns)})")
             elif cst.type == "FOREIGN KEY" and cst.ref_table:
-                col_defs.append(
-                    f"  CONSTRAINT {cst.name} FOREIGN KEY ({', '.join(cst.columns)}) "
-                    f"REFERENCES {cst.ref_table} ({', '.join(cst.ref_columns)})"
+                foreign_keys.append(
+                    f"ALTER TABLE {tname} ADD CONSTRAINT {q(cst.name)} FOREIGN KEY ({cols(cst.columns)}) "
+                    f"REFERENCES {q(cst.ref_table)} ({cols(cst.ref_columns)});"
                 )
             elif cst.type == "UNIQUE":
-                col_defs.append(f"  CONSTRAINT {cst.name} UNIQUE ({', '.join(cst.columns)})")
+                col_defs.append(f"  CONSTRAINT {q(cst.name)} UNIQUE ({cols(cst.columns)})")
 
         lines.append(",\n".join(col_defs))
-        lines.append(");")
+        if table.comment and dialect == "mysql":
+            lines.append(f") COMMENT={_quote(table.comment)};")
+        else:
+            lines.append(");")
+            if table.comment:
+                comments.insert(0, f"COMMENT ON TABLE {tname} IS {_quote(table.comment)};")
+        lines.extend(comments)
 
-        if table.comment and ddl.dialect in ("postgresql", "postgres"):
-            lines.append(f"COMMENT ON TABLE {tname} IS '{table.comment}';")
+        lines.append("")
 
+    if foreign_keys:
+        lines.extend(foreign_keys)
         lines.append("")
 
     return "\n".join(lines)
@@ -12,6 +12,8 @@ from rich.console import Console
 
 from erd_agent.config import settings
 from erd_agent.commands import erd as cmd_erd
+from erd_agent.llm.response_cache import response_cache_stats
+from erd_agent.repo_index import open_repo_index
 from api_agent import run_api
 from arch_agent import run_arch
 from ddl_agent import run_ddl
@@ -19,6 +21,13 @@ from stack_agent import run_stack
 
 console = Console()
 
+def _print_cache_stats() -> None:
+    """여러 문서를 한 번에 만든 뒤 LLM 응답 캐시 적중/미스 수 출력 (캐시를 끄면 생략)."""
+    stats = response_cache_stats()
+    if stats is not None and (stats["hits"] or stats["misses"]):
+        console.print(f"LLM response cache: [green]{stats['hits']}[/green] hits / {stats['misses']} misses")
+
+
 # ----- ai-agent: 플래그로 생성할 문서 선택 (--erd --api ...) -----
 ai_agent = typer.Typer(
     name="ai-agent",
@@ -37,6 +46,7 @@ def ai_main(
     stack: bool = typer.Option(False, "--stack", "-s", help="기술 스택 문서 생성"),
     use_aoai: bool = typer.Option(False, help="(ERD) 정적 모드 시 Azure OpenAI 스키마 보정"),
     ai_first: bool = typer.Option(False, help="(ERD) AI-first 모드로 전체 분석"),
+    ref: str | None = typer.Option(None, "--ref", help="브랜치/태그/커밋 SHA (Git URL 전용, 기본: 기본 브랜치)"),
 ):
     """지정한 옵션만큼만 문서 생성. 옵션 없으면 전체 생성."""
     base = settings.doc_output_dir
@@ -45,23 +55,27 @@ def ai_main(
         erd = api = arch = ddl = stack = True
         console.print("[bold]No options given → generating all docs.[/bold]")
 
-    if erd:
-        cmd_erd.run_erd(
-            repo,
-            out_dir=base / "erd",
-            use_aoai=use_aoai,
-            ai_first=ai_first,
-        )
-    if api:
-        run_api(repo, out_dir=base / "api")
-    if arch:
-        run_arch(repo, out_dir=base / "arch")
-    if ddl:
-        run_ddl(repo, out_dir=base / "ddl")
-    if stack:
-        run_stack(repo, out_dir=base / "stack")
+    # 레포를 한 번만 스캔해 모든 에이전트가 공유 (선택한 문서에 필요한 파일만 받음)
+    modes = [m for m, on in (("erd", erd), ("api", api), ("arch", arch), ("ddl", ddl), ("stack", stack)) if on]
+    with open_repo_index(repo, ref=ref, modes=modes) as index:
+        if erd:
+            cmd_erd.run_erd(
+                index,
+                out_dir=base / "erd",
+                use_aoai=use_aoai,
+                ai_first=ai_first,
+            )
+        if api:
+            run_api(index, out_dir=base / "api")
+        if arch:
+            run_arch(index, out_dir=base / "arch")
+        if ddl:
+            run_ddl(index, out_dir=base / "ddl")
+        if stack:
+            run_stack(index, out_dir=base / "stack")
 
     console.print(f"[bold green]Done. Output under[/bold green] {base}")
+    _print_cache_stats()
 
 
 # ----- 통합 앱: doc-agent (서브커맨드) -----
@@ -76,9 +90,14 @@ def _repo_arg() -> str:
     return typer.Argument(..., help="로컬 경로 또는 Git URL")
 
 
+def _ref_opt() -> str | None:
+    return typer.Option(None, "--ref", help="브랜치/태그/커밋 SHA (Git URL 전용, 기본: 기본 브랜치)")
+
+
 @app.command("erd")
 def doc_erd(
     repo: str = _repo_arg(),
+    ref: str | None = _ref_opt(),
     out_dbml: str = typer.Option("database.dbml", help="출력 DBML 파일명"),
     out_md: str = typer.Option("erd_summary.md", help="출력 요약 MD 파일명"),
     use_aoai: bool = typer.Option(False, help="(정적 모드) Azure OpenAI 스키마 보정"),
@@ -86,59 +105,69 @@ def doc_erd(
 ):
     """ERD 문서만 생성 (DBML + 요약 MD)."""
     out_dir = settings.doc_output_dir / "erd"
-    cmd_erd.run_erd(
-        repo,
-        out_dir=out_dir,
-        out_dbml=out_dbml,
-        out_md=out_md,
-        use_aoai=use_aoai,
-        ai_first=ai_first,
-    )
+    with open_repo_index(repo, ref=ref, modes=["erd"]) as index:
+        cmd_erd.run_erd(
+            index,
+            out_dir=out_dir,
+            out_dbml=out_dbml,
+            out_md=out_md,
+            use_aoai=use_aoai,
+            ai_first=ai_first,
+        )
 
 
 @app.command("api")
 def doc_api(
     repo: str = _repo_arg(),
+    ref: str | None = _ref_opt(),
     out_file: str = typer.Option("api_spec.md", help="출력 파일명"),
 ):
     """API 스펙 문서만 생성."""
     out_dir = settings.doc_output_dir / "api"
-    run_api(repo, out_dir=out_dir, out_file=out_file)
+    with open_repo_index(repo, ref=ref, modes=["api"]) as index:
+        run_api(index, out_dir=out_dir, out_file=out_file)
 
 
 @app.command("arch")
 def doc_arch(
     repo: str = _repo_arg(),
+    ref: str | None = _ref_opt(),
     out_file: str = typer.Option("architecture.md", help="출력 파일명"),
 ):
     """아키텍처 다이어그램 문서만 생성."""
     out_dir = settings.doc_output_dir / "arch"
-    run_arch(repo, out_dir=out_dir, out_file=out_file)
+    with open_repo_index(repo, ref=ref, modes=["arch"]) as index:
+        run_arch(index, out_dir=out_dir, out_file=out_file)
 
 
 @app.command("ddl")
 def doc_ddl(
     repo: str = _repo_arg(),
+    ref: str | None = _ref_opt(),
     out_file: str = typer.Option("schema.sql", help="출력 DDL 파일명"),
 ):
     """DDL 문서만 생성."""
     out_dir = settings.doc_output_dir / "ddl"
-    run_ddl(repo, out_dir=out_dir, out_file=out_file)
+    with open_repo_index(repo, ref=ref, modes=["ddl"]) as index:
+        run_ddl(index, out_dir=out_dir, out_file=out_file)
 
 
 @app.command("stack")
 def doc_stack(
     repo: str = _repo_arg(),
+    ref: str | None = _ref_opt(),
     out_file: str = typer.Option("tech_stack.md", help="출력 파일명"),
 ):
     """기술 스택 문서만 생성."""
     out_dir = settings.doc_output_dir / "stack"
-    run_stack(repo, out_dir=out_dir, out_file=out_file)
+    with open_repo_index(repo, ref=ref, modes=["stack"]) as index:
+        run_stack(index, out_dir=out_dir, out_file=out_file)
 
 
 @app.command("all")
 def doc_all(
     repo: str = _repo_arg(),
+    ref: str | None = _ref_opt(),
     out_dbml: str = typer.Option("database.dbml", help="ERD DBML 파일명"),
     out_md: str = typer.Option("erd_summary.md", help="ERD 요약 MD 파일명"),
     use_aoai: bool = typer.Option(False, help="ERD 정적 모드 시 Azure OpenAI 보정"),
@@ -147,12 +176,14 @@ def doc_all(
     """모든 문서 생성: API 스펙, 아키텍처, DDL, ERD, 기술 스택."""
     console.print("[bold]Generating all docs...[/bold]")
     base = settings.doc_output_dir
-    cmd_erd.run_erd(repo, out_dir=base / "erd", out_dbml=out_dbml, out_md=out_md, use_aoai=use_aoai, ai_first=ai_first)
-    run_api(repo, out_dir=base / "api")
-    run_arch(repo, out_dir=base / "arch")
-    run_ddl(repo, out_dir=base / "ddl")
-    run_stack(repo, out_dir=base / "stack")
+    with open_repo_index(repo, ref=ref, modes=["erd", "api", "arch", "ddl", "stack"]) as index:
+        cmd_erd.run_erd(index, out_dir=base / "erd", out_dbml=out_dbml, out_md=out_md, use_aoai=use_aoai, ai_first=ai_first)
+        run_api(index, out_dir=base / "api")
+        run_arch(index, out_dir=base / "arch")
+        run_ddl(index, out_dir=base / "ddl")
+        run_stack(index, out_dir=base / "stack")
     console.print(f"[bold green]All docs written under[/bold green] {base}")
+    _print_cache_stats()
 
 
 # ----- 개별 진입점: erd-agent, api-agent, arch-agent, ddl-agent, stack-agent -----
@@ -163,6 +194,7 @@ erd_app = typer.Typer(add_completion=False)
 @erd_app.callback(invoke_without_command=True)
 def erd_main(
     repo: str = typer.Argument(..., help="로컬 경로 또는 Git URL"),
+    ref: str | None = _ref_opt(),
     out_dbml: str = typer.Option("database.dbml", help="출력 DBML 파일명"),
     out_md: str = typer.Option("erd_summary.md", help="출력 요약 MD 파일명"),
     use_aoai: bool = typer.Option(False, help="(정적 모드) Azure OpenAI 스키마 보정"),
@@ -170,7 +202,8 @@ def erd_main(
 ):
     """ERD만 생성 (erd-agent ./my-project)."""
     out_dir = settings.doc_output_dir / "erd"
-    cmd_erd.run_erd(repo, out_dir=out_dir, out_dbml=out_dbml, out_md=out_md, use_aoai=use_aoai, ai_first=ai_first)
+    with open_repo_index(repo, ref=ref, modes=["erd"]) as index:
+        cmd_erd.run_erd(index, out_dir=out_dir, out_dbml=out_dbml, out_md=out_md, use_aoai=use_aoai, ai_first=ai_first)
 
 
 api_app = typer.Typer(add_completion=False)
@@ -179,10 +212,12 @@ api_app = typer.Typer(add_completion=False)
 @api_app.callback(invoke_without_command=True)
 def api_main(
     repo: str = typer.Argument(..., help="로컬 경로 또는 Git URL"),
+    ref: str | None = _ref_opt(),
     out_file: str = typer.Option("api_spec.md", help="출력 파일명"),
 ):
     """API 스펙 문서만 생성 (api-agent ./my-project)."""
-    run_api(repo, out_file=out_file)
+    with open_repo_index(repo, ref=ref, modes=["api"]) as index:
+        run_api(index, out_file=out_file)
 
 
 arch_app = typer.Typer(add_completion=False)
@@ -191,10 +226,12 @@ arch_app = typer.Typer(add_completion=False)
 @arch_app.callback(invoke_without_command=True)
 def arch_main(
     repo: str = typer.Argument(..., help="로컬 경로 또는 Git URL"),
+    ref: str | None = _ref_opt(),
     out_file: str = typer.Option("architecture.md", help="출력 파일명"),
 ):
     """아키텍처 문서만 생성 (arch-agent ./my-project)."""
-    run_arch(repo, out_file=out_file)
+    with open_repo_index(repo, ref=ref, modes=["arch"]) as index:
+        run_arch(index, out_file=out_file)
 
 
 ddl_app = typer.Typer(add_completion=False)
@@ -203,10 +240,12 @@ ddl_app = typer.Typer(add_completion=False)
 @ddl_app.callback(invoke_without_command=True)
 def ddl_main(
     repo: str = typer.Argument(..., help="로컬 경로 또는 Git URL"),
+    ref: str | None = _ref_opt(),
     out_file: str = typer.Option("schema.sql", help="출력 DDL 파일명"),
 ):
     """DDL 문서만 생성 (ddl-agent ./my-project)."""
-    run_ddl(repo, out_file=out_file)
+    with open_repo_index(repo, ref=ref, modes=["ddl"]) as index:
+        run_ddl(index, out_file=out_file)
 
 
 stack_app = typer.Typer(add_completion=False)
@@ -215,7 +254,9 @@ stack_app = typer.Typer(add_completion=False)
 @stack_app.callback(invoke_without_command=True)
 def stack_main(
     repo: str = typer.Argument(..., help="로컬 경로 또는 Git URL"),
+    ref: str | None = _ref_opt(),
     out_file: str = typer.Option("tech_stack.md", help="출력 파일명"),
 ):
     """기술 스택 문서만 생성 (stack-agent ./my-project)."""
-    run_stack(repo, out_file=out_file)
+    with open_repo_index(repo, ref=ref, modes=["stack"]) as index:
+        run_stack(index, out_file=out_file)
@@ -1,3 +1,4 @@
+import tempfile
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from pathlib import Path
@@ -10,11 +11,94 @@ class Settings(BaseSettings):
     cache_dir: Path = Field(default=Path("./.cache"), alias="CACHE_DIR")
 
     github_token: str | None = Field(default=None, alias="GITHUB_TOKEN")
+    # ref → 커밋 SHA 조회용 GitHub API 주소 (GitHub Enterprise / 테스트용 로컬 서버로 교체 가능)
+    github_api_url: str = Field(default="https://api.github.com", alias="GITHUB_API_URL")
+    # True면 GitHub zip을 풀지 않고 아카이브에서 바로 분석 (디스크/콜드 스타트 절감)
+    repo_archive_mode: bool = Field(default=False, alias="REPO_ARCHIVE_MODE")
+    # 레포 캐시(커밋 SHA별 디렉터리/zip) 전체 용량 상한, 초과 시 오래 안 쓴 항목부터 삭제
+    repo_cache_max_bytes: int = Field(default=2 * 1024 * 1024 * 1024, alias="REPO_CACHE_MAX_BYTES")
+    # 마지막 사용 후 이 시간(초) 안의 캐시 항목은 용량을 넘어도 삭제하지 않음 (분석 중인 항목 보호)
+    repo_cache_evict_grace: float = Field(default=3600.0, alias="REPO_CACHE_EVICT_GRACE")
+    # 모드에 필요한 파일이 이 개수 이하면 GitHub 전체 zip 대신 해당 파일(blob)만 API로 받음 (0이면 항상 zip)
+    repo_selective_max_files: int = Field(default=50, alias="REPO_SELECTIVE_MAX_FILES")
+    # 같은 레포 동시 요청 시 먼저 받는 쪽을 기다리는 최대 시간(초) / 갱신이 멈춘 lock을 회수하는 기준(초)
+    repo_lock_timeout: float = Field(default=600.0, alias="REPO_LOCK_TIMEOUT")
+    repo_lock_stale_after: float = Field(default=60.0, alias="REPO_LOCK_STALE_AFTER")
+
+    # 레포 스캔: .gitignore 준수 여부 / 파일 크기 상한 / 기본 외 추가 제외 디렉터리(쉼표 구분)
+    scan_respect_gitignore: bool = Field(default=True, alias="SCAN_RESPECT_GITIGNORE")
+    scan_max_file_bytes: int = Field(default=5 * 1024 * 1024, alias="SCAN_MAX_FILE_BYTES")
+    scan_extra_skip_dirs: str = Field(default="", alias="SCAN_EXTRA_SKIP_DIRS")
+
+    # 증분 스캔 캐시: 파일별 분류 결과를 SQLite에 저장해 바뀐 파일만 다시 읽음 (경로 기본: 캐시 루트/scan-cache.sqlite3)
+    scan_cache_enabled: bool = Field(default=True, alias="SCAN_CACHE_ENABLED")
+    scan_cache_path: Path | None = Field(default=None, alias="SCAN_CACHE_PATH")
+
+    # 병렬 스캔: 워커 수(0이면 CPU 수, 최대 8) / 병렬로 전환할 최소 파일 수 / 분류에 프로세스 풀 사용 여부(false면 스레드)
+    scan_workers: int = Field(default=0, alias="SCAN_WORKERS")
+    scan_parallel_min_files: int = Field(default=500, alias="SCAN_PARALLEL_MIN_FILES")
+    scan_process_pool: bool = Field(default=True, alias="SCAN_PROCESS_POOL")
+
+    # 정적 ERD: 엔티티 파일이 이 수 이상이면 엔티티 파싱을 프로세스 풀(SCAN_WORKERS)로 분산
+    erd_parallel_min_files: int = Field(default=16, alias="ERD_PARALLEL_MIN_FILES")
+    # 정적 ERD 파싱 결과(파일별 스키마 조각) 캐시 — 본문 해시 + 파서 버전 키, 캐시 루트/parse-cache.sqlite3
+    erd_parse_cache_enabled: bool = Field(default=True, alias="ERD_PARSE_CACHE_ENABLED")
+
+    # API 스펙 추출 방식: static(애너테이션 정적 추출만) / hybrid(정적 추출 + LLM 요약 보강, AOAI 미설정 시 static) / ai(소스 전체 LLM 추출)
+    api_extract_mode: str = Field(default="hybrid", alias="API_EXTRACT_MODE")
+    # DDL 생성 방식: static(정적 스키마 → dialect별 SQL, LLM 호출 없음) / ai(엔티티 소스 LLM 분석)
+    ddl_extract_mode: str = Field(default="static", alias="DDL_EXTRACT_MODE")
+    # 정적 DDL dialect: auto(설정/빌드 파일의 JDBC URL·드라이버로 감지, 없으면 mysql) / mysql / postgresql / h2
+    ddl_dialect: str = Field(default="auto", alias="DDL_DIALECT")
+    # 기술 스택 추출 방식: static(빌드 파일 정적 파싱만) / hybrid(정적 파싱 + 처음 보는 아티팩트만 LLM 설명, AOAI 미설정 시 static) / ai(빌드 파일 전체 LLM 분석)
+    stack_extract_mode: str = Field(default="hybrid", alias="STACK_EXTRACT_MODE")
+    # hybrid: LLM이 설명하지 못한 아티팩트를 다시 묻지 않는 시간(초, 음성 캐시)
+    stack_describe_negative_ttl: float = Field(default=21600.0, alias="STACK_DESCRIBE_NEGATIVE_TTL")
+    # 아키텍처 추출 방식: static(import 그래프·스테레오타입 정적 분석만) / hybrid(정적 그래프 + LLM 요약 서술, AOAI 미설정 시 static) / ai(소스 전체 LLM 분석)
+    arch_extract_mode: str = Field(default="hybrid", alias="ARCH_EXTRACT_MODE")
 
     azure_openai_endpoint: str | None = Field(default=None, alias="AZURE_OPENAI_ENDPOINT")
     azure_openai_api_key: str | None = Field(default=None, alias="AZURE_OPENAI_API_KEY")
     openai_api_version: str = Field(default="2024-06-01", alias="OPENAI_API_VERSION")
     azure_openai_deployment: str | None = Field(default=None, alias="AZURE_OPENAI_DEPLOYMENT")
 
+    # /api/run 에서 동시에 실행할 에이전트 수 (1이면 순차)
+    agent_max_workers: int = Field(default=5, alias="AGENT_MAX_WORKERS")
+
+    # 비동기 job API (/api/jobs): 동시 실행 job 수 / SQLite 저장 경로 (기본: 캐시 디렉터리)
+    job_max_workers: int = Field(default=2, alias="JOB_MAX_WORKERS")
+    job_store_path: Path | None = Field(default=None, alias="JOB_STORE_PATH")
+    # job 저장소: "sqlite"(기본) 또는 JobStore를 반환하는 팩토리 "패키지.모듈:함수" (예: Azure Table 구현)
+    job_store: str = Field(default="sqlite", alias="JOB_STORE")
+    # running인데 이 시간(초) 동안 갱신(heartbeat)이 없으면 호스트 재시작 등으로 중단된 것으로 보고 조회 시 error 처리
+    job_stale_after: float = Field(default=3600.0, alias="JOB_STALE_AFTER")
+
+    # chunk 단위 LLM 호출 동시 실행 수 (1이면 순차)
+    llm_max_concurrency: int = Field(default=4, alias="LLM_MAX_CONCURRENCY")
+
+    # 공유 Azure OpenAI 클라이언트 HTTP 커넥션 풀 / 타임아웃
+    aoai_max_connections: int = Field(default=20, alias="AOAI_MAX_CONNECTIONS")
+    aoai_max_keepalive_connections: int = Field(default=10, alias="AOAI_MAX_KEEPALIVE_CONNECTIONS")
+    aoai_keepalive_expiry: float = Field(default=60.0, alias="AOAI_KEEPALIVE_EXPIRY")
+    aoai_timeout: float = Field(default=300.0, alias="AOAI_TIMEOUT")
+    aoai_connect_timeout: float = Field(default=10.0, alias="AOAI_CONNECT_TIMEOUT")
+    aoai_max_retries: int = Field(default=2, alias="AOAI_MAX_RETRIES")
+
+    # LLM 응답 디스크 캐시 (cache_dir/llm, 용량 초과 시 LRU 삭제)
+    llm_cache_enabled: bool = Field(default=True, alias="LLM_CACHE_ENABLED")
+    llm_cache_max_bytes: int = Field(default=256 * 1024 * 1024, alias="LLM_CACHE_MAX_BYTES")
+
 
 settings = Settings()
+
+
+def writable_cache_root() -> Path:
+    """
+    레포/스캔/파싱/LLM/job 캐시를 두는 디렉터리.
+    Azure Functions Linux에서 /home/site/wwwroot 는 read-only일 수 있으니
+    CACHE_DIR가 상대경로/점(.) 시작이면 /tmp 아래로 강제한다.
+    """
+    raw = str(settings.cache_dir) if settings.cache_dir else ".cache"
+    if raw.startswith(".") or not Path(raw).is_absolute():
+        return Path(tempfile.gettempdir()) / "doc-agent-cache"
+    return Path(raw)
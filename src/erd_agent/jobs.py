@@ -0,0 +1,282 @@
+"""
+비동기 분석 작업(job) 저장소.
+
+POST /api/jobs 로 접수된 작업의 상태/에이전트별 진행 상황/산출물을 보관한다.
+JobStore 인터페이스만 지키면 다른 백엔드(Azure Table, Cosmos 등)로 교체할 수 있으며
+(JOB_STORE="패키지.모듈:팩토리"), 기본 구현은 로컬 SQLite 파일(SQLiteJobStore)이다.
+SQLite 파일은 인스턴스 로컬이므로 scale-out/재시작 후에도 job을 보려면 공유 백엔드를 지정한다.
+"""
+from __future__ import annotations
+import importlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from erd_agent.config import settings, writable_cache_root
+
+logger = logging.getLogger(__name__)
+
+# job 상태: queued → running → ok / partial / error
+# 에이전트 상태: pending → running → ok / error
+FINISHED_STATUSES = {"ok", "partial", "error"}
+_FINISHED_SQL = ", ".join(f"'{s}'" for s in sorted(FINISHED_STATUSES))
+
+# 실행(running) 중인 job은 이 간격(JOB_STALE_AFTER의 일부)으로 updated_at을 갱신한다
+_HEARTBEAT_FRACTION = 0.25
+
+# 중단된 job에 기록하는 오류
+STALE_ERROR = {"code": "JOB_STALE", "message": "작업이 중단되었습니다 (호스트 재시작 등). 다시 요청해 주세요."}
+
+
+class JobStore(ABC):
+    @abstractmethod
+    def create(self, repo_url: str, mode: str, agents: list[str], ref: str | None = None) -> str: ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> dict | None: ...
+
+    @abstractmethod
+    def set_status(self, job_id: str, status: str, error: dict | None = None) -> None: ...
+
+    @abstractmethod
+    def set_commit_sha(self, job_id: str, commit_sha: str | None) -> None: ...
+
+    @abstractmethod
+    def set_agent(self, job_id: str, agent: str, result: dict) -> None: ...
+
+    @abstractmethod
+    def set_artifacts(self, job_id: str, artifacts: list[dict]) -> None: ...
+
+    @abstractmethod
+    def get_artifacts(self, job_id: str) -> list[dict] | None: ...
+
+    def heartbeat(self, job_id: str) -> None:
+        """실행 중인 job의 updated_at 갱신 (중단 판정용). 판정을 하지 않는 저장소는 구현하지 않아도 된다."""
+
+
+class SQLiteJobStore(JobStore):
+    """단일 SQLite 파일 기반 구현 (로컬 실행/테스트용, 같은 인스턴스의 여러 워커 프로세스 공유 가능)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._tx() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id     TEXT PRIMARY KEY,
+                    repo_url   TEXT NOT NULL,
+                    mode       TEXT NOT NULL,
+                    status     TEXT NOT NULL,
+                    error      TEXT,
+                    agents     TEXT NOT NULL,
+                    artifacts  TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    ref        TEXT,
+                    commit_sha TEXT
+                )
+                """
+            )
+            # 이전 버전에서 만든 DB 파일에는 ref/commit_sha 컬럼이 없으므로 추가
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for col in ("ref", "commit_sha"):
+                if col not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {col} TEXT")
+
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE로 다른 프로세스의 동시 갱신과 직렬화)."""
+        with self._lock:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def create(self, repo_url: str, mode: str, agents: list[str], ref: str | None = None) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        agents_json = json.dumps({a: {"status": "pending"} for a in agents})
+        with self._tx() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, repo_url, mode, ref, status, agents, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, repo_url, mode, ref, agents_json, now, now),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> dict | None:
+        """
+        job 조회. running인데 JOB_STALE_AFTER 동안 갱신(heartbeat 포함)이 없으면 error(JOB_STALE)로 바꿔 반환한다.
+        queued는 워커 풀 대기 중일 수 있으므로 판정하지 않는다.
+        (그 사이 워커가 갱신했으면 updated_at 조건이 맞지 않아 덮어쓰지 않는다)
+        """
+        job = self._get(job_id)
+        if job is None or job["status"] != "running":
+            return job
+        if time.time() - job["updated_at"] <= settings.job_stale_after:
+            return job
+        now = time.time()
+        with self._tx() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = 'error', error = ?, updated_at = ?"
+                " WHERE job_id = ? AND status = 'running' AND updated_at = ?",
+                (json.dumps(STALE_ERROR, ensure_ascii=False), now, job_id, job["updated_at"]),
+            )
+        if cur.rowcount == 0:
+            return self._get(job_id)
+        return {**job, "status": "error", "error": STALE_ERROR, "updated_at": now}
+
+    def _get(self, job_id: str) -> dict | None:
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT job_id, repo_url, mode, status, error, agents, created_at, updated_at, ref, commit_sha"
+                " FROM jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        agents = json.loads(row[5])
+        done = sum(1 for r in agents.values() if r["status"] in ("ok", "error"))
+        return {
+            "job_id": row[0],
+            "repo_url": row[1],
+            "mode": row[2],
+            "ref": row[8],
+            "commit_sha": row[9],
+            "status": row[3],
+            "error": json.loads(row[4]) if row[4] else None,
+            "progress": {"done": done, "total": len(agents)},
+            "agents": agents,
+            "created_at": row[6],
+            "updated_at": row[7],
+        }
+
+    def set_status(self, job_id: str, status: str, error: dict | None = None) -> None:
+        """이미 끝난(ok/partial/error) job은 바꾸지 않는다 (클라이언트가 본 JOB_STALE 등을 덮어쓰지 않게)."""
+        with self._tx() as conn:
+            conn.execute(
+                f"UPDATE jobs SET status = ?, error = ?, updated_at = ?"
+                f" WHERE job_id = ? AND status NOT IN ({_FINISHED_SQL})",
+                (status, json.dumps(error, ensure_ascii=False) if error else None, time.time(), job_id),
+            )
+
+    def heartbeat(self, job_id: str) -> None:
+        with self._tx() as conn:
+            conn.execute(
+                "UPDATE jobs SET updated_at = ? WHERE job_id = ? AND status = 'running'",
+                (time.time(), job_id),
+            )
+
+    def set_commit_sha(self, job_id: str, commit_sha: str | None) -> None:
+        with self._tx() as conn:
+            conn.execute(
+                "UPDATE jobs SET commit_sha = ?, updated_at = ? WHERE job_id = ?",
+                (commit_sha, time.time(), job_id),
+            )
+
+    def set_agent(self, job_id: str, agent: str, result: dict) -> None:
+        # read-modify-write 를 하나의 트랜잭션으로 처리 (동시 에이전트 갱신 시 유실 방지)
+        with self._tx() as conn:
+            row = conn.execute("SELECT agents FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            agents = json.loads(row[0])
+            agents[agent] = result
+            conn.execute(
+                "UPDATE jobs SET agents = ?, updated_at = ? WHERE job_id = ?",
+                (json.dumps(agents, ensure_ascii=False), time.time(), job_id),
+            )
+
+    def set_artifacts(self, job_id: str, artifacts: list[dict]) -> None:
+        with self._tx() as conn:
+            conn.execute(
+                "UPDATE jobs SET artifacts = ?, updated_at = ? WHERE job_id = ?",
+                (json.dumps(artifacts, ensure_ascii=False), time.time(), job_id),
+            )
+
+    def get_artifacts(self, job_id: str) -> list[dict] | None:
+        with self._read() as conn:
+            row = conn.execute("SELECT artifacts FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+
+@contextmanager
+def job_heartbeat(store: JobStore, job_id: str, interval: float | None = None) -> Iterator[None]:
+    """with 블록 동안 백그라운드 스레드가 주기적으로 store.heartbeat(job_id)를 호출한다 (긴 clone/에이전트 실행용)."""
+    interval = interval or max(1.0, settings.job_stale_after * _HEARTBEAT_FRACTION)
+    stop = threading.Event()
+
+    def beat() -> None:
+        while not stop.wait(interval):
+            try:
+                store.heartbeat(job_id)
+            except Exception as exc:
+                logger.warning("Job heartbeat failed (%s): %s", job_id, exc)
+
+    thread = threading.Thread(target=beat, name=f"job-heartbeat-{job_id[:8]}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+_STORE: JobStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def _sqlite_job_store() -> JobStore:
+    return SQLiteJobStore(settings.job_store_path or writable_cache_root() / "jobs.sqlite3")
+
+
+def create_job_store(spec: str) -> JobStore:
+    """
+    JOB_STORE 값으로 저장소 생성.
+    - "sqlite": SQLiteJobStore (JOB_STORE_PATH 미지정 시 캐시 디렉터리 아래 jobs.sqlite3)
+    - "패키지.모듈:함수": 인자 없이 호출해 JobStore를 반환하는 팩토리
+    """
+    if spec.lower() == "sqlite":
+        return _sqlite_job_store()
+    module_name, sep, attr = spec.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(f"JOB_STORE는 'sqlite' 또는 '패키지.모듈:함수' 형식이어야 합니다: {spec!r}")
+    store = getattr(importlib.import_module(module_name), attr)()
+    if not isinstance(store, JobStore):
+        raise TypeError(f"JOB_STORE 팩토리가 JobStore가 아닌 값을 반환했습니다: {type(store).__name__}")
+    return store
+
+
+def get_job_store() -> JobStore:
+    """프로세스 전역 job 저장소 (JOB_STORE로 선택)."""
+    global _STORE
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = create_job_store(settings.job_store)
+    return _STORE
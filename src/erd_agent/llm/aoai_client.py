@@ -1,7 +1,42 @@
 from __future__ import annotations
+import hashlib
+import threading
 from urllib.parse import urlparse
 from erd_agent.config import settings
 
+# 프로세스 전역 클라이언트 레지스트리 (warm Azure Function 호출 간에도 재사용)
+# key: (endpoint, deployment, api_version, api_key 해시)
+_CLIENTS: dict[tuple[str, ...], object] = {}
+_LOCK = threading.Lock()
+
+
+def _is_configured() -> bool:
+    return bool(settings.azure_openai_endpoint and settings.azure_openai_api_key and settings.azure_openai_deployment)
+
+
+def _client_key() -> tuple[str, ...]:
+    key_hash = hashlib.sha256((settings.azure_openai_api_key or "").encode("utf-8")).hexdigest()[:16]
+    return (
+        settings.azure_openai_endpoint.rstrip("/"),
+        settings.azure_openai_deployment,
+        settings.openai_api_version,
+        key_hash,
+    )
+
+
+def _http_client():
+    """keep-alive 커넥션을 재사용하는 httpx 클라이언트 (풀 크기/타임아웃은 설정값)."""
+    import httpx
+    from openai import DefaultHttpxClient
+
+    limits = httpx.Limits(
+        max_connections=settings.aoai_max_connections,
+        max_keepalive_connections=settings.aoai_max_keepalive_connections,
+        keepalive_expiry=settings.aoai_keepalive_expiry,
+    )
+    timeout = httpx.Timeout(settings.aoai_timeout, connect=settings.aoai_connect_timeout)
+    return DefaultHttpxClient(limits=limits, timeout=timeout)
+
 
 def build_aoai_client():
     """
@@ -9,11 +44,17 @@ def build_aoai_client():
     - 프로젝트 엔드포인트(api/projects): 리소스 루트(호스트 기준)로 AzureOpenAI 사용
     - 엔드포인트가 /openai/v1/ 포함 시: OpenAI(base_url=..., api_key=...) 사용
     - 그 외: AzureOpenAI(azure_endpoint=..., api_key=..., api_version=...) 사용
+    매 호출마다 새 클라이언트(=새 커넥션 풀)를 만든다. 일반 호출부는 get_aoai_client()를 사용.
     """
-    if not (settings.azure_openai_endpoint and settings.azure_openai_api_key and settings.azure_openai_deployment):
+    if not _is_configured():
         return None
 
     endpoint = settings.azure_openai_endpoint.rstrip("/")
+    common = {
+        "api_key": settings.azure_openai_api_key,
+        "http_client": _http_client(),
+        "max_retries": settings.aoai_max_retries,
+    }
 
     # 프로젝트 엔드포인트(.services.ai.azure.com): Model Inference API 경로 사용
     if "api/projects" in endpoint:
@@ -23,18 +64,37 @@ def build_aoai_client():
         # Model Inference API 문서 기준 api-version (리소스별로 다를 수 있음)
         return OpenAI(
             base_url=models_base,
-            api_key=settings.azure_openai_api_key,
             default_query={"api-version": "2024-05-01-preview"},
+            **common,
         )
 
     # /openai/v1/ 형태면 OpenAI 클라이언트로 호출 (배포명을 model로 전달)
     if "/openai/v1" in endpoint:
         from openai import OpenAI
-        return OpenAI(base_url=endpoint, api_key=settings.azure_openai_api_key)
+        return OpenAI(base_url=endpoint, **common)
 
     from openai import AzureOpenAI
     return AzureOpenAI(
         azure_endpoint=endpoint,
-        api_key=settings.azure_openai_api_key,
         api_version=settings.openai_api_version,
-    )
\ No newline at end of file
+        **common,
+    )
+
+
+def get_aoai_client():
+    """
+    프로세스 전역으로 공유되는 클라이언트 반환 (없으면 생성 후 캐시).
+    OpenAI SDK 클라이언트는 스레드 안전하므로 모든 에이전트/스레드가 같은 커넥션 풀을 쓴다.
+    """
+    if not _is_configured():
+        return None
+    key = _client_key()
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = build_aoai_client()
+                _CLIENTS[key] = client
+    return client
+
@@ -0,0 +1,59 @@
+"""공용 JSON chat completion 호출 (공유 클라이언트 + 응답 캐시)."""
+from __future__ import annotations
+import json
+from typing import Any
+
+from erd_agent.config import settings
+from erd_agent.llm.aoai_client import get_aoai_client
+from erd_agent.llm.response_cache import ResponseCache, get_response_cache
+
+JSON_OBJECT = {"type": "json_object"}
+
+
+def chat_json(
+    system_prompt: str,
+    user_prompt: str,
+    response_format: dict[str, Any] | None = None,
+    temperature: float | None = 0,
+) -> Any:
+    """
+    system/user 프롬프트로 chat completion을 호출하고 JSON 파싱 결과를 반환한다.
+    동일한 (deployment, api_version, prompt, response_format, temperature)는 디스크 캐시에서 응답.
+    """
+    client = get_aoai_client()
+    if client is None:
+        raise RuntimeError("Azure OpenAI 설정이 없습니다. (.env의 AZURE_OPENAI_* 값을 설정하세요)")
+
+    response_format = response_format or JSON_OBJECT
+    cache = get_response_cache()
+    key = None
+    if cache is not None:
+        key = ResponseCache.make_key(
+            deployment=settings.azure_openai_deployment,
+            api_version=settings.openai_api_version,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_format=response_format,
+            temperature=temperature,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
+    kwargs: dict[str, Any] = {}
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    resp = client.chat.completions.create(
+        model=settings.azure_openai_deployment,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        response_format=response_format,
+        **kwargs,
+    )
+    content = resp.choices[0].message.content
+    data = json.loads(content)  # 파싱 실패한 응답은 캐시하지 않음
+    if cache is not None:
+        cache.put(key, content)
+    return data
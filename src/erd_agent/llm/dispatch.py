@@ -0,0 +1,28 @@
+"""LLM chunk 호출 병렬 디스패처 (입력 순서 보존, 동시 호출 수 제한)."""
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence, TypeVar
+
+from erd_agent.config import settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrent(
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    max_in_flight: int | None = None,
+) -> list[R]:
+    """
+    items 각각에 fn을 스레드 풀로 병렬 적용한다.
+    - 결과는 items 순서 그대로 반환 → 병합(_merge_*) 결과가 순차 실행과 동일
+    - 동시 호출 수는 max_in_flight (기본: settings.llm_max_concurrency)
+    - 하나라도 실패하면 입력 순서상 첫 실패 예외를 그대로 전파
+    """
+    items = list(items)
+    limit = max_in_flight or settings.llm_max_concurrency
+    if limit <= 1 or len(items) <= 1:
+        return [fn(x) for x in items]
+    with ThreadPoolExecutor(max_workers=min(limit, len(items)), thread_name_prefix="llm") as pool:
+        return list(pool.map(fn, items))
@@ -1,11 +1,10 @@
 from __future__ import annotations
-import json
 from pathlib import Path
 from typing import List, Dict, Tuple
 
-from erd_agent.config import settings
 from erd_agent.model import Schema, Table, Column, Ref, EnumType
-from erd_agent.llm.aoai_client import build_aoai_client
+from erd_agent.llm.chat import chat_json
+from erd_agent.llm.dispatch import map_concurrent
 from erd_agent.llm.schema_models import ExtractedSchema
 
 SYSTEM_PROMPT = """You are a senior backend engineer and data modeler.
@@ -107,26 +106,11 @@ def _make_files_blob(chunk: List[Tuple[Path, str]]) -> str:
     return "\n\n".join(parts)
 
 def _call_llm(files_blob: str) -> ExtractedSchema:
-    client = build_aoai_client()
-    if client is None:
-        raise RuntimeError("Azure OpenAI 설정이 없습니다. (.env의 AZURE_OPENAI_* 값을 설정하세요)")
-
     user_prompt = USER_PROMPT_TEMPLATE.format(files_blob=files_blob)
 
     # gpt-4.1 / api-version 2024-06-01: response_format json_object를 사용해 JSON 안정화
     # (Structured Outputs json_schema는 환경/모델 지원 편차가 있어 우선 json_object로 안전하게) [5](https://github.com/holistics/dbml/blob/master/dbml-homepage/docs/docs.md)[3](https://learn.microsoft.com/en-us/azure/ai-foundry/openai/how-to/chatgpt?view=foundry-classic)
-    resp = client.chat.completions.create(
-        model=settings.azure_openai_deployment,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        response_format={"type": "json_object"},
-        temperature=0,
-    )
-
-    content = resp.choices[0].message.content
-    data = json.loads(content)
+    data = chat_json(SYSTEM_PROMPT, user_prompt)
     return ExtractedSchema.model_validate(data)
 
 def _merge_extracted(chunks: List[ExtractedSchema]) -> ExtractedSchema:
@@ -216,11 +200,10 @@ def extracted_to_schema(ex: ExtractedSchema) -> Schema:
         ))
     return schema
 
-def ai_extract_schema(file_texts: List[Tuple[Path, str]]) -> Schema:
+def ai_extract_schema(file_texts: List[Tuple[Path, str]], max_in_flight: int | None = None) -> Schema:
     chunks = _chunk_files(file_texts)
-    extracted_chunks = []
-    for ch in chunks:
-        blob = _make_files_blob(ch)
-        extracted_chunks.append(_call_llm(blob))
+    blobs = [_make_files_blob(ch) for ch in chunks]
+    # chunk 순서대로 결과를 받아야 병합 결과가 결정적
+    extracted_chunks = map_concurrent(_call_llm, blobs, max_in_flight)
     merged = _merge_extracted(extracted_chunks)
     return extracted_to_schema(merged)
\ No newline at end of file
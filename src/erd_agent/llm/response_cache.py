@@ -0,0 +1,123 @@
+"""
+LLM 응답 디스크 캐시 (content-addressed).
+
+key = sha256(deployment, api_version, system prompt, user prompt, response_format, temperature)
+값은 캐시 루트(writable_cache_root(), 기본 settings.cache_dir) 아래 llm/<key[:2]>/<key>.json 에 저장한다.
+총 용량이 llm_cache_max_bytes를 넘으면 최근 사용(mtime)이 가장 오래된 항목부터 삭제(LRU).
+적중/미스 수는 response_cache_stats()로 조회한다 (Function/CLI가 실행 후 로그로 남김).
+"""
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from erd_agent.config import settings, writable_cache_root
+from erd_agent.sqlite_cache import CacheStats, LazyCache
+
+
+class ResponseCache(CacheStats):
+    """응답 본문은 크기가 제각각이라 SQLite 행 대신 파일로 두고, 행 수가 아닌 총 용량으로 LRU 정리한다."""
+
+    def __init__(self, root: Path, max_bytes: int):
+        super().__init__()
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None  # 첫 put 시 디렉터리 스캔으로 초기화
+
+    @staticmethod
+    def make_key(
+        *,
+        deployment: str | None,
+        api_version: str | None,
+        system_prompt: str,
+        user_prompt: str,
+        response_format: dict[str, Any] | None,
+        temperature: float | None,
+    ) -> str:
+        payload = json.dumps(
+            [deployment, api_version, system_prompt, user_prompt, response_format, temperature],
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            content = path.read_text(encoding="utf-8")
+            os.utime(path)  # LRU: 최근 사용 시각 갱신
+        except OSError:
+            self.count(misses=1)
+            return None
+        self.count(hits=1)
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = content.encode("utf-8")
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        try:
+            replaced = path.stat().st_size  # 같은 key를 덮어쓰면 이전 크기만큼 빼야 총 용량이 맞다
+        except OSError:
+            replaced = 0
+        tmp.replace(path)  # 동시 기록 시에도 반쯤 쓰인 파일이 보이지 않도록 원자적 교체
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += len(data) - replaced
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for f in self.root.glob("*/*.json"):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, f))
+        return entries
+
+    def _scan_total(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        # 여유를 두고(90%) 줄여서 put마다 eviction이 반복되지 않게 한다
+        target = int(self.max_bytes * 0.9)
+        for _, size, f in entries:
+            if total <= target:
+                break
+            try:
+                f.unlink()
+                total -= size
+            except OSError:
+                continue
+        self._total_bytes = total
+
+
+_CACHE = LazyCache(lambda: ResponseCache(writable_cache_root() / "llm", settings.llm_cache_max_bytes))
+
+
+def get_response_cache() -> ResponseCache | None:
+    """프로세스 전역 응답 캐시 (LLM_CACHE_ENABLED=false면 None)."""
+    if not settings.llm_cache_enabled:
+        return None
+    return _CACHE.get()
+
+
+def response_cache_stats() -> dict[str, int] | None:
+    """프로세스가 시작된 뒤 누적된 응답 캐시 적중/미스 수 (캐시를 끄면 None)."""
+    cache = get_response_cache()
+    return cache.stats() if cache is not None else None
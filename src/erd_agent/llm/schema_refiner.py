@@ -2,8 +2,8 @@ from __future__ import annotations
 import json
 from typing import Any
 from erd_agent.model import Schema
-from erd_agent.config import settings
-from erd_agent.llm.aoai_client import build_aoai_client
+from erd_agent.llm.aoai_client import get_aoai_client
+from erd_agent.llm.chat import chat_json
 
 REFINE_SCHEMA = {
   "type": "object",
@@ -102,8 +102,7 @@ def apply_refined(schema: Schema, refined: dict[str, Any]) -> None:
         schema.refs.append(__import__("erd_agent.model", fromlist=["Ref"]).Ref(**r))
 
 def refine_schema_with_aoai(schema: Schema, hints_text: str = "") -> Schema:
-    client = build_aoai_client()
-    if client is None:
+    if get_aoai_client() is None:
         return schema
 
     payload = schema_to_min_json(schema)
@@ -121,27 +120,21 @@ def refine_schema_with_aoai(schema: Schema, hints_text: str = "") -> Schema:
 
     # 1) Structured Outputs 시도 (환경에 따라 미지원일 수 있어 try)
     try:
-        resp = client.chat.completions.create(
-            model=settings.azure_openai_deployment,
-            messages=[{"role":"system","content":system},{"role":"user","content":user}],
+        refined = chat_json(
+            system,
+            user,
             response_format={
                 "type": "json_schema",
                 "json_schema": {"name": "refined_schema", "schema": REFINE_SCHEMA, "strict": True}
             },
+            temperature=None,
         )
-        content = resp.choices[0].message.content
-        refined = json.loads(content)
         apply_refined(schema, refined)
         return schema
     except Exception:
         # 2) fallback: json_object
         try:
-            resp = client.chat.completions.create(
-                model=settings.azure_openai_deployment,
-                messages=[{"role":"system","content":system},{"role":"user","content":user}],
-                response_format={"type": "json_object"},
-            )
-            refined = json.loads(resp.choices[0].message.content)
+            refined = chat_json(system, user, temperature=None)
             apply_refined(schema, refined)
         except Exception:
             pass
@@ -26,6 +26,10 @@ class Ref:
     parent_table: str
     parent_column: str
     rel: str = ">"
+    # 참조 대상 엔티티 클래스명 — merge_schemas가 entity_tables로 실제 테이블/PK 컬럼을 해석
+    parent_entity: Optional[str] = None
+    # parent_entity가 가리킬 수 있는 정규 클래스명 후보 (자식 파일의 package/import 기준, 우선순위 순)
+    parent_candidates: List[str] = field(default_factory=list)
 
 @dataclass
 class EnumType:
@@ -38,6 +42,8 @@ class Schema:
     tables: Dict[str, Table] = field(default_factory=dict)
     refs: List[Ref] = field(default_factory=list)
     enums: Dict[str, EnumType] = field(default_factory=dict)  # ✅ 추가
+    # 엔티티 정규 클래스명(package.Class) → 테이블명 (@Table(name/schema) 반영)
+    entity_tables: Dict[str, str] = field(default_factory=dict)
 
     def ensure_table(self, name: str) -> Table:
         if name not in self.tables:
@@ -1,5 +1,12 @@
 from __future__ import annotations
-from erd_agent.model import Schema, Column
+import logging
+from collections import defaultdict
+from dataclasses import replace
+from typing import Iterable
+
+from erd_agent.model import Schema, Column, Ref
+
+logger = logging.getLogger(__name__)
 
 def normalize_schema(schema: Schema) -> None:
     # 1) Ref에 등장하는 테이블이 없으면 placeholder 생성
@@ -17,4 +24,93 @@ def normalize_schema(schema: Schema) -> None:
     for t in schema.tables.values():
         if not any(c.pk for c in t.columns.values()):
             if "id" not in t.columns:
-                t.columns["id"] = Column("id", "bigint", pk=True, nullable=False)
\ No newline at end of file
+                t.columns["id"] = Column("id", "bigint", pk=True, nullable=False)
+
+def _merge_column(base: Column, other: Column) -> None:
+    """같은 테이블·같은 이름 컬럼 충돌 해소: 제약은 합치고 타입은 더 구체적인 쪽을 택한다."""
+    base.pk = base.pk or other.pk
+    base.nullable = base.nullable and other.nullable and not base.pk
+    base.unique = base.unique or other.unique
+    base.increment = base.increment or other.increment
+    # varchar < varchar(100) / 기본값 varchar < 그 밖의 매핑 타입
+    if base.db_type == "varchar" and other.db_type != "varchar":
+        base.db_type = other.db_type
+    base.default = base.default if base.default is not None else other.default
+    base.note = base.note if base.note is not None else other.note
+
+
+def _resolve_ref(r: Ref, schema: Schema, by_simple_name: dict[str, list[str]]) -> Ref | None:
+    """
+    parent_entity가 파싱된 엔티티면 그 테이블(@Table name/schema)과 단일 PK 컬럼으로 바꾼다.
+    - 자식 파일의 package/import로 만든 후보(parent_candidates) 중 파싱된 엔티티를 우선
+    - 후보가 없으면 단순 클래스명이 하나의 엔티티에만 맞을 때 그 엔티티
+    - 같은 단순 이름의 엔티티가 여럿이라 정할 수 없으면 경고 후 None (FK를 추측하지 않고 생략)
+    알 수 없는 클래스면 조각에서 추정한 이름(camel_to_snake) 그대로 둔다.
+    """
+    if not r.parent_entity:
+        return r
+    table_name = next((schema.entity_tables[c] for c in r.parent_candidates if c in schema.entity_tables), None)
+    if table_name is None:
+        matches = by_simple_name.get(r.parent_entity.rsplit(".", 1)[-1], [])
+        if len(matches) > 1:
+            logger.warning(
+                "FK %s.%s skipped: %s matches several entities (%s)",
+                r.child_table, r.child_column, r.parent_entity, ", ".join(matches),
+            )
+            return None
+        if not matches:
+            return r
+        table_name = schema.entity_tables[matches[0]]
+    parent_column = r.parent_column
+    table = schema.tables.get(table_name)
+    if table is not None:
+        pks = [c.name for c in table.columns.values() if c.pk]
+        if len(pks) == 1:
+            parent_column = pks[0]
+    return replace(r, parent_table=table_name, parent_column=parent_column)
+
+
+def merge_schemas(fragments: Iterable[Schema]) -> Schema:
+    """
+    파일별 스키마 조각을 하나로 합친다. 조각 순서(= 파일 경로 순)대로 합치므로 결과가 결정적이다.
+    - 테이블/컬럼: 처음 나온 순서 유지, 같은 컬럼은 _merge_column으로 충돌 해소
+    - Ref: 참조 엔티티 클래스 → 테이블(entity_tables, 정규 클래스명 기준)로 해석한 뒤 완전히 같은 관계는 한 번만
+      (같은 단순 이름의 엔티티가 여럿이고 import로 정할 수 없는 Ref는 생략)
+    - Enum: 값 합집합 (등장 순서 유지)
+    """
+    merged = Schema()
+    seen_refs: set[tuple[str, str, str, str, str]] = set()
+    fragments = list(fragments)
+    for frag in fragments:
+        for cls, table_name in frag.entity_tables.items():
+            merged.entity_tables.setdefault(cls, table_name)
+    for frag in fragments:
+        for name, table in frag.tables.items():
+            target = merged.ensure_table(name)
+            if target.note is None:
+                target.note = table.note
+            for col_name, col in table.columns.items():
+                existing = target.columns.get(col_name)
+                if existing is None:
+                    target.columns[col_name] = replace(col)
+                else:
+                    _merge_column(existing, col)
+        merged.refs.extend(frag.refs)
+        for name, enum in frag.enums.items():
+            target_enum = merged.ensure_enum(name)
+            if target_enum.note is None:
+                target_enum.note = enum.note
+            target_enum.values.extend(v for v in enum.values if v not in target_enum.values)
+    by_simple_name: dict[str, list[str]] = defaultdict(list)
+    for cls in merged.entity_tables:
+        by_simple_name[cls.rsplit(".", 1)[-1]].append(cls)
+    refs, merged.refs = merged.refs, []
+    for r in refs:
+        r = _resolve_ref(r, merged, by_simple_name)
+        if r is None:
+            continue
+        key = (r.child_table, r.child_column, r.parent_table, r.parent_column, r.rel)
+        if key not in seen_refs:
+            seen_refs.add(key)
+            merged.refs.append(replace(r))
+    return merged
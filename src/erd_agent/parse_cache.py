@@ -0,0 +1,79 @@
+"""
+정적 ERD 파싱 결과 영구 캐시.
+
+엔티티 파일 하나를 파싱한 스키마 조각(테이블/컬럼/Ref/Enum)을
+key = "<PARSER_VERSION>:<sha1(본문)>" 로 SQLite에 저장한다.
+레포가 파일 하나만 바뀌어도 전체를 다시 파싱하던 것을, 새로 생기거나 바뀐 파일만 파싱하고
+나머지는 캐시된 조각으로 merge_schemas에 넘기도록 한다.
+추출 로직이 바뀌면 jpa_java.PARSER_VERSION을 올려 기존 항목을 무효화한다.
+"""
+from __future__ import annotations
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from erd_agent.config import settings, writable_cache_root
+from erd_agent.model import Column, EnumType, Ref, Schema, Table
+from erd_agent.sqlite_cache import LazyCache, SQLiteCache
+
+# 최대 행 수 (초과 시 오래 안 쓴 행부터 삭제)
+_MAX_ROWS = 200_000
+
+
+def fragment_key(parser_version: str, text: str) -> str:
+    return f"{parser_version}:{hashlib.sha1(text.encode('utf-8')).hexdigest()}"
+
+
+def _dump(schema: Schema) -> str:
+    return json.dumps(
+        {
+            "tables": [
+                {"name": t.name, "note": t.note, "columns": [asdict(c) for c in t.columns.values()]}
+                for t in schema.tables.values()
+            ],
+            "refs": [asdict(r) for r in schema.refs],
+            "enums": [asdict(e) for e in schema.enums.values()],
+            "entity_tables": schema.entity_tables,
+        },
+        ensure_ascii=False,
+    )
+
+
+def _load(raw: str) -> Schema:
+    data = json.loads(raw)
+    schema = Schema()
+    for t in data["tables"]:
+        table = Table(name=t["name"], note=t["note"])
+        for c in t["columns"]:
+            table.columns[c["name"]] = Column(**c)
+        schema.tables[table.name] = table
+    schema.refs = [Ref(**r) for r in data["refs"]]
+    for e in data["enums"]:
+        schema.enums[e["name"]] = EnumType(**e)
+    schema.entity_tables = data.get("entity_tables", {})
+    return schema
+
+
+class ParseCache(SQLiteCache):
+    """fragment_key → 스키마 조각 (JSON)."""
+
+    def __init__(self, path: Path):
+        super().__init__(path, "fragments", _MAX_ROWS)
+
+    def get_many(self, keys: list[str]) -> dict[str, Schema]:
+        """캐시에 있는 조각만 반환 (조회한 항목은 최근 사용 시각 갱신)."""
+        return {k: _load(raw) for k, raw in super().get_many(keys).items()}
+
+    def put_many(self, fragments: dict[str, Schema]) -> None:
+        super().put_many({k: _dump(s) for k, s in fragments.items()})
+
+
+_CACHE = LazyCache(lambda: ParseCache(writable_cache_root() / "parse-cache.sqlite3"))
+
+
+def get_parse_cache() -> ParseCache | None:
+    """프로세스 전역 파싱 캐시 (ERD_PARSE_CACHE_ENABLED=false면 None)."""
+    if not settings.erd_parse_cache_enabled:
+        return None
+    return _CACHE.get()
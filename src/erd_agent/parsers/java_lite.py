@@ -0,0 +1,542 @@
+"""
+경량 Java 선언 추출기 (토크나이저 수준).
+
+JPA/Spring 분석에 필요한 것은 타입·필드·메서드 선언부와 애너테이션뿐이므로,
+javalang처럼 전체 AST를 만들지 않고 선언부만 토큰 단위로 읽고 메서드 본문/필드 초기값/
+초기화 블록은 중괄호 매칭으로 건너뛴다. (record, sealed, text block 등 최신 문법도 통과)
+
+반환 객체는 javalang AST와 같은 속성 이름을 쓴다 (types / annotations / fields / declarators /
+type.name / type.arguments / element / value ...). 따라서 javalang 기반 코드를 그대로 쓸 수 있다.
+해석할 수 없는 구문을 만나면 JavaLiteError를 던지고, 호출 측은 javalang으로 대체한다.
+"""
+from __future__ import annotations
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+
+class JavaLiteError(ValueError):
+    """경량 추출기가 해석하지 못한 구문 (javalang으로 대체할 것)."""
+
+
+# ---- AST (javalang 호환 속성명) ----
+
+@dataclass
+class Literal:
+    value: str  # 따옴표 포함 원문 ('"users"', 'false', '50')
+
+
+@dataclass
+class MemberReference:
+    qualifier: str
+    member: str
+
+
+@dataclass
+class Expression:
+    text: str  # 해석하지 않은 값 (연산식 등)
+
+
+@dataclass
+class ElementValuePair:
+    name: str
+    value: Any
+
+
+@dataclass
+class ElementArrayValue:
+    values: list
+
+
+@dataclass
+class Annotation:
+    name: str
+    # None / 단일 값 / list[ElementValuePair]  (javalang과 동일한 형태)
+    element: Any = None
+
+
+@dataclass
+class TypeArgument:
+    type: "ReferenceType | None"
+    pattern_type: str | None = None  # '?', 'extends', 'super'
+
+
+@dataclass
+class ReferenceType:
+    name: str  # 단순 이름 (java.util.List → List)
+    arguments: list[TypeArgument] | None = None
+    dimensions: int = 0
+    qualified: str = ""
+
+
+@dataclass
+class VariableDeclarator:
+    name: str
+    initializer: Literal | None = None  # 문자열 리터럴 초기값만 보관 (상수 경로 해석용)
+
+
+@dataclass
+class FieldDeclaration:
+    annotations: list[Annotation]
+    modifiers: set[str]
+    type: ReferenceType
+    declarators: list[VariableDeclarator]
+
+
+@dataclass
+class FormalParameter:
+    annotations: list[Annotation]
+    modifiers: set[str]
+    type: ReferenceType
+    name: str
+    varargs: bool = False
+
+
+@dataclass
+class MethodDeclaration:
+    name: str
+    annotations: list[Annotation]
+    modifiers: set[str]
+    return_type: ReferenceType | None  # 생성자 / void 는 None
+    parameters: list[FormalParameter]
+
+
+@dataclass
+class TypeDeclaration:
+    kind: str  # class / interface / enum / record / annotation
+    name: str
+    annotations: list[Annotation]
+    modifiers: set[str]
+    fields: list[FieldDeclaration] = field(default_factory=list)
+    methods: list[MethodDeclaration] = field(default_factory=list)
+    types: list["TypeDeclaration"] = field(default_factory=list)  # 중첩 타입
+
+
+@dataclass
+class Import:
+    path: str
+    static: bool = False
+    wildcard: bool = False
+
+
+@dataclass
+class CompilationUnit:
+    package: str | None
+    imports: list[Import]
+    types: list[TypeDeclaration]
+
+
+# ---- 토크나이저 ----
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<skip>\s+|//[^\n]*|/\*[\s\S]*?\*/)
+  | (?P<str>\"\"\"[\s\S]*?\"\"\"|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])+')
+  | (?P<num>\.?\d[\w.]*)
+  | (?P<id>[^\W\d][\w$]*|\$[\w$]*)
+  | (?P<op>\.\.\.|::|->|.)
+    """,
+    re.VERBOSE,
+)
+
+# 본문 건너뛰기용: 중괄호와 그 안의 중괄호를 숨길 수 있는 토큰만 찾는다
+_SKIP_RE = re.compile(r'"""[\s\S]*?"""|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])+\'|//[^\n]*|/\*[\s\S]*?\*/|[{}]')
+
+_MODIFIERS = {
+    "public", "protected", "private", "static", "final", "abstract", "transient", "volatile",
+    "synchronized", "native", "strictfp", "default", "sealed", "non-sealed",
+}
+_TYPE_KINDS = {"class", "interface", "enum", "record"}
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+        self._peeked: list[tuple[str, str, int]] = []  # (kind, value, end)
+
+    # -- 토큰 --
+
+    def _lex(self, pos: int) -> tuple[str, str, int]:
+        text = self.text
+        while True:
+            if pos >= len(text):
+                return "eof", "", pos
+            m = _TOKEN_RE.match(text, pos)
+            if m is None:  # 닫히지 않은 문자열 등
+                raise JavaLiteError(f"unexpected character at {pos}")
+            kind = m.lastgroup
+            if kind != "skip":
+                return kind, m.group(), m.end()
+            pos = m.end()
+
+    def peek(self, k: int = 0) -> str:
+        pos = self._peeked[-1][2] if self._peeked else self.pos
+        while len(self._peeked) <= k:
+            tok = self._lex(pos)
+            self._peeked.append(tok)
+            pos = tok[2]
+        return self._peeked[k][1]
+
+    def peek_kind(self, k: int = 0) -> str:
+        self.peek(k)
+        return self._peeked[k][0]
+
+    def next(self) -> str:
+        self.peek()
+        kind, value, end = self._peeked.pop(0)
+        if kind == "eof":
+            raise JavaLiteError("unexpected end of file")
+        self.pos = end
+        return value
+
+    def expect(self, value: str) -> None:
+        tok = self.next()
+        if tok != value:
+            raise JavaLiteError(f"expected {value!r}, got {tok!r}")
+
+    def ident(self) -> str:
+        if self.peek_kind() != "id":
+            raise JavaLiteError(f"expected identifier, got {self.peek()!r}")
+        return self.next()
+
+    def skip_block(self) -> None:
+        """현재 토큰 '{'부터 짝이 맞는 '}'까지 건너뛴다 (문자열/주석 안 중괄호 무시)."""
+        self.expect("{")
+        self._peeked.clear()
+        depth = 1
+        for m in _SKIP_RE.finditer(self.text, self.pos):
+            tok = m.group()
+            if tok == "{":
+                depth += 1
+            elif tok == "}":
+                depth -= 1
+                if depth == 0:
+                    self.pos = m.end()
+                    return
+        raise JavaLiteError("unbalanced braces")
+
+    def skip_until(self, stops: set[str]) -> str:
+        """괄호 깊이 0에서 stops 중 하나를 만날 때까지 건너뛰고 그 토큰을 반환 (소비하지 않음)."""
+        depth = 0
+        while True:
+            tok = self.peek()
+            if self.peek_kind() == "eof":
+                raise JavaLiteError("unexpected end of file")
+            if depth == 0 and tok in stops:
+                return tok
+            if tok == "{" and depth == 0 and "{" not in stops:
+                self.skip_block()
+                continue
+            if tok in "([{":
+                depth += 1
+            elif tok in ")]}":
+                depth -= 1
+                if depth < 0:
+                    raise JavaLiteError(f"unbalanced {tok!r}")
+            self.next()
+
+    # -- 컴파일 단위 --
+
+    def compilation_unit(self) -> CompilationUnit:
+        package = None
+        imports: list[Import] = []
+        types: list[TypeDeclaration] = []
+        while self.peek_kind() != "eof":
+            tok = self.peek()
+            if tok == ";":
+                self.next()
+            elif tok == "package":
+                self.next()
+                package = self.qualified_name()
+                self.expect(";")
+            elif tok == "import":
+                self.next()
+                static = self.peek() == "static"
+                if static:
+                    self.next()
+                path = self.qualified_name(allow_wildcard=True)
+                self.expect(";")
+                imports.append(Import(path.rstrip(".*"), static, path.endswith(".*")))
+            else:
+                annotations, modifiers = self.modifiers()
+                types.append(self.type_declaration(annotations, modifiers))
+        return CompilationUnit(package, imports, types)
+
+    def qualified_name(self, allow_wildcard: bool = False) -> str:
+        parts = [self.ident()]
+        while self.peek() == ".":
+            self.next()
+            if allow_wildcard and self.peek() == "*":
+                self.next()
+                parts.append("*")
+                break
+            parts.append(self.ident())
+        return ".".join(parts)
+
+    # -- 애너테이션 / 수식어 --
+
+    def modifiers(self) -> tuple[list[Annotation], set[str]]:
+        annotations: list[Annotation] = []
+        modifiers: set[str] = set()
+        while True:
+            tok = self.peek()
+            if tok == "@" and self.peek(1) != "interface":
+                annotations.append(self.annotation())
+            elif tok in _MODIFIERS:
+                modifiers.add(self.next())
+            elif tok == "non" and self.peek(1) == "-" and self.peek(2) == "sealed":
+                self.next(), self.next(), self.next()
+                modifiers.add("non-sealed")
+            else:
+                return annotations, modifiers
+
+    def annotation(self) -> Annotation:
+        self.expect("@")
+        name = self.qualified_name().rsplit(".", 1)[-1]
+        if self.peek() != "(":
+            return Annotation(name)
+        self.next()
+        if self.peek() == ")":
+            self.next()
+            return Annotation(name)
+        if self.peek_kind() == "id" and self.peek(1) == "=":
+            pairs = []
+            while True:
+                key = self.ident()
+                self.expect("=")
+                pairs.append(ElementValuePair(key, self.element_value()))
+                if self.peek() == ",":
+                    self.next()
+                    continue
+                break
+            self.expect(")")
+            return Annotation(name, pairs)
+        value = self.element_value()
+        self.expect(")")
+        return Annotation(name, value)
+
+    def element_value(self) -> Any:
+        tok = self.peek()
+        if tok == "@":
+            return self.annotation()
+        if tok == "{":
+            self.next()
+            values = []
+            while self.peek() != "}":
+                values.append(self.element_value())
+                if self.peek() == ",":
+                    self.next()
+            self.next()
+            return ElementArrayValue(values)
+        start = self.pos
+        kind = self.peek_kind()
+        if kind in ("str", "num") or tok in ("true", "false", "null"):
+            self.next()
+            if self.peek() in (",", ")", "}"):
+                return Literal(tok)
+        elif kind == "id":
+            name = self.qualified_name()
+            if self.peek() in (",", ")", "}"):
+                qualifier, _, member = name.rpartition(".")
+                return MemberReference(qualifier, member)
+        # 연산식 등: 원문만 보관 (javalang에서도 Literal이 아니므로 값 추출 대상 아님)
+        self.skip_until({",", ")", "}"})
+        return Expression(self.text[start:self.pos].strip())
+
+    # -- 타입 --
+
+    def type_ref(self) -> ReferenceType:
+        while self.peek() == "@":  # 타입 애너테이션 (@NonNull String)
+            self.annotation()
+        parts = [self.ident()]
+        arguments = None
+        while True:
+            if self.peek() == "<":
+                arguments = self.type_arguments()
+            if self.peek() == "." and self.peek_kind(1) == "id":
+                self.next()
+                parts.append(self.ident())
+                arguments = None
+                continue
+            break
+        dims = 0
+        while self.peek() == "[" and self.peek(1) == "]":
+            self.next(), self.next()
+            dims += 1
+        return ReferenceType(parts[-1], arguments, dims, ".".join(parts))
+
+    def type_arguments(self) -> list[TypeArgument]:
+        self.expect("<")
+        args: list[TypeArgument] = []
+        while self.peek() != ">":
+            if self.peek() == "?":
+                self.next()
+                if self.peek() in ("extends", "super"):
+                    bound = self.next()
+                    args.append(TypeArgument(self.type_ref(), bound))
+                else:
+                    args.append(TypeArgument(None, "?"))
+            else:
+                args.append(TypeArgument(self.type_ref()))
+            if self.peek() == ",":
+                self.next()
+            elif self.peek() != ">":
+                raise JavaLiteError(f"unexpected {self.peek()!r} in type arguments")
+        self.next()
+        return args
+
+    def skip_type_parameters(self) -> None:
+        self.expect("<")
+        depth = 1
+        while depth:
+            tok = self.next()
+            if tok == "<":
+                depth += 1
+            elif tok == ">":
+                depth -= 1
+
+    # -- 선언 --
+
+    def type_declaration(self, annotations: list[Annotation], modifiers: set[str]) -> TypeDeclaration:
+        tok = self.next()
+        if tok == "@":
+            self.expect("interface")
+            kind = "annotation"
+        elif tok in _TYPE_KINDS:
+            kind = tok
+        else:
+            raise JavaLiteError(f"expected type declaration, got {tok!r}")
+        decl = TypeDeclaration(kind, self.ident(), annotations, modifiers)
+        # 헤더 (타입 파라미터, record 컴포넌트, extends/implements/permits)는 건너뜀
+        self.skip_until({"{"})
+        self.expect("{")
+        if kind == "enum":
+            self.skip_until({";", "}"})
+            if self.peek() == ";":
+                self.next()
+        self.class_body(decl)
+        return decl
+
+    def class_body(self, decl: TypeDeclaration) -> None:
+        while True:
+            tok = self.peek()
+            if tok == "}":
+                self.next()
+                return
+            if tok == ";":
+                self.next()
+                continue
+            annotations, modifiers = self.modifiers()
+            tok = self.peek()
+            if tok == "{":  # 초기화 블록
+                self.skip_block()
+                continue
+            if tok in _TYPE_KINDS and self.peek_kind(1) == "id" or (tok == "@" and self.peek(1) == "interface"):
+                decl.types.append(self.type_declaration(annotations, modifiers))
+                continue
+            if tok == "<":
+                self.skip_type_parameters()
+            if self.peek_kind() == "id" and self.peek(1) == "(":  # 생성자
+                name = self.next()
+                self.method_rest(decl, name, annotations, modifiers, None)
+                continue
+            if decl.kind == "record" and self.peek_kind() == "id" and self.peek(1) == "{":  # compact 생성자
+                self.next()
+                self.skip_block()
+                continue
+            type_ = self.type_ref()
+            name = self.ident()
+            if self.peek() == "(":
+                return_type = None if type_.name == "void" and not type_.dimensions else type_
+                self.method_rest(decl, name, annotations, modifiers, return_type)
+            else:
+                self.field_rest(decl, name, annotations, modifiers, type_)
+
+    def method_rest(
+        self,
+        decl: TypeDeclaration,
+        name: str,
+        annotations: list[Annotation],
+        modifiers: set[str],
+        return_type: ReferenceType | None,
+    ) -> None:
+        params = self.parameters()
+        while self.peek() == "[":  # 구식 배열 반환 int foo()[]
+            self.next(), self.expect("]")
+        tok = self.skip_until({"{", ";"})  # throws / default 값
+        if tok == "{":
+            self.skip_block()
+        else:
+            self.next()
+        decl.methods.append(MethodDeclaration(name, annotations, modifiers, return_type, params))
+
+    def parameters(self) -> list[FormalParameter]:
+        self.expect("(")
+        params: list[FormalParameter] = []
+        while self.peek() != ")":
+            annotations, modifiers = self.modifiers()
+            type_ = self.type_ref()
+            varargs = False
+            if self.peek() == "...":
+                self.next()
+                varargs = True
+            if self.peek() == "this":  # receiver parameter
+                self.next()
+                name = "this"
+            else:
+                name = self.ident()
+            while self.peek() == "[":
+                self.next(), self.expect("]")
+            params.append(FormalParameter(annotations, modifiers, type_, name, varargs))
+            if self.peek() == ",":
+                self.next()
+            elif self.peek() != ")":
+                raise JavaLiteError(f"unexpected {self.peek()!r} in parameters")
+        self.next()
+        return params
+
+    def field_rest(
+        self,
+        decl: TypeDeclaration,
+        name: str,
+        annotations: list[Annotation],
+        modifiers: set[str],
+        type_: ReferenceType,
+    ) -> None:
+        declarators = [VariableDeclarator(name)]
+        while True:
+            while self.peek() == "[":  # int a[]
+                self.next(), self.expect("]")
+            tok = self.peek()
+            if tok == "=":
+                self.next()
+                if self.peek_kind() == "str" and self.peek(1) in (";", ","):
+                    declarators[-1].initializer = Literal(self.next())
+                else:
+                    self._skip_initializer()
+                tok = self.peek()
+            if tok == ";":
+                self.next()
+                break
+            if tok == ",":
+                self.next()
+                declarators.append(VariableDeclarator(self.ident()))
+                continue
+            raise JavaLiteError(f"unexpected {tok!r} in field declaration")
+        decl.fields.append(FieldDeclaration(annotations, modifiers, type_, declarators))
+
+    def _skip_initializer(self) -> None:
+        # 깊이 0의 ','는 "식별자 다음에 = , ; [" 일 때만 다음 선언자 (new HashMap<K, V>() 의 ',' 구분)
+        while True:
+            tok = self.skip_until({";", ","})
+            if tok == ";":
+                return
+            if self.peek_kind(1) == "id" and self.peek(2) in ("=", ",", ";", "["):
+                return
+            self.next()
+
+
+def parse(text: str) -> CompilationUnit:
+    """Java 소스의 선언부를 추출한다. 해석할 수 없으면 JavaLiteError."""
+    return _Parser(text).compilation_unit()
@@ -1,11 +1,17 @@
 from __future__ import annotations
 from pathlib import Path
+import logging
 import re
 import javalang
 
+from erd_agent.config import settings
 from erd_agent.model import Schema, Column, Ref
+from erd_agent.normalize import merge_schemas
+from erd_agent.parsers import java_lite
 from erd_agent.parsers.base import Parser
 
+logger = logging.getLogger(__name__)
+
 def camel_to_snake(name: str) -> str:
     s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
@@ -27,6 +33,49 @@ JAVA_TYPE_MAP = {
 
 COLLECTION_TYPES = {"List", "Set", "Collection", "Iterable"}
 
+# 추출 규칙(컬럼/Ref 생성 로직)을 바꾸면 올린다 — 파싱 캐시(parse_cache) 키에 포함됨
+PARSER_VERSION = "4"
+
+
+def _package_name(tree) -> str | None:
+    package = getattr(tree, "package", None)
+    return getattr(package, "name", package)  # java_lite: 문자열, javalang: PackageDeclaration
+
+
+def type_candidates(name: str, package: str | None, imports) -> list[str]:
+    """
+    파일 안에서 쓴 타입 이름이 가리킬 수 있는 정규 클래스명 후보 (Java 이름 해석 순서).
+    - 이미 정규 이름(a.b.User)이면 그대로
+    - 단일 타입 import(import a.b.User;)가 있으면 그것 하나로 확정
+    - 아니면 같은 패키지 → on-demand import(import a.b.*;) 순
+    """
+    if "." in name:
+        return [name]
+    on_demand = []
+    for imp in imports or []:
+        if imp.static:
+            continue
+        if imp.wildcard:
+            on_demand.append(f"{imp.path}.{name}")
+        elif imp.path.rsplit(".", 1)[-1] == name:
+            return [imp.path]
+    return [f"{package}.{name}" if package else name, *on_demand]
+
+
+def parse_java(text: str, path: Path | None = None):
+    """
+    선언부 AST. 경량 추출기(java_lite)를 먼저 쓰고, 해석하지 못하면 javalang으로 대체한다.
+    둘 다 실패하면 None (경고 로그).
+    """
+    try:
+        return java_lite.parse(text)
+    except java_lite.JavaLiteError as lite_exc:
+        try:
+            return javalang.parse.parse(text)
+        except Exception as exc:
+            logger.warning("Java 파싱 실패 %s: lite=%s, javalang=%s", path or "<text>", lite_exc, exc)
+            return None
+
 class JPAJavaParser(Parser):
     def can_parse(self, path: Path, text: str) -> bool:
         # 스캐너가 이미 @Entity 중심으로 후보를 만들어주지만,
@@ -34,11 +83,13 @@ class JPAJavaParser(Parser):
         return path.suffix.lower() == ".java" and "@Entity" in text
 
     def parse(self, path: Path, text: str, schema: Schema) -> None:
-        try:
-            tree = javalang.parse.parse(text)
-        except Exception:
+        tree = parse_java(text, path)
+        if tree is None:
             return
 
+        package = _package_name(tree)
+        imports = getattr(tree, "imports", None) or []
+
         for t in getattr(tree, "types", []) or []:
             if not hasattr(t, "annotations"):
                 continue
@@ -51,6 +102,8 @@ class JPAJavaParser(Parser):
 
             table_name = self._resolve_table_name(t)
             table = schema.ensure_table(table_name)
+            # 서로 다른 패키지/모듈의 같은 이름 엔티티를 구분하도록 정규 클래스명으로 등록
+            schema.entity_tables[type_candidates(t.name, package, [])[0]] = table_name
 
             for field in getattr(t, "fields", []) or []:
                 anns = {a.name: a for a in (field.annotations or [])}
@@ -71,12 +124,15 @@ class JPAJavaParser(Parser):
                                 nullable=True
                             )
 
+                        # 부모의 @Table 이름/PK는 다른 파일에 있으므로 merge_schemas에서 parent_entity로 해석
                         parent_table = camel_to_snake(raw_type)
                         schema.refs.append(Ref(
                             child_table=table_name,
                             child_column=fk_col_name,
                             parent_table=parent_table,
                             parent_column="id",
+                            parent_entity=raw_type,
+                            parent_candidates=type_candidates(raw_type, package, imports),
                             rel=">"  # many-to-one 기준 [3](https://docs.oracle.com/en/java/javase/24/docs/api/java.base/java/lang/classfile/AnnotationElement.html)[4](https://jastadd.cs.lth.se/releases/extendj/8.0.1/doc/org/extendj/ast/ElementValuePair.html)
                         ))
                         continue
@@ -92,8 +148,14 @@ class JPAJavaParser(Parser):
                             if inv_col not in jt_table.columns:
                                 jt_table.columns[inv_col] = Column(inv_col, "bigint", nullable=False)
 
-                            schema.refs.append(Ref(join_table, join_col, table_name, "id", ">"))
-                            schema.refs.append(Ref(join_table, inv_col, camel_to_snake(raw_type), "id", ">"))
+                            schema.refs.append(Ref(
+                                join_table, join_col, table_name, "id", ">", t.name,
+                                type_candidates(t.name, package, []),
+                            ))
+                            schema.refs.append(Ref(
+                                join_table, inv_col, camel_to_snake(raw_type), "id", ">", raw_type,
+                                type_candidates(raw_type, package, imports),
+                            ))
                         continue
 
                     if "OneToMany" in anns:
@@ -214,4 +276,48 @@ class JPAJavaParser(Parser):
         s = getattr(node, "value", None)
         if s is None:
             return None
-        return s.strip("\"'")
\ No newline at end of file
+        return s.strip("\"'")
+
+
+def parse_entity_fragment(item: tuple[str, str]) -> Schema:
+    """
+    (경로, 본문) 하나를 독립된 스키마 조각으로 파싱한다.
+    다른 파일 결과에 의존하지 않으므로 프로세스 풀 워커에서 그대로 실행할 수 있다.
+    """
+    path, text = item
+    fragment = Schema()
+    parser = JPAJavaParser()
+    if parser.can_parse(Path(path), text):
+        parser.parse(Path(path), text, fragment)
+    return fragment
+
+
+def parse_entities(items: list[tuple[Path, str]]) -> Schema:
+    """
+    엔티티 파일들을 조각 단위로 파싱해 merge_schemas로 합친다.
+    - 본문 해시 + PARSER_VERSION으로 파싱 캐시를 조회해 새로 생기거나 바뀐 파일만 파싱
+    - 파싱할 파일 수가 ERD_PARALLEL_MIN_FILES 이상이면 프로세스 풀(SCAN_WORKERS)로 분산
+      (scan_pool의 forkserver 워커 — 에이전트 스레드가 도는 호스트 프로세스를 fork하지 않는다)
+    조각은 경로 순으로 합치므로 캐시/병렬 여부와 관계없이 결과가 같다.
+    """
+    from erd_agent.parse_cache import fragment_key, get_parse_cache
+    from erd_agent.scan_pool import map_cpu, scan_workers
+
+    jobs = sorted((str(p), text) for p, text in items)
+    keys = [fragment_key(PARSER_VERSION, text) for _, text in jobs]
+    cache = get_parse_cache()
+    fragments: dict[str, Schema] = cache.get_many(keys) if cache is not None else {}
+
+    todo = {key: job for key, job in zip(keys, jobs) if key not in fragments}
+    if todo:
+        pending = list(todo.values())
+        if scan_workers() > 1 and len(pending) >= settings.erd_parallel_min_files:
+            parsed = map_cpu(parse_entity_fragment, pending)
+        else:
+            parsed = [parse_entity_fragment(job) for job in pending]
+        new = dict(zip(todo, parsed))
+        if cache is not None:
+            cache.put_many(new)
+        fragments.update(new)
+
+    return merge_schemas(fragments[key] for key in keys)
@@ -0,0 +1,137 @@
+"""
+바이트 단위 다중 패턴 분류기 (스캐너 공용).
+
+파일을 str로 디코딩한 뒤 정규식 4~5개를 따로 돌리는 대신, 원본 바이트(mmap) 위에서
+  - @Entity / @Table / Controller 계열 / 아키텍처 힌트 / @Embeddable 애너테이션: 결합 정규식 한 번
+  - enum / class / record / interface 타입 선언: 키워드 리터럴 검색
+으로 모든 분류 신호를 만든다. (scripts/bench_scan.py로 처리량 측정)
+
+UTF-8 식별자는 0x80 이상 바이트를 단어 문자로 취급해 처리하고, 디코딩은 파일이 실제로
+선택된 경우(호출 측)에만 한다. 각 스캐너의 str 정규식(ENTITY_ANN_RE 등)과 같은 판정을 낸다.
+"""
+from __future__ import annotations
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+# 이보다 작은 파일은 mmap 대신 read() (작은 파일은 매핑 비용이 더 큼)
+MMAP_MIN_BYTES = 64 * 1024
+
+# @Embeddable 뒤 이 거리(바이트) 이내의 첫 class/record를 embeddable로 본다 (find_type_declarations와 동일)
+_EMBEDDABLE_WINDOW = 300
+
+_WORD = rb"[\w\x80-\xff]"
+
+_ENTITY, _TABLE, _CONTROLLER, _ARCH, _EMBEDDABLE = 1, 2, 4, 8, 16
+
+
+@dataclass(frozen=True)
+class FileSignals:
+    entity_ann: bool
+    table_ann: bool
+    controller_ann: bool
+    arch_hint: bool
+    # (타입명, kind, @Embeddable 여부)
+    decls: tuple[tuple[str, str, bool], ...] = ()
+
+
+@lru_cache(maxsize=1)
+def _matcher() -> tuple[re.Pattern, dict[bytes, int]]:
+    # 애너테이션 목록은 각 스캐너 정의를 그대로 사용 (에이전트 패키지 순환 참조를 피해 지연 import)
+    from api_agent.scanner import CONTROLLER_ANNOTATIONS
+    from arch_agent.scanner import ARCH_ANNOTATIONS
+
+    flags: dict[bytes, int] = {b"Entity": _ENTITY, b"Table": _TABLE, b"Embeddable": _EMBEDDABLE}
+    for name in CONTROLLER_ANNOTATIONS:
+        flags[name.encode()] = flags.get(name.encode(), 0) | _CONTROLLER
+    for name in ARCH_ANNOTATIONS:
+        flags[name.encode()] = flags.get(name.encode(), 0) | _ARCH
+
+    words = b"|".join(sorted(flags, key=len, reverse=True))
+    return re.compile(rb"@\s*(" + words + rb")\b"), flags
+
+
+# 타입 선언은 키워드별 리터럴 접두 정규식으로 찾는다. 하나의 alternation으로 묶으면 re가
+# 리터럴 접두 검색(memchr)을 쓰지 못해 훨씬 느려진다. 앞 경계(\b)는 매치 후 직접 확인.
+_DECL_RES = tuple(
+    (kind, re.compile(kind.encode() + rb"\s+([A-Z]" + _WORD + rb"*)"))
+    for kind in ("enum", "class", "record", "interface")
+)
+
+
+def _is_word_byte(b: int) -> bool:
+    return b >= 0x80 or b == 0x5F or 0x30 <= b <= 0x39 or 0x41 <= b <= 0x5A or 0x61 <= b <= 0x7A
+
+
+def classify_bytes(data) -> FileSignals:
+    """
+    bytes / mmap에서 분류 신호를 계산한다.
+    애너테이션 플래그는 결합 정규식 한 번으로, 타입 선언은 키워드 리터럴 검색으로 추출한다.
+    """
+    pattern, flags = _matcher()
+    seen = 0
+    embeddable_ends: list[int] = []
+    for m in pattern.finditer(data):
+        flag = flags[m.group(1)]
+        if flag & _EMBEDDABLE:
+            embeddable_ends.append(m.end())
+        seen |= flag
+
+    found: list[tuple[int, str, bytes]] = []
+    for kind, rx in _DECL_RES:
+        for m in rx.finditer(data):
+            start = m.start()
+            if start and _is_word_byte(data[start - 1]):
+                continue
+            found.append((start, kind, m.group(1)))
+    found.sort()
+
+    decls: list[tuple[str, str, bool]] = []
+    for start, kind, name in found:
+        embeddable = False
+        if embeddable_ends and kind in ("class", "record"):
+            # find_type_declarations와 동일: 앞선 @Embeddable은 다음 class/record 하나에만 적용
+            pending = [end for end in embeddable_ends if end <= start]
+            if pending:
+                embeddable = any(start - end <= _EMBEDDABLE_WINDOW for end in pending)
+                embeddable_ends = [end for end in embeddable_ends if end > start]
+        decls.append((name.decode("utf-8", errors="ignore"), kind, embeddable))
+    return FileSignals(
+        entity_ann=bool(seen & _ENTITY),
+        table_ann=bool(seen & _TABLE),
+        controller_ann=bool(seen & _CONTROLLER),
+        arch_hint=bool(seen & _ARCH),
+        decls=tuple(decls),
+    )
+
+
+def classify_text(text: str) -> FileSignals:
+    return classify_bytes(text.encode("utf-8"))
+
+
+@contextmanager
+def map_file(path: Path | str) -> Iterator[bytes | mmap.mmap]:
+    """
+    파일 본문 버퍼. 큰 파일은 읽기 전용 mmap, 작은 파일은 bytes.
+    버퍼는 with 블록 안에서만 유효하다.
+    """
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size < MMAP_MIN_BYTES:
+            yield fh.read()
+            return
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+def decode(buf) -> str:
+    """선택된 파일만 str로 디코딩 (bytes / mmap 공용)."""
+    return (buf if isinstance(buf, bytes) else buf[:]).decode("utf-8", errors="ignore")
@@ -1,19 +1,62 @@
 from __future__ import annotations
 
+import fnmatch
 import hashlib
+import json
+import logging
+import os
 import shutil
-import tempfile
+import socket
+import subprocess
+import threading
+import time
+import uuid
 import zipfile
-from pathlib import Path
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote, urlparse
 from urllib.request import Request, urlopen
 import re
 
-from erd_agent.config import settings
+from erd_agent.config import settings, writable_cache_root
 
 
 _GH_RE = re.compile(r"^https?://github\.com/([^/]+)/([^/]+)(?:/|$)")
 
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+_COPY_CHUNK = 1024 * 1024
+
+# 캐시 항목(디렉터리/zip)별 커밋 SHA·마지막 사용 시각·크기를 기록하는 파일 (cache_root 바로 아래)
+_MANIFEST_NAME = "repo-manifest.json"
+_MANIFEST_LOCK_NAME = "repo-manifest.lock"
+
+# 어느 깊이에서든 건너뛰는 디렉터리 — VCS/IDE/의존성 캐시 (소스 패키지 이름으로 쓰이지 않음)
+_SKIP_DIR_NAMES = {
+    ".git", "node_modules", "bower_components", ".gradle", ".idea", ".vscode",
+    "__pycache__", ".venv", "venv",
+}
+# 빌드 산출물/벤더 디렉터리 — 레포 루트나 빌드 파일 옆(모듈 디렉터리)에 있을 때만 건너뛴다.
+# src/ 아래에서는 Java 패키지(com.shop.vendor, ...build 등)일 수 있으므로 건너뛰지 않는다.
+_OUTPUT_DIR_NAMES = {"vendor", "target", "build", "dist", "out"}
+# 이 파일이 있는 디렉터리를 모듈 디렉터리로 본다
+BUILD_MARKER_FILES = {
+    "pom.xml", "build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts",
+    "package.json", "go.mod", "composer.json", "Cargo.toml",
+}
+_SKIP_EXTS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".svg", ".webp", ".tif", ".tiff", ".psd",
+    ".pdf", ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx",
+    ".jar", ".war", ".ear", ".class", ".so", ".dll", ".dylib", ".exe", ".bin", ".o", ".a", ".pyc",
+    ".zip", ".tar", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+    ".mp3", ".mp4", ".mov", ".avi", ".wav", ".ogg", ".webm",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot",
+}
+
 
 def is_git_url(s: str) -> bool:
     return s.startswith("http://") or s.startswith("https://") or s.endswith(".git")
@@ -28,112 +71,610 @@ def _safe_repo_dir(url: str) -> str:
     return f"{name}-{h}"
 
 
-def _writable_cache_root() -> Path:
-    """
-    Azure Functions Linux에서 /home/site/wwwroot 는 read-only일 수 있으니
-    cache_dir가 상대경로/점(.) 시작이면 /tmp 아래로 강제한다. [1](https://www.hubsite365.com/en-ww/crm-pages/build-a-custom-api-connector-from-scratch-in-copilot-studio-bbae2a51-393b-498f-9ef4-b6d5a41cb6ee.htm)[2](https://www.youtube.com/watch?v=72YcqlrIM84)
-    """
-    raw = str(settings.cache_dir) if getattr(settings, "cache_dir", None) else ".cache"
-    p = Path(raw)
-
-    # '.cache' 또는 상대 경로면 /tmp 밑으로
-    if raw.startswith(".") or not p.is_absolute():
-        return Path(tempfile.gettempdir()) / "doc-agent-cache"
-    return p
-
-
-def _github_zip_url(repo_url: str, ref: str) -> str:
-    """
-    GitHub 공식 소스 아카이브 URL 패턴 사용 [3](https://learn.microsoft.com/en-us/microsoft-copilot-studio/configure-enduser-authentication)
-    """
+def _github_owner_repo(repo_url: str) -> tuple[str, str]:
     m = _GH_RE.match(repo_url.strip())
     if not m:
         raise ValueError("Not a GitHub repository URL")
     owner, repo = m.group(1), m.group(2)
     if repo.endswith(".git"):
         repo = repo[:-4]
-    return f"https://github.com/{owner}/{repo}/archive/refs/heads/{ref}.zip"
+    return owner, repo
 
 
-def _download(url: str, dest: Path, token: str | None = None) -> None:
-    headers = {"User-Agent": "doc-agent-azure-functions", "Accept": "application/octet-stream"}
+def _github_zip_url(repo_url: str, ref: str) -> str:
+    """
+    GitHub 공식 소스 아카이브 URL 패턴 사용 [3](https://learn.microsoft.com/en-us/microsoft-copilot-studio/configure-enduser-authentication)
+    ref는 브랜치/태그/커밋 SHA 또는 HEAD(기본 브랜치) 모두 가능.
+    """
+    owner, repo = _github_owner_repo(repo_url)
+    return f"https://github.com/{owner}/{repo}/archive/{quote(ref, safe='/')}.zip"
+
+
+def _auth_headers(token: str | None) -> dict[str, str]:
+    headers = {"User-Agent": "doc-agent-azure-functions"}
     if token:
         # PAT / fine-grained token 이면 보통 Authorization 헤더로 접근
         headers["Authorization"] = f"token {token}"
-    req = Request(url, headers=headers)
-    with urlopen(req, timeout=60) as resp:
-        dest.write_bytes(resp.read())
+    return headers
 
 
-def _extract_zip(zip_path: Path, dest_dir: Path) -> Path:
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        zf.extractall(dest_dir)
+def _clone_url(repo: str) -> str:
+    if getattr(settings, "github_token", None) and repo.startswith("https://") and "@" not in repo:
+        return repo.replace("https://", f"https://{settings.github_token}@")
+    return repo
+
+
+@dataclass(frozen=True)
+class ResolvedRef:
+    """요청한 ref(None이면 기본 브랜치)가 가리키는 커밋 SHA와, 다음 조건부 요청에 쓸 ETag."""
+    ref: str | None
+    sha: str
+    etag: str | None = None
 
-    # GitHub zip은 보통 최상위 폴더 1개 생성 (repo-ref 형태)
-    subdirs = [p for p in dest_dir.iterdir() if p.is_dir()]
-    return subdirs[0] if len(subdirs) == 1 else dest_dir
 
+@dataclass(frozen=True)
+class PreparedRepo:
+    """prepare 결과: 분석할 경로(디렉터리 또는 zip)와 고정된 커밋 SHA (로컬 경로/확인 실패 시 None)."""
+    path: Path
+    ref: str | None = None
+    sha: str | None = None
 
-def prepare_repo(repo: str) -> Path:
+
+def _github_resolve_ref(repo_url: str, ref: str | None, cached: dict | None) -> ResolvedRef | None:
     """
-    repo가 로컬 경로면 그대로 반환.
-    URL이면 cache_dir 아래로 다운로드/압축해제 후 경로 반환.
-    - GitHub URL: zip 다운로드(권장, git 불필요)
-    - 기타 git URL: git이 PATH에 있을 때만 clone 시도, 없으면 에러
+    GitHub commits API로 ref → SHA 조회 (ref=None이면 HEAD = 기본 브랜치).
+    vnd.github.sha 형식이라 응답 본문은 SHA 40자뿐이고, 이전 ETag로 조건부 요청하여
+    변경이 없으면 304 (본문 없음, rate limit 미차감). API 주소는 GITHUB_API_URL로 교체 가능.
     """
-    p = Path(repo).expanduser()
-    if p.exists():
-        return p.resolve()
+    owner, repo = _github_owner_repo(repo_url)
+    headers = {**_auth_headers(getattr(settings, "github_token", None)), "Accept": "application/vnd.github.sha"}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    api = settings.github_api_url.rstrip("/")
+    req = Request(f"{api}/repos/{owner}/{repo}/commits/{quote(ref or 'HEAD', safe='/')}", headers=headers)
+    try:
+        with urlopen(req, timeout=10) as resp:
+            sha = resp.read().decode("ascii", errors="ignore").strip()
+            etag = resp.headers.get("ETag")
+    except HTTPError as e:
+        if e.code == 304 and cached and cached.get("sha"):
+            return ResolvedRef(ref, cached["sha"], cached.get("etag"))
+        return None
+    except (URLError, OSError):
+        return None
+    return ResolvedRef(ref, sha, etag) if _SHA_RE.match(sha) else None
+
+
+def _git_resolve_ref(repo: str, ref: str | None) -> ResolvedRef | None:
+    """git ls-remote로 ref → SHA 조회. 브랜치 → 태그(annotated면 가리키는 커밋) → 정확한 이름 순으로 매칭."""
+    if not shutil.which("git"):
+        return None
+    try:
+        out = subprocess.run(
+            # annotated 태그는 "<ref>^{}" 패턴을 함께 줘야 가리키는 커밋(peeled) 줄이 나온다
+            ["git", "ls-remote", _clone_url(repo), *((ref, f"{ref}^{{}}") if ref else ("HEAD",))],
+            check=True, capture_output=True, text=True, timeout=30,
+        ).stdout
+    except (subprocess.SubprocessError, OSError):
+        return None
+    refs = {}
+    for line in out.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and _SHA_RE.match(parts[0]):
+            refs[parts[1]] = parts[0]
+    name = ref or "HEAD"
+    for candidate in (f"refs/heads/{name}", f"refs/tags/{name}^{{}}", f"refs/tags/{name}", name):
+        if candidate in refs:
+            return ResolvedRef(ref, refs[candidate])
+    return None
+
+
+def resolve_ref(repo: str, ref: str | None = None, cached: dict | None = None) -> ResolvedRef | None:
+    """
+    원격 repo의 ref(브랜치/태그/커밋 SHA, None이면 기본 브랜치)를 커밋 SHA로 고정한다.
+    - 40자 SHA면 네트워크 요청 없이 그대로 사용
+    - GitHub: commits API (cached의 ETag로 조건부 요청)
+    - 기타 git URL: git ls-remote
+    네트워크/권한 문제나 존재하지 않는 ref로 확인할 수 없으면 None.
+    """
+    if ref and _SHA_RE.match(ref):
+        return ResolvedRef(ref, ref)
+    if _GH_RE.match(repo):
+        return _github_resolve_ref(repo, ref, cached)
+    return _git_resolve_ref(repo, ref)
 
-    if not is_git_url(repo):
-        raise ValueError("repo는 로컬 경로 또는 https git URL 이어야 합니다.")
 
-    cache_root = _writable_cache_root()
-    cache_root.mkdir(parents=True, exist_ok=True)
-    target = cache_root / _safe_repo_dir(repo)
+def _break_stale_lock(lock_path: Path, stale_after: float) -> None:
+    """
+    mtime이 stale_after 이상 갱신되지 않은 lock(보유 프로세스가 죽은 경우)을 제거.
+    다른 대기자와 동시에 치우더라도 새 lock을 지우지 않도록 고유 이름으로 rename 후 다시 확인한다.
+    """
+    grave = lock_path.with_name(f"{lock_path.name}.stale-{uuid.uuid4().hex[:8]}")
+    try:
+        os.rename(lock_path, grave)
+    except OSError:
+        return
+    try:
+        fresh = time.time() - grave.stat().st_mtime <= stale_after
+    except OSError:
+        return
+    if fresh:
+        # 그 사이 다른 요청이 새로 잡은 lock이었다면 되돌려 놓는다 (이미 또 생겼으면 link 실패 → 그쪽 우선)
+        try:
+            os.link(grave, lock_path)
+        except OSError:
+            pass
+    grave.unlink(missing_ok=True)
+
+
+@contextmanager
+def _file_lock(lock_path: Path, timeout: float, stale_after: float) -> Iterator[None]:
+    """
+    O_CREAT|O_EXCL로 만든 lock 파일 기반의 프로세스/스레드 간 배타 잠금.
+    - 보유 중에는 heartbeat 스레드가 mtime을 주기적으로 갱신
+    - mtime이 stale_after 이상 멈춘 lock은 죽은 보유자가 남긴 것으로 보고 회수
+    - timeout 안에 잡지 못하면 TimeoutError
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            pass
+        try:
+            age = time.time() - lock_path.stat().st_mtime
+        except FileNotFoundError:
+            continue  # 보유자가 방금 풀었음 → 바로 재시도
+        if age > stale_after:
+            _break_stale_lock(lock_path, stale_after)
+            continue
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"lock 대기 시간 초과 ({timeout:.0f}s): {lock_path}")
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+    with os.fdopen(fd, "w") as fh:
+        fh.write(f"{socket.gethostname()} {os.getpid()} {threading.get_ident()}\n")
+
+    stop = threading.Event()
+
+    def _heartbeat() -> None:
+        while not stop.wait(stale_after / 4):
+            try:
+                os.utime(lock_path)
+            except OSError:
+                return
+
+    beat = threading.Thread(target=_heartbeat, name=f"lock-heartbeat:{lock_path.name}", daemon=True)
+    beat.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        beat.join()
+        lock_path.unlink(missing_ok=True)
+
+
+@contextmanager
+def _manifest(cache_root: Path) -> Iterator[dict]:
+    """
+    캐시 매니페스트를 읽어 수정하게 하고, 블록이 끝나면 원자적으로 다시 쓴다.
+    {"heads": {repo_url: {sha, etag, checked_at}}, "entries": {캐시 항목 이름: {repo, sha, bytes, last_access}}}
+    """
+    path = cache_root / _MANIFEST_NAME
+    # 같은 캐시 디렉터리를 쓰는 여러 워커 프로세스가 갱신을 잃지 않도록 파일 lock으로 직렬화
+    with _file_lock(cache_root / _MANIFEST_LOCK_NAME, timeout=60, stale_after=settings.repo_lock_stale_after):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        data.setdefault("heads", {})
+        data.setdefault("entries", {})
+        yield data
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+        tmp.replace(path)
+
+
+def _path_bytes(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for fn in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, fn)).st_size
+            except OSError:
+                continue
+    return total
 
-    # 이미 풀려 있으면 그대로 재사용
-    if target.exists():
-        return target.resolve()
 
-    # GitHub URL이면 zip 다운로드
-    if _GH_RE.match(repo):
-        work = Path(tempfile.mkdtemp(prefix="repozip_"))
-        zip_path = work / "repo.zip"
+def _remove_path(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
 
-        token = getattr(settings, "github_token", None)
 
-        # main → master 순서로 시도 (조직 repo에 따라 기본 브랜치 다름)
-        last_err = None
-        for ref in ("main", "master"):
-            try:
-                url = _github_zip_url(repo, ref=ref)
-                _download(url, zip_path, token=token)
-                src_root = _extract_zip(zip_path, work / "src")
-
-                # target에 이동(atomic하게 하려고 먼저 임시 디렉터리 사용)
-                tmp_target = cache_root / (target.name + ".tmp")
-                if tmp_target.exists():
-                    shutil.rmtree(tmp_target, ignore_errors=True)
-                shutil.copytree(src_root, tmp_target)
-
-                tmp_target.replace(target)
-                return target.resolve()
-            except Exception as e:
-                last_err = e
+def _touch_entry(cache_root: Path, path: Path, repo: str, sha: str | None) -> bool:
+    """
+    캐시 항목 재사용 시 마지막 사용 시각 갱신 (매니페스트에 없던 항목이면 등록).
+    매니페스트 lock 안에서 존재를 다시 확인하므로, 그 사이 LRU로 지워졌으면 False (→ 다시 받는다).
+    """
+    with _manifest(cache_root) as m:
+        if not path.exists():
+            m["entries"].pop(path.name, None)
+            return False
+        entry = m["entries"].get(path.name)
+        if entry is None:
+            entry = {"repo": repo, "sha": sha, "bytes": _path_bytes(path)}
+            m["entries"][path.name] = entry
+        entry["last_access"] = time.time()
+    return True
+
+
+def _entry_lock(cache_root: Path, name: str) -> Path:
+    """캐시 항목의 다운로드 lock 경로 (같은 커밋의 디렉터리와 zip은 lock을 공유)."""
+    return cache_root / f"{name.removesuffix('.zip')}.lock"
+
+
+def _evict_entry(cache_root: Path, name: str) -> bool:
+    """
+    항목의 다운로드 lock(<name>.lock)을 기다리지 않고 잡아 본 뒤 삭제한다.
+    다른 요청이 받는 중이면(lock 보유) 건드리지 않고 False.
+    """
+    try:
+        with _file_lock(_entry_lock(cache_root, name), timeout=0, stale_after=settings.repo_lock_stale_after):
+            _remove_path(cache_root / name)
+    except TimeoutError:
+        return False
+    return True
+
+
+def _register_entry(cache_root: Path, path: Path, repo: str, sha: str | None) -> None:
+    """
+    새로 받은 캐시 항목을 등록하고, 전체 용량이 예산을 넘으면 오래 안 쓴 항목부터 삭제(LRU).
+    - REPO_CACHE_EVICT_GRACE 안에 사용된 항목은 다른 요청이 분석 중일 수 있으므로 남긴다
+    - 다운로드 lock이 잡힌 항목(받는 중)도 남긴다
+    """
+    with _manifest(cache_root) as m:
+        entries = m["entries"]
+        entries[path.name] = {"repo": repo, "sha": sha, "bytes": _path_bytes(path), "last_access": time.time()}
+
+        # 디스크에서 사라진 항목 정리
+        for name in [n for n in entries if not (cache_root / n).exists()]:
+            del entries[name]
+
+        total = sum(e.get("bytes", 0) for e in entries.values())
+        budget = settings.repo_cache_max_bytes
+        recent = time.time() - settings.repo_cache_evict_grace
+        for name, entry in sorted(entries.items(), key=lambda kv: kv[1].get("last_access", 0)):
+            if total <= budget:
+                break
+            if name == path.name:
+                continue  # 방금 받은 항목은 예산을 넘더라도 유지
+            if entry.get("last_access", 0) > recent or not _evict_entry(cache_root, name):
                 continue
+            total -= entry.get("bytes", 0)
+            del entries[name]
+
+
+def _download(url: str, dest: Path, token: str | None = None) -> None:
+    headers = {**_auth_headers(token), "Accept": "application/octet-stream"}
+    req = Request(url, headers=headers)
+    # 전체 아카이브를 메모리에 올리지 않고 chunk 단위로 디스크에 기록
+    with urlopen(req, timeout=60) as resp, dest.open("wb") as fh:
+        shutil.copyfileobj(resp, fh, _COPY_CHUNK)
+
+
+def is_skipped_dir(name: str, parents: tuple[str, ...], parent_is_module: bool) -> bool:
+    """
+    레포 순회/압축 해제/선택 다운로드 공용 디렉터리 제외 규칙.
+    parents: 레포 루트 기준 상위 디렉터리 이름들, parent_is_module: 상위 디렉터리에 빌드 파일이 있는지.
+    """
+    if name in _SKIP_DIR_NAMES:
+        return True
+    return name in _OUTPUT_DIR_NAMES and "src" not in parents and (not parents or parent_is_module)
+
+
+def module_dirs(paths: Iterable[str]) -> set[str]:
+    """레포 상대 경로 목록에서 빌드 파일이 있는 디렉터리 (루트는 "")."""
+    dirs: set[str] = set()
+    for rel in paths:
+        p = PurePosixPath(rel)
+        if p.name in BUILD_MARKER_FILES:
+            dirs.add("" if str(p.parent) == "." else p.parent.as_posix())
+    return dirs
+
 
-        raise RuntimeError(f"GitHub zip 다운로드 실패: {last_err}")
+def _want_member(rel: str, modules: set[str]) -> bool:
+    """소스·빌드·설정 파일만 풀도록 바이너리/에셋/벤더·빌드 산출물 디렉터리는 제외."""
+    p = PurePosixPath(rel)
+    parts = p.parts[:-1]
+    for i, name in enumerate(parts):
+        if is_skipped_dir(name, parts[:i], "/".join(parts[:i]) in modules):
+            return False
+    return p.suffix.lower() not in _SKIP_EXTS
 
-    # GitHub가 아닌 git URL: git이 있으면 clone 시도(옵션)
-    if shutil.which("git"):
-        # git이 있으면 subprocess로 clone (GitPython 의존 제거)
-        import subprocess
-        clone_url = repo
-        if getattr(settings, "github_token", None) and repo.startswith("https://") and "@" not in repo:
-            clone_url = repo.replace("https://", f"https://{settings.github_token}@")
 
-        subprocess.run(["git", "clone", "--depth", "1", clone_url, str(target)], check=True)
-        return target.resolve()
+def _extract_zip(zip_path: Path, dest_dir: Path) -> Path:
+    """
+    필요한 멤버만 dest_dir에 바로 푼다.
+    GitHub zip의 최상위 폴더(repo-ref/)는 벗겨내서 dest_dir가 곧 레포 루트가 되게 한다.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    root = dest_dir.resolve()
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        infos = [i for i in zf.infolist() if not i.is_dir()]
+        tops = {i.filename.split("/", 1)[0] for i in infos}
+        prefix = f"{tops.pop()}/" if len(tops) == 1 and all("/" in i.filename for i in infos) else ""
+
+        modules = module_dirs(i.filename[len(prefix):] for i in infos)
+        for info in infos:
+            rel = info.filename[len(prefix):]
+            if not rel or not _want_member(rel, modules):
+                continue
+            out = (root / rel).resolve()
+            if not out.is_relative_to(root):  # zip slip 방지
+                continue
+            out.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as src, out.open("wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_CHUNK)
+    return dest_dir
+
+
+def _commit_dir(tmp_dir: Path, target: Path) -> None:
+    """임시 디렉터리를 target으로 rename. 다른 요청이 먼저 채웠으면 내 것은 버리고 그대로 사용."""
+    try:
+        os.replace(tmp_dir, target)
+    except OSError:
+        if not target.exists():
+            raise
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _fetch_github(repo: str, ref: str, target: Path, archive: Path, materialize: bool) -> Path:
+    """GitHub zip 다운로드 (ref는 가능하면 고정된 커밋 SHA, 확인 실패 시 요청한 ref 또는 HEAD)."""
+    # cache_root 안(같은 파일시스템)의 요청별 임시 슬롯에 받고 rename으로 원자적 교체
+    cache_root = target.parent
+    suffix = uuid.uuid4().hex[:8]
+    tmp_zip = cache_root / f"{target.name}.zip.tmp-{suffix}"
+    tmp_target = cache_root / f"{target.name}.tmp-{suffix}"
+    try:
+        _download(_github_zip_url(repo, ref), tmp_zip, token=getattr(settings, "github_token", None))
+        if not materialize:
+            os.replace(tmp_zip, archive)
+            return archive
+        _extract_zip(tmp_zip, tmp_target)
+        _commit_dir(tmp_target, target)
+        return target
+    except Exception as e:
+        shutil.rmtree(tmp_target, ignore_errors=True)
+        raise RuntimeError(f"GitHub zip 다운로드 실패 (ref={ref}): {e}") from e
+    finally:
+        tmp_zip.unlink(missing_ok=True)
+
+
+def _match_patterns(rel: str, patterns: list[str]) -> bool:
+    """gitignore 스타일 근사: '/'가 없는 패턴은 파일명, 있으면 레포 루트 기준 경로와 비교."""
+    name = rel.rsplit("/", 1)[-1]
+    for pat in patterns:
+        if "/" in pat:
+            if fnmatch.fnmatchcase(rel, pat.lstrip("/")):
+                return True
+        elif fnmatch.fnmatchcase(name, pat):
+            return True
+    return False
+
+
+def _github_api_get(repo_url: str, path: str, accept: str = "application/vnd.github+json"):
+    owner, repo = _github_owner_repo(repo_url)
+    headers = {**_auth_headers(getattr(settings, "github_token", None)), "Accept": accept}
+    api = settings.github_api_url.rstrip("/")
+    return urlopen(Request(f"{api}/repos/{owner}/{repo}/{path}", headers=headers), timeout=60)
+
+
+def _plan_github_fetch(repo: str, tree_ish: str, patterns: list[str]) -> list[dict] | None:
+    """
+    trees API(recursive)로 파일 목록만 먼저 받아 패턴에 맞는 blob을 고른다.
+    고른 파일이 REPO_SELECTIVE_MAX_FILES 이하일 때만 계획을 반환하고,
+    그보다 많거나 목록이 잘렸거나(truncated) 조회에 실패하면 None → 전체 zip 다운로드.
+    """
+    try:
+        with _github_api_get(repo, f"git/trees/{quote(tree_ish, safe='')}?recursive=1") as resp:
+            data = json.load(resp)
+    except (HTTPError, URLError, OSError, ValueError):
+        return None
+    if data.get("truncated"):
+        return None
+
+    blobs = [e for e in data.get("tree", []) if e.get("type") == "blob"]
+    modules = module_dirs(e["path"] for e in blobs)
+    plan = [e for e in blobs if _want_member(e["path"], modules) and _match_patterns(e["path"], patterns)]
+    if len(plan) > settings.repo_selective_max_files:
+        return None
+    return plan
+
+
+def _fetch_github_selective(repo: str, plan: list[dict], target: Path) -> Path:
+    """계획된 blob만 blobs API(raw)로 받아 target 디렉터리를 구성한다."""
+    tmp_target = target.parent / f"{target.name}.tmp-{uuid.uuid4().hex[:8]}"
+    root = tmp_target.resolve()
+
+    def _get(entry: dict) -> None:
+        out = (root / entry["path"]).resolve()
+        if not out.is_relative_to(root):
+            return
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with _github_api_get(repo, f"git/blobs/{entry['sha']}", accept="application/vnd.github.raw") as resp, \
+                out.open("wb") as fh:
+            shutil.copyfileobj(resp, fh, _COPY_CHUNK)
+
+    try:
+        tmp_target.mkdir(parents=True)
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="blob") as pool:
+            list(pool.map(_get, plan))
+        _commit_dir(tmp_target, target)
+    finally:
+        shutil.rmtree(tmp_target, ignore_errors=True)
+    return target
+
+
+def _fetch_git(repo: str, target: Path, ref: str | None, sha: str | None, sparse: list[str] | None = None) -> Path:
+    """
+    GitHub가 아닌 git URL: git이 PATH에 있을 때만 shallow partial clone.
+    - --filter=blob:none 으로 커밋/트리만 받고, 파일 본문(blob)은 checkout 시점에 필요한 것만 받는다
+    - sparse 패턴(gitignore 문법: *.java, pom.xml ...)이 있으면 그 파일들만 checkout
+      → 바이너리/에셋 blob은 아예 내려받지 않으므로 시간·디스크가 소스 크기에 비례
+    - SHA를 알면 그 커밋만, 아니면 요청한 ref(없으면 HEAD)를 fetch
+    서버가 partial clone을 지원하지 않으면 git이 filter를 무시하고 일반 shallow fetch로 동작한다.
+    """
+    if not shutil.which("git"):
+        raise RuntimeError("이 실행 환경에는 git이 없어서 GitHub URL만 zip 다운로드로 지원합니다.")
+    # git이 있으면 subprocess로 실행 (GitPython 의존 제거)
+    tmp_target = target.parent / f"{target.name}.tmp-{uuid.uuid4().hex[:8]}"
+    git = ["git", "-C", str(tmp_target)]
+    try:
+        tmp_target.mkdir()
+        subprocess.run([*git, "init", "-q"], check=True)
+        subprocess.run([*git, "remote", "add", "origin", _clone_url(repo)], check=True)
+        if sparse:
+            # non-cone sparse-checkout: 패턴 파일을 직접 써서 git 버전과 무관하게 동작
+            subprocess.run([*git, "config", "core.sparseCheckout", "true"], check=True)
+            info = tmp_target / ".git" / "info"
+            info.mkdir(parents=True, exist_ok=True)
+            (info / "sparse-checkout").write_text("\n".join(sparse) + "\n", encoding="utf-8")
+        subprocess.run(
+            [*git, "fetch", "-q", "--depth", "1", "--filter=blob:none", "origin", sha or ref or "HEAD"],
+            check=True,
+        )
+        subprocess.run([*git, "checkout", "-q", "FETCH_HEAD"], check=True)
+        _commit_dir(tmp_target, target)
+    finally:
+        shutil.rmtree(tmp_target, ignore_errors=True)
+    return target
+
+
+def _fetch_github_planned(
+    repo: str,
+    tree_ish: str,
+    sparse: list[str] | None,
+    target: Path,
+    full_target: Path,
+    archive: Path,
+    materialize: bool,
+) -> Path:
+    """
+    필요한 파일이 소수면 해당 blob만 받고(target), 아니면 전체 zip(full_target / archive).
+    sparse 요청이 전체 zip으로 넘어가면 전체 항목의 lock을 잡고 받는다
+    (같은 커밋의 전체 요청과 같은 아카이브를 동시에 받지 않고, 먼저 받은 쪽 결과를 재사용).
+    """
+    plan = _plan_github_fetch(repo, tree_ish, sparse) if sparse and settings.repo_selective_max_files > 0 else None
+    if plan is not None:
+        try:
+            return _fetch_github_selective(repo, plan, target)
+        except Exception as e:
+            logging.warning(f"선택적 다운로드 실패, 전체 zip으로 재시도: {e}")
+    if target == full_target:
+        return _fetch_github(repo, tree_ish, full_target, archive, materialize)
+    lock = _entry_lock(full_target.parent, full_target.name)
+    with _file_lock(lock, timeout=settings.repo_lock_timeout, stale_after=settings.repo_lock_stale_after):
+        for cached in (full_target,) if materialize else (full_target, archive):
+            if cached.exists():
+                return cached
+        return _fetch_github(repo, tree_ish, full_target, archive, materialize)
+
+
+def fetch_repo(
+    repo: str,
+    ref: str | None = None,
+    materialize: bool = True,
+    sparse: list[str] | None = None,
+) -> PreparedRepo:
+    """
+    repo가 로컬 경로면 그대로 사용 (ref 지정 불가).
+    URL이면 ref(브랜치/태그/커밋 SHA, None이면 기본 브랜치)를 커밋 SHA로 확인한 뒤
+    cache_dir 아래로 다운로드/압축해제하고 경로와 SHA를 반환.
+    - 캐시 항목은 커밋 SHA별로 분리된다 (<name>-<hash>@<sha12>).
+      GitHub는 ETag 조건부 API 요청, 그 외는 git ls-remote로 SHA를 확인하므로
+      변경이 없으면 확인 요청 한 번으로 캐시를 재사용하고, push가 있으면 새로 받는다.
+      SHA를 확인할 수 없으면(오프라인/rate limit) 요청한 ref 이름 기준 항목으로 동작.
+    - GitHub URL: zip 다운로드(권장, git 불필요)
+      materialize=False면 압축을 풀지 않고 캐시된 zip 파일 경로를 반환 (ZipFS로 바로 분석)
+    - 기타 git URL: git이 PATH에 있을 때만 partial clone 시도, 없으면 에러
+      sparse 패턴을 주면 그 파일들만 checkout한다 (패턴별로 별도 캐시 항목, 전체 checkout이 있으면 재사용)
+    - GitHub URL + sparse: trees API로 목록을 먼저 보고 맞는 파일이 소수(REPO_SELECTIVE_MAX_FILES 이하)면
+      그 blob만 받는다 (예: stack 모드는 빌드 파일 몇 KB). 많으면 전체 zip.
+    - 전체 캐시 용량은 REPO_CACHE_MAX_BYTES 이하로 LRU 정리
+      (REPO_CACHE_EVICT_GRACE 안에 쓰인 항목·받는 중인 항목은 제외)
+    - 같은 항목의 동시 요청은 파일 lock으로 한 번만 받는다 (REPO_LOCK_TIMEOUT 동안 대기)
+    """
+    p = Path(repo).expanduser()
+    if p.exists():
+        if ref:
+            raise ValueError("ref는 Git URL에만 지정할 수 있습니다.")
+        return PreparedRepo(p.resolve())
+
+    if not is_git_url(repo):
+        raise ValueError("repo는 로컬 경로 또는 https git URL 이어야 합니다.")
+
+    cache_root = writable_cache_root()
+    cache_root.mkdir(parents=True, exist_ok=True)
 
-    raise RuntimeError("이 실행 환경에는 git이 없어서 GitHub URL만 zip 다운로드로 지원합니다.")
\ No newline at end of file
+    head_key = f"{repo}#{ref or 'HEAD'}"
+    with _manifest(cache_root) as m:
+        cached_head = m["heads"].get(head_key)
+    resolved = resolve_ref(repo, ref, cached_head)
+    sha = resolved.sha if resolved else None
+    if resolved and resolved.sha != ref:
+        with _manifest(cache_root) as m:
+            m["heads"][head_key] = {"sha": resolved.sha, "etag": resolved.etag, "checked_at": time.time()}
+
+    if sha:
+        name = f"{_safe_repo_dir(repo)}@{sha[:12]}"
+    else:
+        name = _safe_repo_dir(repo) + (f"@{re.sub(r'[^A-Za-z0-9._-]', '_', ref)}" if ref else "")
+    full_target = cache_root / name
+    archive = cache_root / f"{name}.zip"
+    candidates = [full_target, archive] if not materialize else [full_target]
+
+    # 부분 다운로드(sparse)는 패턴별로 별도 항목 (같은 커밋의 전체 항목이 있으면 그쪽을 재사용)
+    if sparse:
+        name += "~" + hashlib.sha1("\n".join(sorted(sparse)).encode("utf-8")).hexdigest()[:8]
+        candidates.append(cache_root / name)
+    target = cache_root / name
+
+    def _cached() -> Path | None:
+        # 같은 커밋이 이미 풀려 있으면(또는 아카이브 모드에서 zip이 있으면) 그대로 재사용
+        for cached in candidates:
+            if cached.exists():
+                return cached
+        return None
+
+    hit = _cached()
+    if hit is None or not _touch_entry(cache_root, hit, repo, sha):
+        # single-flight: 같은 항목을 동시에 요청하면 먼저 lock을 잡은 쪽만 받고 나머지는 완료를 기다린다
+        lock = _entry_lock(cache_root, name)
+        with _file_lock(lock, timeout=settings.repo_lock_timeout, stale_after=settings.repo_lock_stale_after):
+            hit = _cached()
+            if hit is None or not _touch_entry(cache_root, hit, repo, sha):
+                if _GH_RE.match(repo):
+                    path = _fetch_github_planned(repo, sha or ref or "HEAD", sparse, target, full_target, archive, materialize)
+                else:
+                    path = _fetch_git(repo, target, ref, sha, sparse)
+                _register_entry(cache_root, path, repo, sha)
+                return PreparedRepo(path.resolve(), ref, sha)
+
+    return PreparedRepo(hit.resolve(), ref, sha)
+
+
+def prepare_repo(
+    repo: str,
+    materialize: bool = True,
+    ref: str | None = None,
+    sparse: list[str] | None = None,
+) -> Path:
+    """fetch_repo()의 경로만 반환 (로컬 경로면 그대로, URL이면 캐시된 디렉터리/zip)."""
+    return fetch_repo(repo, ref=ref, materialize=materialize, sparse=sparse).path
@@ -0,0 +1,140 @@
+"""
+레포 파일 접근 추상화.
+
+- DirFS: 로컬 디렉터리 (walker.iter_repo_files — 제외 디렉터리/.gitignore/바이너리 건너뜀)
+- ZipFS: 압축을 풀지 않고 zip 아카이브를 그대로 읽는 가상 파일시스템
+         (central directory만 인덱싱하고, 멤버 본문은 요청 시점에만 읽음)
+
+두 구현 모두 파일을 `root / 상대경로` 형태의 Path로 노출하므로
+relative_to / name / suffix 등 기존 Path 기반 코드를 그대로 사용할 수 있다.
+ZipFS의 root는 실제로 존재하지 않는 가상 경로이므로 본문은 반드시 fs.read_text()로 읽는다.
+"""
+from __future__ import annotations
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import Iterator, Self
+
+from erd_agent.prefilter import map_file
+from erd_agent.repo import _want_member, module_dirs
+from erd_agent.walker import iter_repo_files
+
+
+class RepoFS(ABC):
+    root: Path
+
+    @abstractmethod
+    def iter_files(self) -> Iterator[Path]: ...
+
+    @abstractmethod
+    def read_bytes(self, path: Path) -> bytes: ...
+
+    @abstractmethod
+    def size(self, path: Path) -> int: ...
+
+    @abstractmethod
+    def fingerprint(self, path: Path) -> tuple[int, int]:
+        """(크기, 변경 스탬프) — 스캔 캐시가 파일을 다시 읽을지 판단하는 키."""
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8", errors="ignore")
+
+    def open_buffer(self, path: Path) -> AbstractContextManager:
+        """분류용 본문 버퍼 (with 블록 안에서만 유효). 기본은 read_bytes 결과."""
+        return nullcontext(self.read_bytes(path))
+
+    @property
+    def is_local_dir(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        """열어 둔 핸들 해제 (DirFS는 없음)."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class DirFS(RepoFS):
+    def __init__(self, root: Path):
+        self.root = root
+
+    def iter_files(self) -> Iterator[Path]:
+        return iter_repo_files(self.root)
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def read_text(self, path: Path) -> str:
+        return path.read_text(encoding="utf-8", errors="ignore")
+
+    # 함수 자체를 노출해 병렬 스캔이 "로컬 파일"임을 알아보고 워커 프로세스가 직접 읽게 한다
+    open_buffer = staticmethod(map_file)
+
+    def size(self, path: Path) -> int:
+        return path.stat().st_size
+
+    def fingerprint(self, path: Path) -> tuple[int, int]:
+        st = path.stat()
+        return st.st_size, st.st_mtime_ns
+
+    @property
+    def is_local_dir(self) -> bool:
+        return True
+
+
+class ZipFS(RepoFS):
+    """
+    zip 아카이브 기반 가상 파일시스템.
+    GitHub zip처럼 최상위 폴더(repo-ref/) 하나로 감싸진 경우 이를 벗겨내고,
+    압축 해제 시와 같은 필터(_want_member)로 바이너리/벤더·빌드 산출물 경로를 제외한다.
+    """
+
+    def __init__(self, zip_path: Path):
+        self.zip_path = zip_path
+        self.root = zip_path.with_suffix("")
+        self._zf = zipfile.ZipFile(zip_path, "r")
+        self._lock = threading.Lock()  # ZipFile 핸들 공유 시 멤버 읽기 직렬화
+
+        infos = [i for i in self._zf.infolist() if not i.is_dir()]
+        tops = {i.filename.split("/", 1)[0] for i in infos}
+        prefix = f"{tops.pop()}/" if len(tops) == 1 and all("/" in i.filename for i in infos) else ""
+
+        self._members: dict[Path, zipfile.ZipInfo] = {}
+        modules = module_dirs(i.filename[len(prefix):] for i in infos)
+        for info in infos:
+            rel = info.filename[len(prefix):]
+            if rel and _want_member(rel, modules):
+                self._members[self.root / rel] = info
+
+    def iter_files(self) -> Iterator[Path]:
+        return iter(sorted(self._members))
+
+    def read_bytes(self, path: Path) -> bytes:
+        info = self._members[path]
+        with self._lock:
+            return self._zf.read(info)
+
+    def size(self, path: Path) -> int:
+        return self._members[path].file_size
+
+    def fingerprint(self, path: Path) -> tuple[int, int]:
+        # 멤버 CRC32는 central directory에 있으므로 본문을 풀지 않고도 변경 여부를 알 수 있다
+        info = self._members[path]
+        return info.file_size, info.CRC
+
+    def close(self) -> None:
+        # warm 호스트에서 요청마다 fd가 쌓이지 않도록 에이전트 실행이 끝나면 닫는다
+        with self._lock:
+            self._zf.close()
+
+
+def open_repo_fs(path: Path) -> RepoFS:
+    """zip 파일이면 ZipFS, 디렉터리면 DirFS."""
+    if path.is_file() and zipfile.is_zipfile(path):
+        return ZipFS(path)
+    return DirFS(path)
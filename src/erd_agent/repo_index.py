@@ -0,0 +1,190 @@
+"""
+단일 패스 레포 인덱스.
+
+레포를 한 번만 순회하면서 각 파일을 최대 한 번만 읽고 (스캔 캐시 적중 시 읽지 않음)
+entity / controller / arch-hint / build-file / enum / embeddable 버킷으로 분류한다.
+5개 에이전트(run_erd, run_api, run_arch, run_ddl, run_stack)는 레포 문자열 대신
+이 인덱스를 받아 재순회 없이 결과를 사용한다.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Self, Set
+
+from erd_agent.config import settings
+from erd_agent.repo import fetch_repo
+from erd_agent.repo_fs import RepoFS, open_repo_fs
+from erd_agent.prefilter import decode
+from erd_agent.scan_cache import iter_file_signals
+from erd_agent.scanner import DeclarationIndex, ScanConfig, is_entity_signals
+
+
+@dataclass
+class RepoIndex:
+    root: Path
+    # 파일 본문 접근 (로컬 디렉터리 또는 zip 아카이브)
+    fs: RepoFS = field(repr=False)
+    # 인덱싱된 전체 파일 (디렉터리 트리 생성용)
+    files: list[Path] = field(default_factory=list, repr=False)
+    entity_files: list[Path] = field(default_factory=list)
+    controller_files: list[Path] = field(default_factory=list)
+    arch_files: list[Path] = field(default_factory=list)
+    build_files: list[Path] = field(default_factory=list)
+    enum_files: list[Path] = field(default_factory=list)
+    embeddable_files: list[Path] = field(default_factory=list)
+    # 타입명 → 선언 파일 심볼 테이블 (enum / @Embeddable 조회용)
+    declarations: DeclarationIndex = field(default_factory=DeclarationIndex, repr=False)
+    # 분류 과정에서 이미 읽은 본문 (버킷에 속한 .java 파일만 보관)
+    texts: dict[Path, str] = field(default_factory=dict, repr=False)
+    # 요청한 ref와 고정된 커밋 SHA (로컬 경로면 None) — 하위 캐시 키로 사용
+    ref: str | None = None
+    commit_sha: str | None = None
+
+    def read_text(self, path: Path) -> str:
+        """인덱스에 캐시된 본문을 반환하고, 없으면 읽어서 캐시한다."""
+        text = self.texts.get(path)
+        if text is None:
+            text = self.fs.read_text(path)
+            self.texts[path] = text
+        return text
+
+    def find_enum_definition_files(self, enum_names: Set[str]) -> list[Path]:
+        return self.declarations.enum_files(enum_names)
+
+    def find_embeddable_definition_files(self, class_names: Set[str]) -> list[Path]:
+        return self.declarations.embeddable_files(class_names)
+
+    def close(self) -> None:
+        """파일 접근 핸들(ZipFS의 zip 파일 등) 해제. 에이전트 실행이 모두 끝난 뒤 호출한다."""
+        self.fs.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def build_repo_index(
+    repo: Path | RepoFS,
+    cfg: ScanConfig | None = None,
+    ref: str | None = None,
+    commit_sha: str | None = None,
+) -> RepoIndex:
+    """
+    레포를 한 번 순회하며 모든 에이전트용 버킷을 채운다.
+    repo가 zip 파일 경로(또는 ZipFS)면 압축을 풀지 않고 아카이브에서 바로 읽는다.
+    """
+    # 에이전트 패키지가 이 모듈을 import 하므로 순환 참조를 피하려고 지연 import
+    from api_agent.scanner import CONTROLLER_NAME_RE
+    from arch_agent.scanner import is_arch_config_file
+    from stack_agent.scanner import is_stack_file
+
+    cfg = cfg or ScanConfig()
+    fs = repo if isinstance(repo, RepoFS) else open_repo_fs(repo)
+    repo_path = fs.root
+    index = RepoIndex(root=repo_path, fs=fs, ref=ref, commit_sha=commit_sha)
+
+    java_files: list[Path] = []
+    for f in fs.iter_files():
+        index.files.append(f)
+        if is_stack_file(repo_path, f):
+            index.build_files.append(f)
+        if is_arch_config_file(f):
+            index.arch_files.append(f)
+            continue
+        if f.suffix in cfg.exts:
+            java_files.append(f)
+
+    # 분류 신호는 스캔 캐시에서 가져온다: 크기/스탬프가 그대로인 파일은 본문을 읽지 않고,
+    # 새로 읽은 파일도 버킷에 들어갈 때만 디코딩해 보관한다 (나머지는 read_text에서 필요할 때 읽음)
+    for f, sig, buf in iter_file_signals(java_files, fs.fingerprint, fs.open_buffer):
+        keep = False
+        if is_entity_signals(f, sig, cfg):
+            index.entity_files.append(f)
+            keep = True
+        if sig.controller_ann or CONTROLLER_NAME_RE.match(f.name):
+            index.controller_files.append(f)
+            keep = True
+        if sig.arch_hint:
+            index.arch_files.append(f)
+            keep = True
+        decls = index.declarations.add_decls(f, sig.decls)
+        if any(d.kind == "enum" for d in decls):
+            index.enum_files.append(f)
+            keep = True
+        if any(d.embeddable for d in decls):
+            index.embeddable_files.append(f)
+            keep = True
+        if keep and buf is not None:
+            index.texts[f] = decode(buf)
+
+    for bucket in (
+        index.entity_files, index.controller_files, index.arch_files,
+        index.build_files, index.enum_files, index.embeddable_files,
+    ):
+        bucket.sort()
+    return index
+
+
+def mode_file_patterns(modes: Iterable[str] | None) -> list[str] | None:
+    """
+    요청한 모드의 에이전트가 실제로 읽는 파일 패턴 (gitignore 문법, sparse checkout용).
+    - erd / api: *.java
+    - ddl: *.java + dialect 감지용 설정/빌드 파일
+    - arch: *.java + 설정/빌드 파일
+    - stack: BUILD_FILES + GitHub workflow
+    모드를 모르거나 지정하지 않으면 None (전체).
+    """
+    if not modes:
+        return None
+    from arch_agent.scanner import CONFIG_FILES
+    from ddl_agent.static_extractor import DIALECT_HINT_FILES
+    from stack_agent.scanner import BUILD_FILES, WORKFLOW_DIR
+
+    java = [f"*{ext}" for ext in ScanConfig().exts]
+    per_mode = {
+        "erd": java,
+        "api": java,
+        "ddl": [*java, *DIALECT_HINT_FILES],
+        "arch": [*java, *CONFIG_FILES],
+        "stack": [*BUILD_FILES, f"{WORKFLOW_DIR}/*.yml", f"{WORKFLOW_DIR}/*.yaml"],
+    }
+    if any(m not in per_mode for m in modes):
+        return None
+    return sorted({p for m in modes for p in per_mode[m]})
+
+
+def open_repo_index(
+    repo: str | RepoIndex,
+    ref: str | None = None,
+    modes: Iterable[str] | None = None,
+) -> RepoIndex:
+    """
+    레포 문자열(로컬 경로/URL)이면 ref 기준으로 준비 후 인덱싱, 이미 인덱스면 그대로 반환.
+    modes를 주면 해당 에이전트가 읽는 파일만 받아온다 (git URL의 sparse checkout).
+    새로 연 인덱스는 호출한 쪽이 close()한다 (with open_repo_index(...) as index:).
+    """
+    if isinstance(repo, RepoIndex):
+        return repo
+    prepared = fetch_repo(
+        repo,
+        ref=ref,
+        materialize=not settings.repo_archive_mode,
+        sparse=mode_file_patterns(modes),
+    )
+    return build_repo_index(prepared.path, ref=prepared.ref, commit_sha=prepared.sha)
+
+
+@contextmanager
+def scoped_repo_index(repo: str | RepoIndex) -> Iterator[RepoIndex]:
+    """
+    에이전트 진입점용. 레포 문자열이면 인덱스를 새로 열고 블록이 끝나면 닫는다.
+    이미 연 인덱스를 받으면 그대로 쓰고 닫지 않는다 (연 쪽이 닫음 — CLI/Function에서 여러 에이전트가 공유).
+    """
+    if isinstance(repo, RepoIndex):
+        yield repo
+        return
+    with open_repo_index(repo) as index:
+        yield index
@@ -0,0 +1,272 @@
+"""
+파일 분류 결과 영구 캐시 (증분 스캔).
+
+스캐너가 파일마다 계산하는 신호(@Entity / @Table / Controller 애너테이션 / 아키텍처 힌트 / 타입 선언)를
+SQLite 파일에 저장해, 다음 스캔에서는 바뀐 파일만 다시 읽고 분류한다 (분류 자체는 prefilter.classify_bytes).
+
+- files   : 경로 → (크기, 스탬프, 내용 해시)   스탬프 = 로컬 파일 mtime_ns / zip 멤버 CRC
+- signals : 내용 해시 → 분류 신호             (경로가 달라도 내용이 같으면 재사용: 커밋별 캐시 디렉터리 간 공유)
+
+크기+스탬프가 같으면 파일을 열지 않고, 다르면 읽어서 해시가 같은지 본 뒤에만 다시 분류한다.
+신호 계산 로직이 바뀌면 SCAN_CACHE_VERSION을 올려 기존 항목을 무효화한다.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from erd_agent.config import settings, writable_cache_root
+from erd_agent.prefilter import FileSignals, classify_bytes, map_file
+from erd_agent.sqlite_cache import CacheStats, LazyCache, connect, trim_table
+
+SCAN_CACHE_VERSION = 2
+
+# 파일 본문 버퍼를 여는 함수 (경로 → with 블록 안에서만 유효한 bytes / mmap)
+BufferOpener = Callable[[Path], AbstractContextManager]
+
+T = TypeVar("T")
+
+# 테이블별 최대 행 수 (초과 시 오래 안 쓴 행부터 삭제)
+_MAX_ROWS = 500_000
+
+
+def _dump(sig: FileSignals) -> str:
+    return json.dumps([sig.entity_ann, sig.table_ann, sig.controller_ann, sig.arch_hint, sig.decls])
+
+
+def _load(raw: str) -> FileSignals:
+    e, t, c, a, decls = json.loads(raw)
+    return FileSignals(e, t, c, a, tuple((n, k, emb) for n, k, emb in decls))
+
+
+def _versioned(sha1: str) -> str:
+    return f"{SCAN_CACHE_VERSION}:{sha1}"
+
+
+def local_fingerprint(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+class ScanCache(CacheStats):
+    """경로 → 내용 해시(files), 내용 해시 → 신호(signals) 두 테이블이라 SQLiteCache 대신 헬퍼 함수만 쓴다."""
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = connect(self.path)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS files ("
+                    " path TEXT PRIMARY KEY, size INTEGER NOT NULL, stamp INTEGER NOT NULL,"
+                    " digest TEXT NOT NULL, seen REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS signals ("
+                    " digest TEXT PRIMARY KEY, data TEXT NOT NULL, seen REAL NOT NULL)"
+                )
+        finally:
+            conn.close()
+
+    def session(self) -> "ScanSession":
+        return ScanSession(self)
+
+
+class ScanSession:
+    """
+    스캔 한 번 동안 쓰는 연결. 조회는 즉시, 기록은 모아 두었다가 close() 때 한 트랜잭션으로 반영.
+    한 스레드에서만 사용한다.
+    """
+
+    def __init__(self, cache: ScanCache):
+        self.cache = cache
+        self._conn = connect(cache.path)
+        self._files: list[tuple[str, int, int, str, float]] = []
+        self._signals: dict[str, FileSignals] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def _signals_for_digest(self, digest: str) -> FileSignals | None:
+        sig = self._signals.get(digest)
+        if sig is not None:
+            return sig
+        row = self._conn.execute("SELECT data FROM signals WHERE digest = ?", (digest,)).fetchone()
+        return _load(row[0]) if row else None
+
+    def lookup(self, key: str, fingerprint: tuple[int, int]) -> FileSignals | None:
+        """크기+스탬프가 캐시와 같으면 저장된 신호 (파일을 읽지 않음)."""
+        row = self._conn.execute(
+            "SELECT f.size, f.stamp, f.digest, s.data FROM files f"
+            " LEFT JOIN signals s ON s.digest = f.digest WHERE f.path = ?",
+            (key,),
+        ).fetchone()
+        if row and (row[0], row[1]) == fingerprint and row[3] is not None:
+            self._hits += 1
+            self._files.append((key, row[0], row[1], row[2], time.time()))
+            return _load(row[3])
+        return None
+
+    def classify(self, key: str, fingerprint: tuple[int, int], buf) -> FileSignals:
+        """본문 버퍼를 해시해 같은 내용의 신호가 있으면 재사용, 없으면 계산한다."""
+        digest = _versioned(hashlib.sha1(buf).hexdigest())
+        sig = self._signals_for_digest(digest)
+        if sig is None:
+            self._misses += 1
+            sig = classify_bytes(buf)
+        else:
+            self._hits += 1
+        self._signals[digest] = sig
+        self._files.append((key, fingerprint[0], fingerprint[1], digest, time.time()))
+        return sig
+
+    def record(self, key: str, fingerprint: tuple[int, int], sha1: str, sig: FileSignals) -> None:
+        """병렬 풀에서 계산한 신호를 기록한다 (sha1 = 본문 해시)."""
+        digest = _versioned(sha1)
+        self._misses += 1
+        self._signals[digest] = sig
+        self._files.append((key, fingerprint[0], fingerprint[1], digest, time.time()))
+
+    def close(self) -> None:
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, size, stamp, digest, seen) VALUES (?, ?, ?, ?, ?)",
+                    self._files,
+                )
+                now = time.time()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO signals (digest, data, seen) VALUES (?, ?, ?)",
+                    [(d, _dump(s), now) for d, s in self._signals.items()],
+                )
+                for table in ("files", "signals"):
+                    trim_table(self._conn, table, _MAX_ROWS)
+        except sqlite3.Error:
+            pass  # 캐시 기록 실패는 스캔 결과에 영향 없음
+        finally:
+            self._conn.close()
+            self.cache.count(hits=self._hits, misses=self._misses)
+
+
+_CACHE = LazyCache(lambda: ScanCache(settings.scan_cache_path or writable_cache_root() / "scan-cache.sqlite3"))
+
+
+def get_scan_cache() -> ScanCache | None:
+    """프로세스 전역 스캔 캐시 (SCAN_CACHE_ENABLED=false면 None)."""
+    if not settings.scan_cache_enabled:
+        return None
+    return _CACHE.get()
+
+
+def _safe(fn: Callable[[Path], T]) -> Callable[[Path], T | None]:
+    def call(f: Path) -> T | None:
+        try:
+            return fn(f)
+        except Exception:
+            return None
+    return call
+
+
+def _read_all(open_buffer: BufferOpener) -> Callable[[Path], bytes]:
+    def read(f: Path) -> bytes:
+        with open_buffer(f) as buf:
+            return buf if isinstance(buf, bytes) else buf[:]
+    return read
+
+
+def _iter_parallel(
+    files: list[Path],
+    fingerprint: Callable[[Path], tuple[int, int]],
+    open_buffer: BufferOpener,
+    session: ScanSession | None,
+) -> Iterator[tuple[Path, FileSignals, bytes | None]]:
+    """
+    파일 목록을 풀에 나눠 분류한다. stat/읽기는 스레드 풀, 분류는 프로세스 풀.
+    로컬 파일은 워커 프로세스가 직접 읽으므로 본문 버퍼는 None (필요하면 호출 측이 다시 읽음),
+    zip 등 그 밖의 파일은 스레드 풀에서 읽은 bytes를 넘기고 그대로 돌려준다.
+    """
+    from erd_agent.scan_pool import classify_job, map_cpu, map_io
+
+    results: list[tuple[FileSignals, bytes | None] | None] = [None] * len(files)
+    todo = list(range(len(files)))
+    stamps: list[tuple[int, int] | None] = [None] * len(files)
+    if session is not None:
+        stamps = map_io(_safe(fingerprint), files)
+        todo = []
+        for i, (f, stamp) in enumerate(zip(files, stamps)):
+            if stamp is None:
+                continue  # 읽을 수 없는 파일
+            sig = session.lookup(str(f), stamp)
+            if sig is not None:
+                results[i] = (sig, None)
+            else:
+                todo.append(i)
+
+    if todo:
+        if open_buffer is map_file:
+            items: list[str | bytes | None] = [str(files[i]) for i in todo]
+            datas: list[bytes | None] = [None] * len(todo)
+        else:
+            datas = map_io(_safe(_read_all(open_buffer)), [files[i] for i in todo])
+            items = list(datas)
+        for i, res, data in zip(todo, map_cpu(classify_job, items), datas):
+            if res is None:
+                continue
+            sha1, sig = res
+            if session is not None:
+                session.record(str(files[i]), stamps[i], sha1, sig)
+            results[i] = (sig, data)
+
+    for f, res in zip(files, results):
+        if res is not None:
+            yield f, res[0], res[1]
+
+
+def iter_file_signals(
+    files: Iterable[Path],
+    fingerprint: Callable[[Path], tuple[int, int]] = local_fingerprint,
+    open_buffer: BufferOpener = map_file,
+) -> Iterator[tuple[Path, FileSignals, bytes | None]]:
+    """
+    파일마다 (경로, 신호, 본문 버퍼 또는 None)을 입력 순서대로 yield. 읽을 수 없는 파일은 건너뛴다.
+    버퍼(bytes / mmap)는 다음 항목으로 넘어가기 전까지만 유효하므로, 본문이 필요한 호출 측은
+    루프 안에서 prefilter.decode()로 디코딩한다. 캐시 적중 시나 병렬 분류 시에는 None일 수 있다.
+    파일 수가 SCAN_PARALLEL_MIN_FILES 이상이면 SCAN_WORKERS 크기의 풀로 나눠 처리한다.
+    캐시가 꺼져 있으면 매번 열어서 계산한다.
+    """
+    from erd_agent.scan_pool import should_parallelize
+
+    files = list(files)
+    cache = get_scan_cache()
+    session = cache.session() if cache is not None else None
+    try:
+        if should_parallelize(len(files)):
+            yield from _iter_parallel(files, fingerprint, open_buffer, session)
+            return
+
+        for f in files:
+            key = str(f)
+            stamp = None
+            if session is not None:
+                try:
+                    stamp = fingerprint(f)
+                    sig = session.lookup(key, stamp)
+                except Exception:
+                    continue
+                if sig is not None:
+                    yield f, sig, None
+                    continue
+            try:
+                with open_buffer(f) as buf:
+                    sig = session.classify(key, stamp, buf) if session is not None else classify_bytes(buf)
+                    yield f, sig, buf
+            except Exception:
+                continue
+    finally:
+        if session is not None:
+            session.close()
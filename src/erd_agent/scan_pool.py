@@ -0,0 +1,139 @@
+"""
+스캔 병렬 실행 풀 (scan_cache.iter_file_signals 전용).
+
+- 스레드 풀 : stat / 파일·zip 멤버 읽기처럼 I/O 대기가 큰 작업
+- 프로세스 풀: 정규식 분류처럼 GIL에 묶이는 CPU 작업 (프로세스 전역으로 재사용)
+
+프로세스 풀을 만들 수 없는 환경(/dev/shm 없음 등)에서는 스레드 풀로 자동 대체한다.
+결과 순서는 항상 입력 순서와 같다.
+
+워커는 fork가 아니라 forkserver(없으면 spawn)로 만든다 — Function 호스트처럼 에이전트/잡 풀,
+httpx 풀, lock heartbeat 스레드가 이미 도는 프로세스를 fork하면 다른 스레드가 잡고 있던 lock을
+자식이 물려받아 멈출 수 있다. 기동 비용은 warm_process_pool()로 시작 시점에 미리 치른다.
+"""
+from __future__ import annotations
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, TypeVar
+
+from erd_agent.config import settings
+from erd_agent.prefilter import FileSignals, _matcher, classify_bytes, map_file
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_LOCK = threading.Lock()
+_THREADS: ThreadPoolExecutor | None = None
+_PROCESSES: ProcessPoolExecutor | None = None
+_PROCESSES_BROKEN = False
+
+# forkserver가 미리 import해 두는 모듈 (워커마다 다시 import하지 않도록)
+# jpa_java.parse_entities도 같은 풀(map_cpu)을 쓰므로 javalang 파서까지 서버에서 한 번만 로드한다
+_PRELOAD = ["erd_agent.scan_pool", "erd_agent.parsers.jpa_java"]
+
+
+def scan_workers() -> int:
+    """SCAN_WORKERS (0이면 CPU 수, 최대 8)."""
+    if settings.scan_workers > 0:
+        return settings.scan_workers
+    return min(os.cpu_count() or 1, 8)
+
+
+def should_parallelize(n_files: int) -> bool:
+    return scan_workers() > 1 and n_files >= settings.scan_parallel_min_files
+
+
+def thread_pool() -> ThreadPoolExecutor:
+    global _THREADS
+    with _LOCK:
+        if _THREADS is None:
+            _THREADS = ThreadPoolExecutor(max_workers=scan_workers(), thread_name_prefix="scan")
+        return _THREADS
+
+
+def _process_pool() -> ProcessPoolExecutor | None:
+    global _PROCESSES
+    with _LOCK:
+        if _PROCESSES is None and settings.scan_process_pool and not _PROCESSES_BROKEN:
+            # 멀티스레드 프로세스를 fork하지 않는다: forkserver는 단일 스레드 서버 프로세스에서 워커를 만든다
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                ctx = multiprocessing.get_context("forkserver")
+                ctx.set_forkserver_preload(_PRELOAD)
+            else:
+                ctx = multiprocessing.get_context("spawn")
+            _PROCESSES = ProcessPoolExecutor(max_workers=scan_workers(), mp_context=ctx)
+        return _PROCESSES
+
+
+def _warm_up(_: int) -> int:
+    _matcher()  # 결합 정규식을 워커에서 미리 컴파일
+    return os.getpid()
+
+
+def warm_process_pool() -> None:
+    """
+    프로세스 풀과 워커를 미리 띄운다 (Function 호스트 시작 시 호출).
+    첫 요청이 워커 기동 비용을 치르지 않게 하고, 실패하면 그때 바로 스레드로 대체한다.
+    """
+    if scan_workers() <= 1:
+        return
+    pool = _process_pool()
+    if pool is None:
+        return
+    try:
+        list(pool.map(_warm_up, range(scan_workers())))
+    except (BrokenProcessPool, OSError) as exc:
+        _disable_process_pool(exc)
+
+
+def _disable_process_pool(exc: BaseException) -> None:
+    global _PROCESSES, _PROCESSES_BROKEN
+    logger.warning("scan process pool unavailable, falling back to threads: %s", exc)
+    with _LOCK:
+        _PROCESSES_BROKEN = True
+        pool, _PROCESSES = _PROCESSES, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def map_io(fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+    """I/O 위주 작업을 스레드 풀에서 실행 (입력 순서 유지)."""
+    return list(thread_pool().map(fn, items))
+
+
+def map_cpu(fn: Callable[[T], R], items: list[T]) -> list[R]:
+    """
+    CPU 위주 작업을 프로세스 풀에서 실행 (입력 순서 유지). fn과 항목은 pickle 가능해야 한다.
+    프로세스 풀을 쓸 수 없으면 스레드 풀로 실행한다.
+    """
+    pool: Executor | None = _process_pool()
+    if pool is not None:
+        chunksize = max(1, len(items) // (scan_workers() * 4))
+        try:
+            return list(pool.map(fn, items, chunksize=chunksize))
+        except (BrokenProcessPool, OSError) as exc:
+            _disable_process_pool(exc)
+    return map_io(fn, items)
+
+
+def classify_job(item: str | bytes | None) -> tuple[str, FileSignals] | None:
+    """
+    (sha1, 분류 신호). item은 로컬 파일 경로 또는 이미 읽은 본문.
+    읽을 수 없는 파일이면 None.
+    """
+    if item is None:
+        return None
+    if isinstance(item, bytes):
+        return hashlib.sha1(item).hexdigest(), classify_bytes(item)
+    try:
+        with map_file(item) as buf:
+            return hashlib.sha1(buf).hexdigest(), classify_bytes(buf)
+    except OSError:
+        return None
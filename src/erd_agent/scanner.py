@@ -1,10 +1,15 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 from typing import Set
 import re
 
+from erd_agent.walker import iter_repo_files
+
+if TYPE_CHECKING:
+    from erd_agent.scan_cache import FileSignals
+
 # 파일명 힌트: *Entity.java
 ENTITY_NAME_RE = re.compile(r".*Entity\.java$", re.IGNORECASE)
 
@@ -13,17 +18,16 @@ ENTITY_ANN_RE = re.compile(r"@\s*Entity\b")
 TABLE_ANN_RE = re.compile(r"@\s*Table\b")  # 보조 신호(테이블명 추출용)
 
 # Enum
-ENUM_DEF_RE = re.compile(r"\benum\s+([A-Z]\w*)\b")
 ENUM_FIELD_RE = re.compile(r"@Enumerated\s*\(\s*EnumType\.STRING\s*\)\s*@Column[^{;]*\s+private\s+([A-Z]\w*)\s+\w+\s*;", re.DOTALL)
 
 # @EmbeddedId private PayId id;
 EMBEDDED_ID_TYPE_RE = re.compile(r"@EmbeddedId\b[\s\S]{0,200}?\bprivate\s+([A-Z]\w*)\s+\w+\s*;", re.MULTILINE)
 
-# @Embeddable class PayId { ... }
-EMBEDDABLE_CLASS_RE = re.compile(r"@Embeddable\b[\s\S]{0,200}?\bclass\s+([A-Z]\w*)\b", re.MULTILINE)
+# @Embeddable class PayId { ... } / record PayKey(...)
+EMBEDDABLE_ANN_RE = re.compile(r"@Embeddable\b")
 
-# record 지원(프로젝트에 record로 키 클래스 쓰는 경우가 있으면 도움이 됨)
-EMBEDDABLE_RECORD_RE = re.compile(r"@Embeddable\b[\s\S]{0,200}?\brecord\s+([A-Z]\w*)\b", re.MULTILINE)
+# 타입 선언 심볼 테이블용: enum Role / class PayId / record PayKey / interface Foo
+TYPE_DECL_RE = re.compile(r"\b(enum|class|record|interface)\s+([A-Z]\w*)\b")
 
 @dataclass
 class ScanConfig:
@@ -39,68 +43,94 @@ def find_enum_definition_files(repo_path: Path, enum_names: Set[str]) -> list[Pa
     # enum Role { ... } 정의가 들어있는 파일을 찾아 추가 입력으로 사용
     if not enum_names:
         return []
-    hits = []
-    for f in repo_path.rglob("*.java"):
-        try:
-            t = f.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        for name in enum_names:
-            if re.search(rf"\benum\s+{re.escape(name)}\b", t):
-                hits.append(f)
-                break
-    return sorted(set(hits))
-
-def _read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8", errors="ignore")
-
-def _has_entity(text: str) -> bool:
-    return bool(ENTITY_ANN_RE.search(text))
-
-def _has_table(text: str) -> bool:
-    return bool(TABLE_ANN_RE.search(text))
+    return _declaration_index_for(repo_path).enum_files(enum_names)
 
-def scan_repo(repo_path: Path, cfg: ScanConfig | None = None) -> List[Path]:
+def is_entity_signals(path: Path, sig: "FileSignals", cfg: ScanConfig | None = None) -> bool:
     """
-    JPA 엔티티 후보 파일을 찾아 반환한다.
-    우선순위:
+    단일 파일이 JPA 엔티티 후보인지 캐시된 분류 신호로 판별한다 (본문을 읽지 않음, scan_repo / RepoIndex 공용).
       1) @Entity가 있는 파일
       2) 파일명이 *Entity.java 인 파일 (보조)
       3) (옵션) @Table만 있는 파일 include_table_only=True일 때만
     """
     cfg = cfg or ScanConfig()
-    candidates: set[Path] = set()
+    if sig.entity_ann or ENTITY_NAME_RE.match(path.name):
+        return True
+    return cfg.include_table_only and sig.table_ann
+
+@dataclass(frozen=True)
+class TypeDecl:
+    name: str
+    kind: str          # enum / class / record / interface
+    path: Path
+    embeddable: bool = False
+
+def find_type_declarations(text: str) -> List[Tuple[str, str, bool]]:
+    """
+    파일 본문에서 (타입명, kind, @Embeddable 여부) 목록을 한 번의 정규식 순회로 추출.
+    @Embeddable 뒤 300자 이내의 첫 class/record 선언을 embeddable로 표시한다.
+    """
+    ann_ends = [m.end() for m in EMBEDDABLE_ANN_RE.finditer(text)]
+    decls: List[Tuple[str, str, bool]] = []
+    for m in TYPE_DECL_RE.finditer(text):
+        embeddable = False
+        if ann_ends and m.group(1) in ("class", "record"):
+            while ann_ends and ann_ends[0] <= m.start():
+                embeddable = embeddable or m.start() - ann_ends[0] <= 300
+                ann_ends.pop(0)
+        decls.append((m.group(2), m.group(1), embeddable))
+    return decls
+
+@dataclass
+class DeclarationIndex:
+    """타입명 → 선언 파일 심볼 테이블. enum / @Embeddable 조회를 dict 조회로 처리한다."""
+    by_name: Dict[str, List[TypeDecl]] = field(default_factory=dict)
+
+    def add_decls(self, path: Path, decls: Iterable[Tuple[str, str, bool]]) -> List[TypeDecl]:
+        added = []
+        for name, kind, embeddable in decls:
+            decl = TypeDecl(name=name, kind=kind, path=path, embeddable=embeddable)
+            self.by_name.setdefault(name, []).append(decl)
+            added.append(decl)
+        return added
+
+    def enum_files(self, enum_names: Set[str]) -> List[Path]:
+        return sorted({d.path for n in enum_names for d in self.by_name.get(n, ()) if d.kind == "enum"})
 
-    def consider_file(f: Path):
-        if not f.is_file() or f.suffix not in cfg.exts:
-            return
-        text = _read_text(f)
+    def embeddable_files(self, class_names: Set[str]) -> List[Path]:
+        return sorted({d.path for n in class_names for d in self.by_name.get(n, ()) if d.embeddable})
 
-        if _has_entity(text):
-            candidates.add(f)
-            return
+def _declaration_index_for(repo_path: Path) -> DeclarationIndex:
+    from erd_agent.scan_cache import iter_file_signals
 
-        # 보조: 파일명 패턴
-        if ENTITY_NAME_RE.match(f.name):
-            candidates.add(f)
-            return
+    index = DeclarationIndex()
+    for f, sig, _ in iter_file_signals(iter_repo_files(repo_path, suffixes=(".java",))):
+        index.add_decls(f, sig.decls)
+    return index
 
-        # 매우 예외적인 케이스만: @Table only
-        if cfg.include_table_only and _has_table(text):
-            candidates.add(f)
+def scan_repo(repo_path: Path, cfg: ScanConfig | None = None) -> List[Path]:
+    """
+    JPA 엔티티 후보 파일을 찾아 반환한다.
+    우선순위:
+      1) @Entity가 있는 파일
+      2) 파일명이 *Entity.java 인 파일 (보조)
+      3) (옵션) @Table만 있는 파일 include_table_only=True일 때만
+    """
+    from erd_agent.scan_cache import iter_file_signals
+
+    cfg = cfg or ScanConfig()
+    files: dict[Path, None] = {}
 
     # 1) prefer_dirs 우선 탐색
     for d in cfg.prefer_dirs:
         p = repo_path / d
-        if p.exists() and p.is_dir():
-            for f in p.rglob("*"):
-                consider_file(f)
+        if p.is_dir():
+            files.update(dict.fromkeys(iter_repo_files(p, suffixes=cfg.exts, repo_root=repo_path)))
 
     # 2) 전체 탐색 (보완)
-    for f in repo_path.rglob("*.java"):
-        consider_file(f)
+    files.update(dict.fromkeys(iter_repo_files(repo_path, suffixes=cfg.exts)))
 
-    return sorted(candidates)
+    # 분류 신호는 스캔 캐시에서 가져온다 (크기/mtime이 그대로인 파일은 읽지 않음)
+    return sorted(f for f, sig, _ in iter_file_signals(files) if is_entity_signals(f, sig, cfg))
 
 def find_embedded_id_type_names_in_entity_text(text: str) -> Set[str]:
     """
@@ -114,22 +144,4 @@ def find_embeddable_definition_files(repo_path: Path, class_names: Set[str]) ->
     """
     if not class_names:
         return []
-    hits: Set[Path] = set()
-    for f in repo_path.rglob("*.java"):
-        if not f.is_file():
-            continue
-        try:
-            t = f.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-
-        # 빠른 필터: 이름이 없으면 skip
-        # (큰 레포에서 비용 감소)
-        if not any(name in t for name in class_names):
-            continue
-
-        for name in class_names:
-            if re.search(rf"@Embeddable\b[\s\S]{{0,300}}?\b(class|record)\s+{re.escape(name)}\b", t):
-                hits.add(f)
-                break
-    return sorted(hits)
+    return _declaration_index_for(repo_path).embeddable_files(class_names)
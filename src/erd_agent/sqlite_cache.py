@@ -0,0 +1,141 @@
+"""
+영구 캐시 공용 헬퍼.
+
+scan_cache(파일 분류) / parse_cache(ERD 파싱 조각) / stack_agent.catalog(아티팩트 설명) /
+llm.response_cache(LLM 응답)가 같은 틀을 쓴다.
+
+- LazyCache  : 프로세스 전역 인스턴스 (처음 get()할 때 한 번만 생성)
+- CacheStats : 적중/미스 집계 (stats())
+- connect / trim_table : SQLite 연결, 행 수 상한을 넘으면 오래 안 쓴(seen) 행부터 삭제
+- SQLiteCache: key → 문자열 값 테이블 (get_many / put_many, 선택적 만료 시간)
+
+캐시 조회/기록 실패는 결과에 영향이 없으므로 sqlite3.Error는 삼키고 다시 계산하게 둔다.
+"""
+from __future__ import annotations
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+C = TypeVar("C")
+
+# IN (...) 조회 한 번에 넣는 키 수 (SQLite 바인딩 변수 수 제한)
+_CHUNK = 500
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(path, timeout=30)
+
+
+def trim_table(conn: sqlite3.Connection, table: str, max_rows: int) -> None:
+    """행 수가 max_rows를 넘으면 seen이 오래된 행부터 90%까지 줄인다 (기록마다 삭제가 반복되지 않게)."""
+    (count,) = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+    if count > max_rows:
+        conn.execute(
+            f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} ORDER BY seen LIMIT ?)",
+            (count - int(max_rows * 0.9),),
+        )
+
+
+class CacheStats:
+    def __init__(self) -> None:
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, hits: int = 0, misses: int = 0) -> None:
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+
+    def stats(self) -> dict[str, int]:
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+class SQLiteCache(CacheStats):
+    """
+    key → 문자열 값(data) 테이블 하나짜리 캐시.
+    - 조회한 행은 seen(최근 사용 시각)을 갱신하고, 행 수가 max_rows를 넘으면 오래 안 쓴 행부터 삭제
+    - put_many(ttl=초)로 넣은 행은 그 시간이 지나면 조회되지 않는다 (실패 결과 같은 음성 캐시용)
+    """
+
+    def __init__(self, path: Path, table: str, max_rows: int):
+        super().__init__()
+        self.path = path
+        self.table = table
+        self.max_rows = max_rows
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = connect(self.path)
+        try:
+            with conn:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    " key TEXT PRIMARY KEY, data TEXT NOT NULL, seen REAL NOT NULL, expires REAL)"
+                )
+                # 이전 버전에서 만든 DB 파일에는 expires 컬럼이 없으므로 추가
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if "expires" not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN expires REAL")
+        finally:
+            conn.close()
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """캐시에 있는(만료되지 않은) 값만 반환 (조회한 항목은 최근 사용 시각 갱신)."""
+        found: dict[str, str] = {}
+        unique = list(dict.fromkeys(keys))
+        conn = connect(self.path)
+        try:
+            now = time.time()
+            for i in range(0, len(unique), _CHUNK):
+                chunk = unique[i:i + _CHUNK]
+                rows = conn.execute(
+                    f"SELECT key, data FROM {self.table} WHERE key IN ({','.join('?' * len(chunk))})"
+                    " AND (expires IS NULL OR expires > ?)",
+                    [*chunk, now],
+                ).fetchall()
+                found.update(rows)
+            if found:
+                with conn:
+                    conn.executemany(f"UPDATE {self.table} SET seen = ? WHERE key = ?", [(now, k) for k in found])
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+        self.count(hits=len(found), misses=len(unique) - len(found))
+        return found
+
+    def put_many(self, items: dict[str, str], ttl: float | None = None) -> None:
+        if not items:
+            return
+        conn = connect(self.path)
+        try:
+            now = time.time()
+            expires = now + ttl if ttl is not None else None
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, data, seen, expires) VALUES (?, ?, ?, ?)",
+                    [(k, v, now, expires) for k, v in items.items()],
+                )
+                trim_table(conn, self.table, self.max_rows)
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+
+
+class LazyCache(Generic[C]):
+    """프로세스 전역 캐시 인스턴스. 처음 get()할 때 factory로 한 번만 만든다."""
+
+    def __init__(self, factory: Callable[[], C]):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._value: C | None = None
+
+    def get(self) -> C:
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._factory()
+        return self._value
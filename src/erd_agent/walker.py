@@ -0,0 +1,205 @@
+"""
+레포 파일 순회기 (모든 스캐너 / DirFS 공용).
+
+- os.scandir 기반, 건너뛸 디렉터리는 내려가기 전에 잘라낸다 (.git, node_modules는 어디서나,
+  target/build/out/dist/vendor는 레포 루트나 빌드 파일 옆에서만 — src/ 아래 패키지는 유지)
+- 디렉터리별 .gitignore 규칙을 따른다 (부정 패턴 !, 디렉터리 전용 /, 앵커 /, ** 지원)
+- 크기 상한을 넘는 파일과 바이너리(확장자 / 앞부분 NUL 바이트)는 건너뛴다
+"""
+from __future__ import annotations
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from erd_agent.config import settings
+from erd_agent.repo import BUILD_MARKER_FILES, _SKIP_DIR_NAMES, _SKIP_EXTS, is_skipped_dir
+
+# 내용을 열어 보지 않고 텍스트로 간주하는 확장자 (바이너리 sniffing 생략)
+TEXT_EXTS = {
+    ".java", ".kt", ".kts", ".groovy", ".gradle", ".scala", ".xml", ".yml", ".yaml", ".properties",
+    ".json", ".toml", ".cfg", ".ini", ".conf", ".sql", ".md", ".txt", ".py", ".go", ".rs", ".rb",
+    ".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".css", ".scss", ".html", ".vue", ".sh", ".env",
+}
+
+_SNIFF_BYTES = 8000  # git과 같은 기준: 앞 8000바이트에 NUL이 있으면 바이너리
+
+
+def default_skip_dirs() -> set[str]:
+    """
+    어느 깊이에서든 제외하는 디렉터리 + SCAN_EXTRA_SKIP_DIRS(쉼표 구분).
+    빌드 산출물 디렉터리는 위치에 따라 판단하므로 여기 없다 (repo.is_skipped_dir).
+    """
+    extra = {d.strip() for d in settings.scan_extra_skip_dirs.split(",") if d.strip()}
+    return set(_SKIP_DIR_NAMES) | extra
+
+
+def _glob_to_regex(pattern: str) -> str:
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class GitIgnore:
+    """하나의 .gitignore 파일 규칙 (base 디렉터리 기준 상대 경로로 판정)."""
+
+    def __init__(self, base: str, lines: Iterable[str]):
+        self.base = base
+        self.rules: list[tuple[re.Pattern, bool, bool]] = []
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            if line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            # 중간/앞에 '/'가 있으면 base 기준 앵커, 없으면 어느 깊이든 이름으로 매칭
+            anchored = "/" in line
+            rx = _glob_to_regex(line.lstrip("/"))
+            if not anchored:
+                rx = "(?:.*/)?" + rx
+            self.rules.append((re.compile(f"^{rx}$"), negate, dir_only))
+
+    @classmethod
+    def load(cls, directory: str) -> "GitIgnore | None":
+        try:
+            with open(os.path.join(directory, ".gitignore"), encoding="utf-8", errors="ignore") as fh:
+                gi = cls(directory, fh)
+        except OSError:
+            return None
+        return gi if gi.rules else None
+
+    def match(self, path: str, is_dir: bool) -> bool | None:
+        """마지막으로 일치한 규칙 기준 True(무시)/False(재포함), 일치 없으면 None."""
+        rel = os.path.relpath(path, self.base).replace(os.sep, "/")
+        result = None
+        for rx, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if rx.match(rel):
+                result = not negate
+        return result
+
+
+def _ignored(path: str, is_dir: bool, ignores: list[GitIgnore]) -> bool:
+    result = False
+    for gi in ignores:  # 상위 → 하위 순서, 하위 .gitignore가 우선
+        m = gi.match(path, is_dir)
+        if m is not None:
+            result = m
+    return result
+
+
+def is_binary_file(path: str, suffix: str | None = None) -> bool:
+    suffix = (suffix if suffix is not None else os.path.splitext(path)[1]).lower()
+    if suffix in _SKIP_EXTS:
+        return True
+    if suffix in TEXT_EXTS:
+        return False
+    try:
+        with open(path, "rb") as fh:
+            return b"\0" in fh.read(_SNIFF_BYTES)
+    except OSError:
+        return True
+
+
+def iter_repo_files(
+    root: Path,
+    suffixes: tuple[str, ...] | None = None,
+    skip_dirs: set[str] | None = None,
+    gitignore: bool | None = None,
+    max_file_bytes: int | None = None,
+    skip_binary: bool = True,
+    repo_root: Path | None = None,
+) -> Iterator[Path]:
+    """
+    root 아래 분석 대상 파일을 디렉터리 순서(이름순)대로 yield.
+    suffixes를 주면 해당 확장자만, skip_dirs를 주면 기본 제외 규칙 대신 그 이름들만 제외.
+    root가 레포 하위 디렉터리(src/main/java 등)면 repo_root를 넘겨야 빌드 산출물 판정 깊이가 맞는다.
+    심볼릭 링크는 따라가지 않는다.
+    """
+    skip = default_skip_dirs() if skip_dirs is None else skip_dirs
+    use_gitignore = settings.scan_respect_gitignore if gitignore is None else gitignore
+    max_bytes = settings.scan_max_file_bytes if max_file_bytes is None else max_file_bytes
+    try:
+        base_parts = root.relative_to(repo_root).parts if repo_root is not None else ()
+    except ValueError:
+        base_parts = ()
+
+    stack: list[tuple[str, tuple[str, ...], list[GitIgnore]]] = [(str(root), base_parts, [])]
+    while stack:
+        directory, parents, ignores = stack.pop()
+        if use_gitignore:
+            gi = GitIgnore.load(directory)
+            if gi is not None:
+                ignores = [*ignores, gi]
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        is_module = skip_dirs is None and any(e.name in BUILD_MARKER_FILES for e in entries)
+        subdirs = []
+        for e in entries:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    if e.name in skip or (ignores and _ignored(e.path, True, ignores)):
+                        continue
+                    if skip_dirs is None and is_skipped_dir(e.name, parents, is_module):
+                        continue
+                    subdirs.append((e.path, e.name))
+                    continue
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                if suffixes and not e.name.endswith(suffixes):
+                    continue
+                if ignores and _ignored(e.path, False, ignores):
+                    continue
+                if max_bytes and e.stat(follow_symlinks=False).st_size > max_bytes:
+                    continue
+                if skip_binary and is_binary_file(e.path):
+                    continue
+            except OSError:
+                continue
+            yield Path(e.path)
+
+        # 이름순 전위 순회가 되도록 역순으로 push
+        stack.extend((d, (*parents, name), ignores) for d, name in reversed(subdirs))
@@ -0,0 +1,709 @@
+"""
+빌드/의존성 파일 네이티브 파서 — LLM 없이 직접 의존성 목록을 만든다.
+
+지원:
+  - Maven pom.xml: properties / project.* / parent 보간, dependencyManagement 관리 버전, 멀티 모듈 properties 상속
+  - Gradle: build.gradle(.kts) / settings.gradle(.kts) 단순 DSL, gradle.properties, 버전 카탈로그(libs.versions.toml)
+  - npm: package.json (+ package-lock.json / yarn.lock으로 실제 설치 버전 해석)
+  - Python: requirements.txt / pyproject.toml (PEP 621, Poetry) / setup.cfg / setup.py / Pipfile
+  - Go: go.mod (go.sum은 읽지 않음)
+  - 그 밖에: Cargo.toml, Gemfile, Dockerfile / docker-compose 이미지, GitHub Actions uses
+
+lock 파일은 버전 해석에만 쓰고 의존성 목록에는 직접(선언된) 의존성만 넣는다.
+"""
+from __future__ import annotations
+import configparser
+import json
+import re
+import tomllib
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+
+@dataclass
+class Dependency:
+    ecosystem: str               # maven / npm / pypi / go / cargo / rubygems / docker / github-actions
+    name: str                    # artifactId / 패키지명 / 모듈 경로 / 이미지명
+    group: str | None = None     # Maven groupId
+    version: str | None = None
+    scope: str | None = None     # compile / runtime / test / dev / provided / plugin / ...
+    source: str = ""             # 선언 파일 (레포 기준 상대 경로)
+
+    @property
+    def key(self) -> str:
+        """버전과 무관한 아티팩트 식별자 (설명 캐시 키)."""
+        return f"{self.ecosystem}:{self.group}:{self.name}" if self.group else f"{self.ecosystem}:{self.name}"
+
+
+@dataclass
+class BuildInfo:
+    dependencies: list[Dependency] = field(default_factory=list)
+    build_tools: list[str] = field(default_factory=list)
+    # 언어 → 버전 ("Java": "17", "Python": ">=3.12", "Go": "1.22", "Node.js": ">=18")
+    language_versions: dict[str, str] = field(default_factory=dict)
+    # 선언 파일별 생태계 (주 언어 판정용)
+    ecosystems: list[str] = field(default_factory=list)
+
+    def add_tool(self, tool: str) -> None:
+        if tool not in self.build_tools:
+            self.build_tools.append(tool)
+
+
+# ---- Maven ----
+
+_PLACEHOLDER_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _interpolate(value: str | None, props: dict[str, str], depth: int = 10) -> str | None:
+    """${name} 치환 (중첩 허용). 해석하지 못한 자리표시자는 그대로 둔다."""
+    if value is None:
+        return None
+    value = value.strip()
+    for _ in range(depth):
+        new = _PLACEHOLDER_RE.sub(lambda m: props.get(m.group(1), m.group(0)), value)
+        if new == value:
+            break
+        value = new
+    return value
+
+
+def _xml_root(text: str) -> ET.Element | None:
+    try:
+        root = ET.fromstring(text)
+    except ET.ParseError:
+        return None
+    for el in root.iter():
+        if isinstance(el.tag, str) and "}" in el.tag:
+            el.tag = el.tag.split("}", 1)[1]
+    return root
+
+
+def _child_text(el: ET.Element | None, tag: str) -> str | None:
+    if el is None:
+        return None
+    child = el.find(tag)
+    return child.text.strip() if child is not None and child.text else None
+
+
+def _pom_properties(root: ET.Element) -> dict[str, str]:
+    props: dict[str, str] = {}
+    parent = root.find("parent")
+    for prefix in ("project.", ""):
+        for tag in ("groupId", "artifactId", "version"):
+            value = _child_text(root, tag) or _child_text(parent, tag)
+            if value:
+                props[f"{prefix}{tag}"] = value
+        for tag in ("groupId", "artifactId", "version"):
+            value = _child_text(parent, tag)
+            if value:
+                props[f"{prefix}parent.{tag}"] = value
+    props_el = root.find("properties")
+    if props_el is not None:
+        for p in props_el:
+            if isinstance(p.tag, str) and p.text:
+                props[p.tag] = p.text.strip()
+    return props
+
+
+def _parse_maven(poms: list[tuple[str, str]], info: BuildInfo) -> None:
+    parsed = [(src, r) for src, r in ((src, _xml_root(text)) for src, text in poms) if r is not None]
+    if not parsed:
+        return
+    info.add_tool("Maven")
+    # 멀티 모듈: 상위(경로가 얕은) pom의 properties를 하위가 상속하고 덮어쓴다
+    parsed.sort(key=lambda x: (len(PurePosixPath(x[0]).parts), x[0]))
+    inherited: dict[str, str] = {}
+    for _, root in parsed:
+        for k, v in _pom_properties(root).items():
+            inherited.setdefault(k, v)
+
+    # 레포 안의 모듈끼리 참조하는 의존성은 외부 아티팩트가 아니므로 제외
+    modules = {
+        (_child_text(r, "groupId") or _child_text(r.find("parent"), "groupId"), _child_text(r, "artifactId"))
+        for _, r in parsed
+    }
+    managed: dict[tuple[str, str], str] = {}
+    boot_version: str | None = None
+    per_pom: list[tuple[str, ET.Element, dict[str, str]]] = []
+    for src, root in parsed:
+        props = {**inherited, **_pom_properties(root)}
+        per_pom.append((src, root, props))
+        for dep in root.findall("dependencyManagement/dependencies/dependency"):
+            g, a = _interpolate(_child_text(dep, "groupId"), props), _interpolate(_child_text(dep, "artifactId"), props)
+            v = _interpolate(_child_text(dep, "version"), props)
+            if g and a and v:
+                managed.setdefault((g, a), v)
+                if a == "spring-boot-dependencies":
+                    boot_version = boot_version or v
+        parent = root.find("parent")
+        if _child_text(parent, "artifactId") in ("spring-boot-starter-parent", "spring-boot-dependencies"):
+            boot_version = boot_version or _interpolate(_child_text(parent, "version"), props)
+
+    for src, root, props in per_pom:
+        for key in ("maven.compiler.release", "java.version", "maven.compiler.source", "maven.compiler.target"):
+            if key in props and "Java" not in info.language_versions:
+                info.language_versions["Java"] = _interpolate(props[key], props)
+        parent = root.find("parent")
+        parent_key = (_child_text(parent, "groupId"), _child_text(parent, "artifactId"))
+        if parent is not None and parent_key[1] and parent_key not in modules:
+            info.dependencies.append(Dependency(
+                "maven", _child_text(parent, "artifactId"), _child_text(parent, "groupId"),
+                _interpolate(_child_text(parent, "version"), props), "parent", src,
+            ))
+        for dep in root.findall("dependencies/dependency"):
+            g = _interpolate(_child_text(dep, "groupId"), props)
+            a = _interpolate(_child_text(dep, "artifactId"), props)
+            if not a or (g, a) in modules:
+                continue
+            v = _interpolate(_child_text(dep, "version"), props) or managed.get((g or "", a))
+            if v is None and g == "org.springframework.boot":
+                v = boot_version
+            scope = _child_text(dep, "scope") or "compile"
+            info.dependencies.append(Dependency("maven", a, g, v, scope, src))
+        for dep in root.findall("dependencyManagement/dependencies/dependency"):
+            if _child_text(dep, "scope") == "import":  # BOM
+                info.dependencies.append(Dependency(
+                    "maven", _interpolate(_child_text(dep, "artifactId"), props),
+                    _interpolate(_child_text(dep, "groupId"), props),
+                    _interpolate(_child_text(dep, "version"), props), "import", src,
+                ))
+        for plugin in root.findall("build/plugins/plugin"):
+            a = _child_text(plugin, "artifactId")
+            if not a:
+                continue
+            g = _child_text(plugin, "groupId") or "org.apache.maven.plugins"
+            v = _interpolate(_child_text(plugin, "version"), props) or managed.get((g, a))
+            if v is None and a == "spring-boot-maven-plugin":
+                v = boot_version
+            info.dependencies.append(Dependency("maven", a, g, v, "plugin", src))
+            if a == "maven-compiler-plugin" and "Java" not in info.language_versions:
+                conf = plugin.find("configuration")
+                java = _child_text(conf, "release") or _child_text(conf, "source")
+                if java:
+                    info.language_versions["Java"] = _interpolate(java, props)
+            if a == "kotlin-maven-plugin":
+                info.ecosystems.append("kotlin")
+        info.ecosystems.append("maven")
+
+
+# ---- Gradle ----
+
+_GRADLE_COMMENT_RE = re.compile(r'("(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\')|//[^\n]*|/\*[\s\S]*?\*/')
+
+_GRADLE_CONFIGS = {
+    "implementation": "compile", "api": "compile", "compile": "compile",
+    "compileOnly": "provided", "runtimeOnly": "runtime", "runtime": "runtime",
+    "developmentOnly": "dev", "annotationProcessor": "annotation", "kapt": "annotation", "ksp": "annotation",
+    "testImplementation": "test", "testCompileOnly": "test", "testRuntimeOnly": "test", "testCompile": "test",
+    "testAnnotationProcessor": "test", "integrationTestImplementation": "test", "classpath": "plugin",
+}
+_CONF = "|".join(sorted(_GRADLE_CONFIGS, key=len, reverse=True))
+_Q = r"""["']"""
+_GRADLE_COORD_RE = re.compile(
+    rf"\b({_CONF})\b\s*\(?\s*(?:(?:platform|enforcedPlatform)\s*\(\s*)?{_Q}([^\"'\s]+:[^\"'\s]+){_Q}"
+)
+_GRADLE_MAP_RE = re.compile(
+    rf"\b({_CONF})\b\s*\(?\s*group\s*[:=]\s*{_Q}([^\"']+){_Q}\s*,\s*name\s*[:=]\s*{_Q}([^\"']+){_Q}"
+    rf"(?:\s*,\s*version\s*[:=]\s*{_Q}([^\"']+){_Q})?"
+)
+_GRADLE_CATALOG_REF_RE = re.compile(
+    rf"\b({_CONF})\b\s*\(?\s*(?:(?:platform|enforcedPlatform)\s*\(\s*)?(libs\.(?:bundles\.)?[\w.]+?)(?:\.get\(\))?\s*\)?(?=\s|$|\))"
+)
+_GRADLE_PLUGIN_ID_RE = re.compile(rf"\bid\s*\(?\s*{_Q}([\w.\-]+){_Q}\s*\)?(?:\s*version\s*\(?\s*{_Q}([^\"']+){_Q})?")
+_GRADLE_KOTLIN_PLUGIN_RE = re.compile(rf"\bkotlin\s*\(\s*{_Q}([\w.\-]+){_Q}\s*\)(?:\s*version\s*{_Q}([^\"']+){_Q})?")
+_GRADLE_PLUGIN_ALIAS_RE = re.compile(r"\balias\s*\(\s*libs\.plugins\.([\w.]+)\s*\)")
+_GRADLE_APPLY_RE = re.compile(rf"\bapply\s+plugin\s*:\s*{_Q}([\w.\-]+){_Q}")
+_GRADLE_VAR_RE = re.compile(rf"(?:\b(?:def|val|var)\s+|\bext\.|\bextra\[\s*{_Q}|\bset\(\s*{_Q})?\b([A-Za-z_][\w.]*)(?:{_Q}\s*\])?\s*(?:=|,)\s*{_Q}([^\"'\n$]+){_Q}")
+_GRADLE_REF_RE = re.compile(r"\$\{?([A-Za-z_][\w.]*)\}?")
+_GRADLE_JAVA_RES = (
+    re.compile(r"JavaLanguageVersion\.of\(\s*(\d+)\s*\)"),
+    re.compile(r"\b(?:source|target)Compatibility\s*=\s*(?:JavaVersion\.VERSION_)?['\"]?([\d._]+)"),
+    re.compile(r"\bjvmToolchain\(\s*(\d+)\s*\)"),
+    re.compile(r"\bjvmTarget\s*=\s*['\"]([\d.]+)['\"]"),
+)
+
+
+def _java_version(raw: str) -> str:
+    """'1_8' / '1.8' → '8', '17' → '17'."""
+    v = raw.replace("_", ".")
+    return v[2:] if v.startswith("1.") and len(v) > 2 else v
+
+
+def _catalog_accessor(alias: str) -> str:
+    return re.sub(r"[-_.]", ".", alias).lower()
+
+
+class _VersionCatalog:
+    def __init__(self) -> None:
+        self.libraries: dict[str, tuple[str, str, str | None]] = {}  # accessor → (group, name, version)
+        self.bundles: dict[str, list[str]] = {}
+        self.plugins: dict[str, tuple[str, str | None]] = {}  # accessor → (id, version)
+
+    def load(self, text: str) -> None:
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError:
+            return
+        versions = {
+            k: (v if isinstance(v, str) else v.get("strictly") or v.get("require") or v.get("prefer"))
+            for k, v in (data.get("versions") or {}).items()
+        }
+
+        def version_of(spec: dict) -> str | None:
+            v = spec.get("version")
+            if isinstance(v, dict):
+                return versions.get(v.get("ref")) if "ref" in v else v.get("strictly") or v.get("require")
+            if v is not None:
+                return v
+            ref = spec.get("version.ref")
+            return versions.get(ref) if ref else None
+
+        for alias, spec in (data.get("libraries") or {}).items():
+            if isinstance(spec, str):
+                parts = spec.split(":")
+                if len(parts) >= 2:
+                    self.libraries[_catalog_accessor(alias)] = (parts[0], parts[1], parts[2] if len(parts) > 2 else None)
+                continue
+            module = spec.get("module")
+            group, name = module.split(":", 1) if module else (spec.get("group"), spec.get("name"))
+            if group and name:
+                self.libraries[_catalog_accessor(alias)] = (group, name, version_of(spec))
+        for alias, members in (data.get("bundles") or {}).items():
+            self.bundles[_catalog_accessor(alias)] = [_catalog_accessor(m) for m in members]
+        for alias, spec in (data.get("plugins") or {}).items():
+            if isinstance(spec, str):
+                pid, _, ver = spec.partition(":")
+                self.plugins[_catalog_accessor(alias)] = (pid, ver or None)
+            else:
+                self.plugins[_catalog_accessor(alias)] = (spec.get("id"), version_of(spec))
+
+
+def _gradle_vars(text: str, props: dict[str, str]) -> dict[str, str]:
+    found = dict(props)
+    for name, value in _GRADLE_VAR_RE.findall(text):
+        found.setdefault(name, value)
+        found.setdefault(name.rsplit(".", 1)[-1], value)
+    return found
+
+
+def _gradle_interpolate(value: str | None, variables: dict[str, str]) -> str | None:
+    if value is None:
+        return None
+
+    def sub(m: re.Match) -> str:
+        name = m.group(1)
+        for key in (name, name.removeprefix("project.").removeprefix("rootProject."), name.rsplit(".", 1)[-1]):
+            if key in variables:
+                return variables[key]
+        return m.group(0)
+
+    return _GRADLE_REF_RE.sub(sub, value)
+
+
+def _parse_gradle(
+    scripts: list[tuple[str, str]],
+    properties: list[str],
+    catalogs: list[str],
+    info: BuildInfo,
+) -> None:
+    if not scripts and not catalogs:
+        return
+    info.add_tool("Gradle")
+    props: dict[str, str] = {}
+    for text in properties:
+        for line in text.splitlines():
+            key, sep, value = line.partition("=")
+            if sep and not key.lstrip().startswith("#"):
+                props.setdefault(key.strip(), value.strip())
+    catalog = _VersionCatalog()
+    for text in catalogs:
+        catalog.load(text)
+
+    referenced: set[str] = set()
+    for src, raw in scripts:
+        text = _GRADLE_COMMENT_RE.sub(lambda m: m.group(1) or "", raw)
+        variables = _gradle_vars(text, props)
+        if src.endswith(".kts"):
+            info.ecosystems.append("kotlin" if "kotlin(" in text else "gradle")
+        for conf, coord in _GRADLE_COORD_RE.findall(text):
+            parts = _gradle_interpolate(coord, variables).split(":")
+            version = parts[2] if len(parts) > 2 else None
+            info.dependencies.append(Dependency("maven", parts[1], parts[0], version, _GRADLE_CONFIGS[conf], src))
+        for conf, g, a, v in _GRADLE_MAP_RE.findall(text):
+            info.dependencies.append(Dependency(
+                "maven", a, g, _gradle_interpolate(v or None, variables), _GRADLE_CONFIGS[conf], src,
+            ))
+        for conf, ref in _GRADLE_CATALOG_REF_RE.findall(text):
+            accessor = ref.removeprefix("libs.").lower()
+            aliases = catalog.bundles.get(accessor.removeprefix("bundles."), []) if accessor.startswith("bundles.") else [accessor]
+            for alias in aliases:
+                lib = catalog.libraries.get(alias)
+                if lib:
+                    referenced.add(alias)
+                    info.dependencies.append(Dependency("maven", lib[1], lib[0], lib[2], _GRADLE_CONFIGS[conf], src))
+        for pid, version in _GRADLE_PLUGIN_ID_RE.findall(text):
+            info.dependencies.append(Dependency("gradle-plugin", pid, None, _gradle_interpolate(version or None, variables), "plugin", src))
+        for pid, version in _GRADLE_KOTLIN_PLUGIN_RE.findall(text):
+            info.dependencies.append(Dependency("gradle-plugin", f"org.jetbrains.kotlin.{pid}", None, version or None, "plugin", src))
+        for alias in _GRADLE_PLUGIN_ALIAS_RE.findall(text):
+            plugin = catalog.plugins.get(alias.lower())
+            if plugin and plugin[0]:
+                info.dependencies.append(Dependency("gradle-plugin", plugin[0], None, plugin[1], "plugin", src))
+        for pid in _GRADLE_APPLY_RE.findall(text):
+            info.dependencies.append(Dependency("gradle-plugin", pid, None, None, "plugin", src))
+        if any(d.ecosystem == "gradle-plugin" and d.name.startswith("org.jetbrains.kotlin.")
+               for d in info.dependencies if d.source == src):
+            info.ecosystems.append("kotlin")
+        if "Java" not in info.language_versions:
+            for rx in _GRADLE_JAVA_RES:
+                m = rx.search(text)
+                if m:
+                    info.language_versions["Java"] = _java_version(m.group(1))
+                    break
+        info.ecosystems.append("gradle")
+
+    # 카탈로그만 있고 빌드 스크립트에서 참조를 찾지 못했으면 (buildSrc 등) 카탈로그 전체를 의존성으로 본다
+    if catalog.libraries and not referenced:
+        for alias, (g, a, v) in catalog.libraries.items():
+            info.dependencies.append(Dependency("maven", a, g, v, None, "gradle/libs.versions.toml"))
+
+
+# ---- npm ----
+
+_YARN_VERSION_RE = re.compile(r'^\s+version:?\s+"?([^"\s]+)"?', re.MULTILINE)
+
+
+def _npm_lock_versions(name: str, text: str) -> dict[str, str]:
+    """lock 파일 → {패키지명: 설치 버전} (최상위 설치본만)."""
+    versions: dict[str, str] = {}
+    if name == "package-lock.json":
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return versions
+        for path, meta in (data.get("packages") or {}).items():
+            if path.count("node_modules/") == 1 and isinstance(meta, dict) and meta.get("version"):
+                versions[path.split("node_modules/", 1)[1]] = meta["version"]
+        for pkg, meta in (data.get("dependencies") or {}).items():  # lockfileVersion 1
+            if isinstance(meta, dict) and meta.get("version"):
+                versions.setdefault(pkg, meta["version"])
+        return versions
+    # yarn.lock (v1 / berry): 들여쓰기 없는 헤더 줄 다음의 version 줄
+    for block in re.split(r"\n(?=\S)", text):
+        header, _, body = block.partition("\n")
+        if not header.rstrip().endswith(":") or header.startswith("#"):
+            continue
+        m = _YARN_VERSION_RE.search(body)
+        if not m:
+            continue
+        for entry in header.rstrip(":").split(","):
+            entry = entry.strip().strip('"')
+            pkg = entry[: entry.rfind("@")] if entry.rfind("@") > 0 else entry
+            pkg = pkg.removesuffix("@npm")
+            versions.setdefault(pkg, m.group(1))
+    return versions
+
+
+_NPM_SECTIONS = {
+    "dependencies": "runtime",
+    "devDependencies": "dev",
+    "peerDependencies": "peer",
+    "optionalDependencies": "optional",
+}
+
+
+def _parse_npm(
+    manifests: list[tuple[str, str]],
+    locks: dict[str, tuple[str, dict[str, str]]],
+    info: BuildInfo,
+) -> None:
+    """locks: 디렉터리 → (lock 파일명, 버전 맵). 같은 디렉터리의 lock으로 선언 범위를 설치 버전으로 바꾼다."""
+    for src, text in manifests:
+        try:
+            data = json.loads(text)
+        except ValueError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        lock_name, lock = locks.get(str(PurePosixPath(src).parent), ("", {}))
+        info.add_tool("yarn" if lock_name == "yarn.lock" else "npm")
+        node = (data.get("engines") or {}).get("node")
+        if node:
+            info.language_versions.setdefault("Node.js", node)
+        typescript = False
+        for section, scope in _NPM_SECTIONS.items():
+            for pkg, spec in (data.get(section) or {}).items():
+                typescript = typescript or pkg == "typescript"
+                info.dependencies.append(Dependency("npm", pkg, None, lock.get(pkg) or str(spec), scope, src))
+        info.ecosystems.append("typescript" if typescript else "npm")
+
+
+# ---- Python ----
+
+_PEP508_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^\]]*\])?\s*(.*?)\s*(?:;.*)?$")
+
+
+def _pep508(spec: str, scope: str | None, src: str) -> Dependency | None:
+    spec = spec.split(" #", 1)[0].strip()
+    if not spec or spec.startswith(("-", "#")) or "://" in spec.split("@", 1)[0]:
+        return None
+    m = _PEP508_RE.match(spec)
+    if not m:
+        return None
+    version = m.group(3).strip().strip("()") or None
+    if version and version.startswith("@"):  # name @ url
+        version = None
+    elif version and version.startswith("==") and "," not in version:
+        version = version[2:].strip()
+    return Dependency("pypi", m.group(1).lower().replace("_", "-"), None, version, scope, src)
+
+
+def _poetry_version(spec) -> str | None:
+    if isinstance(spec, str):
+        return None if spec == "*" else spec
+    if isinstance(spec, dict):
+        return spec.get("version")
+    return None
+
+
+_SETUP_PY_LIST_RE = re.compile(r"install_requires\s*=\s*\[([^\]]*)\]", re.S)
+_SETUP_PY_PYTHON_RE = re.compile(r"python_requires\s*=\s*['\"]([^'\"]+)['\"]")
+_BUILD_BACKENDS = {
+    "poetry": "Poetry", "hatchling": "Hatch", "flit": "Flit", "pdm": "PDM",
+    "setuptools": "setuptools", "maturin": "maturin",
+}
+
+
+def _parse_python(files: list[tuple[str, str, str]], info: BuildInfo) -> None:
+    for name, src, text in files:
+        deps: list[Dependency | None] = []
+        if name == "requirements.txt":
+            info.add_tool("pip")
+            deps = [_pep508(line, "runtime", src) for line in text.splitlines()]
+        elif name in ("pyproject.toml", "Pipfile"):
+            try:
+                data = tomllib.loads(text)
+            except tomllib.TOMLDecodeError:
+                continue
+            if name == "Pipfile":
+                info.add_tool("Pipenv")
+                for section, scope in (("packages", "runtime"), ("dev-packages", "dev")):
+                    for pkg, spec in (data.get(section) or {}).items():
+                        deps.append(Dependency("pypi", pkg.lower(), None, _poetry_version(spec), scope, src))
+                py = (data.get("requires") or {}).get("python_version")
+                if py:
+                    info.language_versions.setdefault("Python", py)
+            else:
+                project = data.get("project") or {}
+                deps += [_pep508(s, "runtime", src) for s in project.get("dependencies") or []]
+                for group, specs in (project.get("optional-dependencies") or {}).items():
+                    deps += [_pep508(s, group, src) for s in specs]
+                for group, specs in (data.get("dependency-groups") or {}).items():
+                    deps += [_pep508(s, group, src) for s in specs if isinstance(s, str)]
+                if project.get("requires-python"):
+                    info.language_versions.setdefault("Python", project["requires-python"])
+                poetry = (data.get("tool") or {}).get("poetry") or {}
+                sections = [("dependencies", "runtime"), ("dev-dependencies", "dev")]
+                sections += [(f"group.{g}.dependencies", g) for g in (poetry.get("group") or {})]
+                for section, scope in sections:
+                    table = poetry
+                    for part in section.split("."):
+                        table = (table or {}).get(part) or {}
+                    for pkg, spec in table.items():
+                        if pkg.lower() == "python":
+                            info.language_versions.setdefault("Python", _poetry_version(spec) or "")
+                            continue
+                        deps.append(Dependency("pypi", pkg.lower(), None, _poetry_version(spec), scope, src))
+                backend = (data.get("build-system") or {}).get("build-backend", "")
+                tool = next((t for k, t in _BUILD_BACKENDS.items() if backend.startswith(k)), None)
+                if "uv" in (data.get("tool") or {}):
+                    tool = "uv"
+                info.add_tool(tool or "pip")
+        elif name == "setup.cfg":
+            parser = configparser.ConfigParser()
+            try:
+                parser.read_string(text)
+            except configparser.Error:
+                continue
+            info.add_tool("setuptools")
+            if parser.has_option("options", "install_requires"):
+                deps = [_pep508(s, "runtime", src) for s in parser.get("options", "install_requires").splitlines()]
+            if parser.has_section("options.extras_require"):
+                for group, specs in parser.items("options.extras_require"):
+                    deps += [_pep508(s, group, src) for s in specs.splitlines()]
+            if parser.has_option("options", "python_requires"):
+                info.language_versions.setdefault("Python", parser.get("options", "python_requires"))
+        elif name == "setup.py":
+            info.add_tool("setuptools")
+            m = _SETUP_PY_LIST_RE.search(text)
+            if m:
+                deps = [_pep508(s, "runtime", src) for s in re.findall(r"['\"]([^'\"]+)['\"]", m.group(1))]
+            m = _SETUP_PY_PYTHON_RE.search(text)
+            if m:
+                info.language_versions.setdefault("Python", m.group(1))
+        info.dependencies += [d for d in deps if d is not None]
+        info.ecosystems.append("python")
+
+
+# ---- Go ----
+
+_GO_REQUIRE_RE = re.compile(r"^\s*(?:require\s+)?([\w.\-~/]+\.[\w.\-~/]+)\s+(v[^\s]+)(\s*//\s*indirect)?", re.MULTILINE)
+
+
+def _parse_go_mod(src: str, text: str, info: BuildInfo) -> None:
+    info.add_tool("Go modules")
+    m = re.search(r"^go\s+([\d.]+)", text, re.MULTILINE)
+    if m:
+        info.language_versions.setdefault("Go", m.group(1))
+    # replace/exclude/retract 블록은 의존성이 아니다
+    text = re.sub(r"^(replace|exclude|retract)\s*\([\s\S]*?^\)", "", text, flags=re.MULTILINE)
+    text = re.sub(r"^(replace|exclude|retract)\s.*$", "", text, flags=re.MULTILINE)
+    text = re.sub(r"^module\s.*$", "", text, flags=re.MULTILINE)
+    for path, version, indirect in _GO_REQUIRE_RE.findall(text):
+        info.dependencies.append(Dependency("go", path, None, version, "indirect" if indirect else "compile", src))
+    info.ecosystems.append("go")
+
+
+# ---- 기타 (Cargo / Bundler / Docker / GitHub Actions) ----
+
+def _parse_cargo(src: str, text: str, info: BuildInfo) -> None:
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError:
+        return
+    info.add_tool("Cargo")
+    package = data.get("package") or {}
+    if package.get("rust-version") or package.get("edition"):
+        info.language_versions.setdefault("Rust", package.get("rust-version") or f"edition {package['edition']}")
+    tables = [
+        (data.get("dependencies"), "compile"),
+        (data.get("dev-dependencies"), "dev"),
+        (data.get("build-dependencies"), "build"),
+        ((data.get("workspace") or {}).get("dependencies"), "compile"),
+    ]
+    for table, scope in tables:
+        for crate, spec in (table or {}).items():
+            version = spec if isinstance(spec, str) else (spec or {}).get("version")
+            info.dependencies.append(Dependency("cargo", crate, None, version, scope, src))
+    info.ecosystems.append("cargo")
+
+
+_GEM_RE = re.compile(r"""^\s*gem\s+['"]([^'"]+)['"](?:\s*,\s*['"]([^'"]+)['"])?""")
+_GEM_GROUP_RE = re.compile(r"^\s*group\s+:?(\w+)")
+
+
+def _parse_gemfile(src: str, text: str, info: BuildInfo) -> None:
+    info.add_tool("Bundler")
+    group: str | None = None
+    for line in text.splitlines():
+        m = _GEM_GROUP_RE.match(line)
+        if m:
+            group = m.group(1)
+            continue
+        if re.match(r"^end\b", line.strip()):
+            group = None
+            continue
+        m = _GEM_RE.match(line)
+        if m:
+            info.dependencies.append(Dependency("rubygems", m.group(1), None, m.group(2), group or "runtime", src))
+        m = re.match(r"""^\s*ruby\s+['"]([^'"]+)['"]""", line)
+        if m:
+            info.language_versions.setdefault("Ruby", m.group(1))
+    info.ecosystems.append("ruby")
+
+
+_DOCKER_FROM_RE = re.compile(r"^\s*FROM\s+(?:--platform=\S+\s+)?(\S+)(?:\s+AS\s+(\S+))?", re.IGNORECASE | re.MULTILINE)
+_COMPOSE_IMAGE_RE = re.compile(r"^\s*image:\s*['\"]?([^\s'\"#]+)", re.MULTILINE)
+_ACTIONS_USES_RE = re.compile(r"^\s*-?\s*uses:\s*['\"]?([\w.\-/]+)@([\w.\-]+)", re.MULTILINE)
+
+
+def _image(ref: str, scope: str, src: str) -> Dependency:
+    name, _, digest = ref.partition("@")
+    image, sep, tag = name.rpartition(":")
+    if not sep or "/" in tag:  # 태그 없음 (registry:port/name 형태 포함)
+        image, tag = name, None
+    return Dependency("docker", image, None, tag or (digest or None), scope, src)
+
+
+def _parse_docker(src: str, text: str, info: BuildInfo) -> None:
+    if PurePosixPath(src).name == "Dockerfile":
+        stages: set[str] = set()
+        for ref, alias in _DOCKER_FROM_RE.findall(text):
+            if ref.lower() not in stages and ref.lower() != "scratch":
+                info.dependencies.append(_image(ref, "base image", src))
+            if alias:
+                stages.add(alias.lower())
+        info.add_tool("Docker")
+    else:
+        for ref in _COMPOSE_IMAGE_RE.findall(text):
+            info.dependencies.append(_image(ref, "service", src))
+        info.add_tool("Docker Compose")
+
+
+def _parse_workflow(src: str, text: str, info: BuildInfo) -> None:
+    for action, version in _ACTIONS_USES_RE.findall(text):
+        info.dependencies.append(Dependency("github-actions", action, None, version, "ci", src))
+    info.add_tool("GitHub Actions")
+
+
+# ---- 진입점 ----
+
+_PYTHON_FILES = {"requirements.txt", "pyproject.toml", "setup.py", "setup.cfg", "Pipfile"}
+_GRADLE_SCRIPTS = {"build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts"}
+
+
+def parse_build_files(file_texts: list[tuple[Path, str]], root: Path) -> BuildInfo:
+    """
+    빌드/의존성 파일들을 파싱해 의존성·빌드 도구·언어 버전을 모은다.
+    지원하지 않는 파일(Makefile, application.yml 등)은 무시한다.
+    """
+    info = BuildInfo()
+    poms: list[tuple[str, str]] = []
+    gradle_scripts: list[tuple[str, str]] = []
+    gradle_props: list[str] = []
+    catalogs: list[str] = []
+    npm: list[tuple[str, str]] = []
+    npm_locks: dict[str, tuple[str, dict[str, str]]] = {}
+    python: list[tuple[str, str, str]] = []
+    others: list[tuple[str, str, str]] = []
+
+    for path, text in sorted(file_texts, key=lambda x: x[0]):
+        try:
+            src = path.relative_to(root).as_posix()
+        except ValueError:
+            src = path.as_posix()
+        name = path.name
+        if name == "pom.xml":
+            poms.append((src, text))
+        elif name in _GRADLE_SCRIPTS:
+            gradle_scripts.append((src, text))
+        elif name == "gradle.properties":
+            gradle_props.append(text)
+        elif name.endswith(".versions.toml"):
+            catalogs.append(text)
+        elif name == "package.json":
+            npm.append((src, text))
+        elif name in ("package-lock.json", "yarn.lock"):
+            npm_locks[str(PurePosixPath(src).parent)] = (name, _npm_lock_versions(name, text))
+        elif name in _PYTHON_FILES:
+            python.append((name, src, text))
+        else:
+            others.append((name, src, text))
+
+    _parse_maven(poms, info)
+    _parse_gradle(gradle_scripts, gradle_props, catalogs, info)
+    _parse_npm(npm, npm_locks, info)
+    _parse_python(python, info)
+    for name, src, text in others:
+        if name == "go.mod":
+            _parse_go_mod(src, text, info)
+        elif name == "Cargo.toml":
+            _parse_cargo(src, text, info)
+        elif name == "Gemfile":
+            _parse_gemfile(src, text, info)
+        elif name == "Dockerfile" or name.startswith("docker-compose"):
+            _parse_docker(src, text, info)
+        elif src.startswith(".github/workflows/"):
+            _parse_workflow(src, text, info)
+    return info
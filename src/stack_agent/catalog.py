@@ -0,0 +1,177 @@
+"""
+의존성 분류 규칙 + 아티팩트 설명 카탈로그.
+
+- categorize(): 아티팩트 이름 패턴 → 카테고리 (Framework / Database / Testing ...)
+- KNOWN_DESCRIPTIONS: 자주 쓰는 아티팩트의 한 줄 설명 (LLM 없이 채움)
+- DescriptionCache: LLM이 써 준 설명을 아티팩트 키(버전 무관)로 SQLite에 저장 —
+  레포가 달라도 한 번 설명한 아티팩트는 다시 묻지 않는다 (LLM_CACHE_ENABLED=false면 사용 안 함).
+  설명을 못 받은 아티팩트는 STACK_DESCRIBE_NEGATIVE_TTL 동안만 빈 설명으로 저장한다.
+"""
+from __future__ import annotations
+import json
+import re
+from pathlib import Path
+
+from erd_agent.config import settings, writable_cache_root
+from erd_agent.sqlite_cache import LazyCache, SQLiteCache
+from stack_agent.build_parsers import Dependency
+
+# 문서에 나오는 카테고리 순서
+CATEGORY_ORDER = [
+    "Framework", "Web / HTTP", "Database", "ORM / Data Access", "Cache", "Messaging", "Security",
+    "API Docs", "Cloud", "Logging / Monitoring", "Utilities", "Testing", "Build / Tooling",
+    "DevOps", "CI/CD", "Other",
+]
+
+# (패턴, 카테고리) — "group:name" 또는 "name"(소문자)에 대해 위에서부터 처음 일치하는 규칙
+_RULES: list[tuple[re.Pattern, str]] = [(re.compile(p), c) for p, c in [
+    (r"spring-boot-starter-test|junit|mockito|assertj|hamcrest|testcontainers|rest-assured|^pytest|^jest$|vitest|mocha|"
+     r"^chai$|cypress|playwright|@testing-library|stretchr/testify|rspec|kotest|mockk|wiremock|^coverage$|faker", "Testing"),
+    (r"spring-boot-starter-data-|hibernate|mybatis|jooq|querydsl|spring-data|flyway|liquibase|sqlalchemy|alembic|"
+     r"prisma|typeorm|sequelize|mongoose|gorm|diesel|sqlx|^knex$|drizzle|exposed", "ORM / Data Access"),
+    (r"postgresql|^pg$|psycopg|asyncpg|mysql|mariadb|com\.h2database|^h2$|ojdbc|mssql|sqlite|mongodb|mongo-|"
+     r"jackc/pgx|lib/pq|cassandra|dynamodb|elasticsearch|opensearch|neo4j|^postgres$", "Database"),
+    (r"redis|jedis|lettuce|caffeine|ehcache|hazelcast|memcache|spring-boot-starter-cache", "Cache"),
+    (r"kafka|amqp|rabbit|activemq|pulsar|nats|celery|bullmq|spring-cloud-stream|jms|sqs|^kombu$", "Messaging"),
+    (r"security|oauth|jwt|jjwt|jose|keycloak|passport|bcrypt|authlib|auth0|nimbus|shiro|casbin", "Security"),
+    (r"springdoc|swagger|openapi|redoc", "API Docs"),
+    (r"aws|boto|azure|google-cloud|spring-cloud|firebase|kubernetes-client", "Cloud"),
+    (r"logback|log4j|slf4j|micrometer|actuator|prometheus|opentelemetry|sentry|datadog|winston|pino|loguru|"
+     r"uber\.org/zap|go\.uber\.org/zap|logrus|zerolog|structlog|newrelic", "Logging / Monitoring"),
+    (r"spring-boot-starter-web|spring-webmvc|spring-webflux|feign|okhttp|retrofit|axios|^requests$|httpx|aiohttp|"
+     r"uvicorn|gunicorn|netty|tomcat|undertow|jetty|grpc|graphql|^got$|node-fetch|^ky$", "Web / HTTP"),
+    (r"org\.springframework\.boot:spring-boot-starter$|spring-boot-starter-parent|spring-boot-dependencies|"
+     r"^org\.springframework:|quarkus|micronaut|^django$|^flask$|^fastapi$|^starlette$|^express$|^@nestjs/|^react$|"
+     r"^react-dom$|^next$|^vue$|^nuxt$|@angular/|^svelte|gin-gonic/gin|labstack/echo|gofiber/fiber|^rails$|^sinatra$|"
+     r"actix-web|^axum$|^rocket$|^tokio$|ktor", "Framework"),
+    (r"maven-|gradle-plugin|plugin$|^typescript$|webpack|^vite$|babel|eslint|prettier|^setuptools|^wheel$|poetry|"
+     r"hatchling|ts-node|nodemon|rollup|esbuild|swc|lint|^black$|^ruff$|^mypy$|^isort$|^tox$|^nox$|lombok|mapstruct", "Build / Tooling"),
+    (r"jackson|gson|guava|commons-|validation|validator|pydantic|lodash|dayjs|moment|date-fns|^uuid$|joda|"
+     r"modelmapper|dotenv|yaml|^rich$|^typer$|^click$|cobra|viper|^serde", "Utilities"),
+]]
+
+_ECOSYSTEM_CATEGORY = {"docker": "DevOps", "github-actions": "CI/CD", "gradle-plugin": "Build / Tooling"}
+
+
+def categorize(dep: Dependency) -> str:
+    if dep.ecosystem in _ECOSYSTEM_CATEGORY:
+        return _ECOSYSTEM_CATEGORY[dep.ecosystem]
+    subject = f"{dep.group}:{dep.name}".lower() if dep.group else dep.name.lower()
+    for rx, category in _RULES:
+        if rx.search(subject) or (dep.group and rx.search(dep.name.lower())):
+            return category
+    if dep.scope == "plugin":
+        return "Build / Tooling"
+    if dep.scope in ("test", "dev"):
+        return "Testing" if dep.scope == "test" else "Build / Tooling"
+    return "Other"
+
+
+# 아티팩트 키(Dependency.key) → 설명
+KNOWN_DESCRIPTIONS: dict[str, str] = {
+    "maven:org.springframework.boot:spring-boot-starter-parent": "Spring Boot parent POM (dependency/plugin management)",
+    "maven:org.springframework.boot:spring-boot-starter": "Spring Boot core starter (auto-configuration, logging)",
+    "maven:org.springframework.boot:spring-boot-starter-web": "Spring MVC web framework with embedded Tomcat",
+    "maven:org.springframework.boot:spring-boot-starter-webflux": "Reactive web framework (Spring WebFlux)",
+    "maven:org.springframework.boot:spring-boot-starter-data-jpa": "Spring Data JPA with Hibernate",
+    "maven:org.springframework.boot:spring-boot-starter-data-redis": "Spring Data Redis",
+    "maven:org.springframework.boot:spring-boot-starter-security": "Spring Security authentication/authorization",
+    "maven:org.springframework.boot:spring-boot-starter-validation": "Bean Validation (Hibernate Validator)",
+    "maven:org.springframework.boot:spring-boot-starter-actuator": "Production monitoring/health endpoints",
+    "maven:org.springframework.boot:spring-boot-starter-test": "Spring Boot test support (JUnit, Mockito, AssertJ)",
+    "maven:org.springframework.boot:spring-boot-maven-plugin": "Builds executable Spring Boot jars",
+    "maven:org.springframework.boot:spring-boot-devtools": "Developer tools (auto restart, live reload)",
+    "maven:org.projectlombok:lombok": "Boilerplate code generation via annotations",
+    "maven:org.postgresql:postgresql": "PostgreSQL JDBC driver",
+    "maven:com.mysql:mysql-connector-j": "MySQL JDBC driver",
+    "maven:mysql:mysql-connector-java": "MySQL JDBC driver",
+    "maven:org.mariadb.jdbc:mariadb-java-client": "MariaDB JDBC driver",
+    "maven:com.h2database:h2": "H2 in-memory database",
+    "maven:org.flywaydb:flyway-core": "Database schema migrations",
+    "maven:org.liquibase:liquibase-core": "Database schema migrations",
+    "maven:org.springdoc:springdoc-openapi-starter-webmvc-ui": "OpenAPI 3 docs and Swagger UI",
+    "maven:io.jsonwebtoken:jjwt-api": "JSON Web Token creation/validation",
+    "maven:com.querydsl:querydsl-jpa": "Type-safe JPA queries",
+    "maven:org.mapstruct:mapstruct": "Compile-time bean mapping",
+    "maven:org.junit.jupiter:junit-jupiter": "JUnit 5 testing framework",
+    "maven:org.mockito:mockito-core": "Mocking framework for tests",
+    "maven:org.testcontainers:junit-jupiter": "Throwaway Docker containers for integration tests",
+    "maven:org.apache.maven.plugins:maven-compiler-plugin": "Compiles Java sources",
+    "maven:org.apache.maven.plugins:maven-surefire-plugin": "Runs unit tests",
+    "gradle-plugin:org.springframework.boot": "Spring Boot Gradle plugin (executable jars)",
+    "gradle-plugin:io.spring.dependency-management": "Maven-style dependency management for Gradle",
+    "gradle-plugin:java": "Java compilation and packaging",
+    "npm:react": "UI component library",
+    "npm:react-dom": "React DOM renderer",
+    "npm:next": "React framework with SSR/SSG",
+    "npm:vue": "Progressive UI framework",
+    "npm:express": "Minimal Node.js web framework",
+    "npm:typescript": "Typed superset of JavaScript",
+    "npm:axios": "Promise-based HTTP client",
+    "npm:jest": "JavaScript testing framework",
+    "npm:eslint": "JavaScript/TypeScript linter",
+    "npm:prettier": "Code formatter",
+    "npm:vite": "Frontend build tool and dev server",
+    "npm:webpack": "Module bundler",
+    "pypi:django": "Full-stack Python web framework",
+    "pypi:flask": "Lightweight Python web framework",
+    "pypi:fastapi": "Async Python API framework",
+    "pypi:uvicorn": "ASGI server",
+    "pypi:gunicorn": "WSGI HTTP server",
+    "pypi:pydantic": "Data validation using type hints",
+    "pypi:sqlalchemy": "Python SQL toolkit and ORM",
+    "pypi:requests": "HTTP client",
+    "pypi:pytest": "Python testing framework",
+    "pypi:celery": "Distributed task queue",
+    "pypi:psycopg2-binary": "PostgreSQL driver",
+    "go:github.com/gin-gonic/gin": "HTTP web framework",
+    "go:gorm.io/gorm": "ORM library for Go",
+    "go:github.com/stretchr/testify": "Assertions and mocks for tests",
+    "github-actions:actions/checkout": "Checks out the repository",
+    "github-actions:actions/setup-java": "Sets up a JDK",
+    "github-actions:actions/setup-node": "Sets up Node.js",
+    "github-actions:actions/setup-python": "Sets up Python",
+}
+
+
+# 최대 행 수 (초과 시 오래 안 쓴 행부터 삭제)
+_MAX_ROWS = 100_000
+
+
+class DescriptionCache(SQLiteCache):
+    """아티팩트 키 → (카테고리, 설명). 값은 JSON [category, description]."""
+
+    def __init__(self, path: Path):
+        super().__init__(path, "descriptions", _MAX_ROWS)
+
+    def get_many(self, keys: list[str]) -> dict[str, tuple[str | None, str]]:
+        """key → (category, description). 캐시에 있는 것만."""
+        return {k: tuple(json.loads(raw)) for k, raw in super().get_many(keys).items()}
+
+    def put_many(self, notes: dict[str, tuple[str | None, str]], ttl: float | None = None) -> None:
+        super().put_many({k: json.dumps([c, d], ensure_ascii=False) for k, (c, d) in notes.items()}, ttl)
+
+
+_CACHE = LazyCache(lambda: DescriptionCache(writable_cache_root() / "artifact-descriptions.sqlite3"))
+
+
+def get_description_cache() -> DescriptionCache | None:
+    """프로세스 전역 아티팩트 설명 캐시 (LLM_CACHE_ENABLED=false면 None)."""
+    if not settings.llm_cache_enabled:
+        return None
+    return _CACHE.get()
+
+
+def lookup_descriptions(deps: list[Dependency]) -> dict[str, tuple[str | None, str | None]]:
+    """
+    내장 설명 + 설명 캐시에서 찾은 것 (key → (category, description)).
+    음성 캐시 항목(LLM이 설명하지 못한 아티팩트, 빈 설명)은 설명 None으로 돌려 다시 묻지 않게 한다.
+    """
+    notes: dict[str, tuple[str | None, str]] = {
+        d.key: (None, KNOWN_DESCRIPTIONS[d.key]) for d in deps if d.key in KNOWN_DESCRIPTIONS
+    }
+    cache = get_description_cache()
+    missing = [d.key for d in deps if d.key not in notes]
+    if cache is not None and missing:
+        notes.update((k, (c, d or None)) for k, (c, d) in cache.get_many(missing).items())
+    return notes
@@ -1,12 +1,16 @@
-"""LLM 기반 기술 스택 분석."""
+"""LLM 기반 기술 스택 분석 (ai 모드: 빌드 파일 전체 / hybrid 모드: 처음 보는 아티팩트 설명만)."""
 from __future__ import annotations
-import json
+import logging
 from pathlib import Path
 
-from erd_agent.config import settings
-from erd_agent.llm.aoai_client import build_aoai_client
+from erd_agent.llm.chat import chat_json
+from erd_agent.llm.dispatch import map_concurrent
+from stack_agent.build_parsers import Dependency
+from stack_agent.catalog import CATEGORY_ORDER
 from stack_agent.models import ExtractedStack
 
+logger = logging.getLogger(__name__)
+
 SYSTEM_PROMPT = """You are a senior DevOps engineer and software architect.
 You analyze project build/dependency files to produce a comprehensive tech stack document.
 Return ONLY valid JSON (no markdown, no explanation).
@@ -51,11 +55,17 @@ FILES:
 """
 
 
+# 의존성 선언 없이 해석된 버전만 담긴 파일 — 크기만 크고 분석에 보탬이 안 된다
+LOCK_FILES = {"package-lock.json", "yarn.lock", "go.sum"}
+
+
 def _make_files_blob(files: list[tuple[Path, str]], max_chars: int = 100_000) -> str:
     parts: list[str] = []
     total = 0
-    for p, txt in files:
+    files = [(p, txt) for p, txt in files if p.name not in LOCK_FILES]
+    for i, (p, txt) in enumerate(files):
         if total + len(txt) > max_chars:
+            logger.warning("Stack prompt budget exceeded: %d of %d files dropped", len(files) - i, len(files))
             break
         parts.append(f'<file path="{p.as_posix()}">\n{txt}\n</file>')
         total += len(txt)
@@ -63,19 +73,77 @@ def _make_files_blob(files: list[tuple[Path, str]], max_chars: int = 100_000) ->
 
 
 def ai_extract_stack(file_texts: list[tuple[Path, str]]) -> ExtractedStack:
-    client = build_aoai_client()
-    if client is None:
-        raise RuntimeError("Azure OpenAI 설정이 없습니다.")
-
     files_blob = _make_files_blob(file_texts)
-    resp = client.chat.completions.create(
-        model=settings.azure_openai_deployment,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": USER_PROMPT_TEMPLATE.format(files_blob=files_blob)},
-        ],
-        response_format={"type": "json_object"},
-        temperature=0,
-    )
-    data = json.loads(resp.choices[0].message.content)
+    data = chat_json(SYSTEM_PROMPT, USER_PROMPT_TEMPLATE.format(files_blob=files_blob))
     return ExtractedStack.model_validate(data)
+
+
+DESCRIBE_SYSTEM_PROMPT = """You are a senior software architect cataloguing third-party libraries.
+Return ONLY valid JSON (no markdown, no explanation).
+"""
+
+DESCRIBE_PROMPT_TEMPLATE = """For each artifact below (one per line: key, version), give a category and a one-line description
+of what the library is for. The key is "ecosystem:group:name" or "ecosystem:name"; keep it exactly as given.
+Category must be one of: {categories}
+
+Output JSON schema:
+{{
+  "artifacts": [{{"key": "maven:org.flywaydb:flyway-core", "category": "Database", "description": "Database schema migrations"}}]
+}}
+
+ARTIFACTS:
+{lines}
+"""
+
+# 요청 하나에 담을 최대 아티팩트 수 (한 줄 ≈ 십여 토큰)
+_DESCRIBE_BATCH = 150
+
+
+def _call_describe(lines: list[str]) -> dict:
+    return chat_json(
+        DESCRIBE_SYSTEM_PROMPT,
+        DESCRIBE_PROMPT_TEMPLATE.format(categories=", ".join(CATEGORY_ORDER), lines="\n".join(lines)),
+    )
+
+
+def _try_describe(batch: list[tuple[str, str]]) -> dict | None:
+    """배치 하나 호출. 실패하면 로그만 남기고 None (다른 배치·정적 결과는 그대로 사용)."""
+    try:
+        return _call_describe([line for _, line in batch])
+    except Exception as exc:
+        logger.warning("Artifact description batch failed (%d artifacts): %s", len(batch), exc)
+        return None
+
+
+def ai_describe_artifacts(
+    deps: list[Dependency], max_in_flight: int | None = None
+) -> tuple[dict[str, tuple[str | None, str]], list[str]]:
+    """
+    아티팩트 좌표만 한 줄씩 보내 카테고리·설명을 받는다.
+    빌드 파일 원문을 보내지 않으므로 요청이 작고, 결과는 호출 측에서 설명 캐시에 저장한다.
+    반환: (key → (category, description), 응답은 왔지만 설명이 없던 key 목록 — 음성 캐시용)
+    실패한 배치의 아티팩트는 어느 쪽에도 넣지 않는다 (다음 실행에 다시 묻는다).
+    """
+    unique = list({d.key: d for d in deps}.values())
+    batches = [
+        [(d.key, f"{d.key}\t{d.version or '-'}") for d in unique[i:i + _DESCRIBE_BATCH]]
+        for i in range(0, len(unique), _DESCRIBE_BATCH)
+    ]
+    notes: dict[str, tuple[str | None, str]] = {}
+    unknown: list[str] = []
+    for batch, data in zip(batches, map_concurrent(_try_describe, batches, max_in_flight)):
+        if not isinstance(data, dict):
+            # 실패했거나 객체가 아닌 응답 — 실패한 배치와 같이 다음 실행에 다시 묻는다
+            if data is not None:
+                logger.warning("Artifact description batch returned %s, skipping", type(data).__name__)
+            continue
+        wanted = {key for key, _ in batch}
+        for item in data.get("artifacts") or []:
+            if not isinstance(item, dict):
+                continue
+            key = str(item.get("key", ""))
+            if key in wanted and item.get("description"):
+                category = item.get("category")
+                notes[key] = (category if category in CATEGORY_ORDER else None, str(item["description"]))
+        unknown += [key for key, _ in batch if key not in notes]
+    return notes, unknown
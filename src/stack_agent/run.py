@@ -1,44 +1,68 @@
-"""기술 스택 문서 생성: 빌드 파일 스캔 → LLM 분석 → Markdown 출력."""
+"""기술 스택 문서 생성: 빌드 파일 스캔 → 정적 파싱(+ 선택적 LLM 설명 보강) → Markdown 출력."""
 from __future__ import annotations
 from pathlib import Path
 
 from rich.console import Console
 
 from erd_agent.config import settings
-from erd_agent.repo import prepare_repo
-from stack_agent.scanner import scan_stack_files
-from stack_agent.extractor import ai_extract_stack
+from erd_agent.llm.aoai_client import get_aoai_client
+from erd_agent.repo_index import RepoIndex, scoped_repo_index
+from stack_agent.build_parsers import parse_build_files
+from stack_agent.catalog import get_description_cache, lookup_descriptions
+from stack_agent.extractor import ai_describe_artifacts, ai_extract_stack
+from stack_agent.static_extractor import build_stack, dedupe_dependencies
 from stack_agent.writer import write_stack
 
 console = Console()
 
 
-def _load(p: Path) -> str:
-    return p.read_text(encoding="utf-8", errors="ignore")
-
-
 def run_stack(
-    repo: str,
+    repo: str | RepoIndex,
     out_dir: Path | None = None,
     out_file: str = "tech_stack.md",
+    mode: str | None = None,
 ) -> Path:
-    repo_path = prepare_repo(repo)
-    base = out_dir or settings.doc_output_dir / "stack"
-    base.mkdir(parents=True, exist_ok=True)
-    out_path = base / out_file
+    """
+    mode: static / hybrid / ai (기본: settings.stack_extract_mode)
+    """
+    with scoped_repo_index(repo) as index:
+        repo_path = index.root
+        base = out_dir or settings.doc_output_dir / "stack"
+        base.mkdir(parents=True, exist_ok=True)
+        out_path = base / out_file
+        mode = (mode or settings.stack_extract_mode).lower()
 
-    console.print(f"[bold]Repo:[/bold] {repo_path}")
+        console.print(f"[bold]Repo:[/bold] {repo_path}")
 
-    stack_files = scan_stack_files(repo_path)
-    console.print(f"Found [green]{len(stack_files)}[/green] build/dependency files")
+        stack_files = index.build_files
+        console.print(f"Found [green]{len(stack_files)}[/green] build/dependency files")
 
-    if not stack_files:
-        out_path.write_text("# Tech Stack\n\nNo build/dependency files found.\n", encoding="utf-8")
+        if not stack_files:
+            out_path.write_text("# Tech Stack\n\nNo build/dependency files found.\n", encoding="utf-8")
+            console.print(f"[bold green]Tech stack:[/bold green] {out_path}")
+            return out_path
+
+        file_texts = [(f, index.read_text(f)) for f in stack_files]
+        if mode == "ai":
+            stack = ai_extract_stack(file_texts)
+        else:
+            info = parse_build_files(file_texts, repo_path)
+            deps = dedupe_dependencies(info.dependencies)
+            console.print(f"Static dependencies: [green]{len(deps)}[/green] ({', '.join(info.build_tools) or '-'})")
+            notes = lookup_descriptions(deps)
+            unseen = [d for d in deps if d.key not in notes]
+            if unseen and mode == "hybrid" and get_aoai_client() is not None:
+                console.print(f"[yellow]Describing {len(unseen)} new artifact(s) with Azure OpenAI[/yellow]")
+                described, unknown = ai_describe_artifacts(unseen)
+                cache = get_description_cache()
+                if cache is not None:
+                    cache.put_many(described)
+                    # 설명을 못 받은 아티팩트는 잠시 동안만 "설명 없음"으로 기억해 매 실행마다 다시 묻지 않는다
+                    cache.put_many({k: (None, "") for k in unknown}, ttl=settings.stack_describe_negative_ttl)
+                if len(described) < len(unseen):
+                    console.print(f"[yellow]{len(unseen) - len(described)} artifact(s) left without description[/yellow]")
+                notes.update(described)
+            stack = build_stack(info, notes)
+        write_stack(stack, out_path)
         console.print(f"[bold green]Tech stack:[/bold green] {out_path}")
         return out_path
-
-    file_texts = [(f, _load(f)) for f in stack_files]
-    stack = ai_extract_stack(file_texts)
-    write_stack(stack, out_path)
-    console.print(f"[bold green]Tech stack:[/bold green] {out_path}")
-    return out_path
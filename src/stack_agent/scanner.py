@@ -2,9 +2,11 @@
 from __future__ import annotations
 from pathlib import Path
 
+from erd_agent.walker import iter_repo_files
+
 BUILD_FILES = {
     "pom.xml", "build.gradle", "build.gradle.kts",
-    "settings.gradle", "settings.gradle.kts",
+    "settings.gradle", "settings.gradle.kts", "gradle.properties", "libs.versions.toml",
     "package.json", "package-lock.json", "yarn.lock",
     "requirements.txt", "pyproject.toml", "setup.py", "setup.cfg", "Pipfile",
     "go.mod", "go.sum",
@@ -21,17 +23,20 @@ BUILD_FILES = {
 WORKFLOW_DIR = ".github/workflows"
 
 
+def is_stack_file(repo_path: Path, f: Path) -> bool:
+    """빌드·의존성·설정 파일 여부. (scan_stack_files / RepoIndex 공용)"""
+    if f.name in BUILD_FILES:
+        return True
+    rel = str(f.relative_to(repo_path))
+    return rel.startswith(WORKFLOW_DIR) and f.suffix in (".yml", ".yaml")
+
+
 def scan_stack_files(repo_path: Path) -> list[Path]:
     """빌드·의존성·설정 파일을 수집한다."""
     candidates: set[Path] = set()
 
-    for f in repo_path.rglob("*"):
-        if not f.is_file():
-            continue
-        if f.name in BUILD_FILES:
-            candidates.add(f)
-        rel = str(f.relative_to(repo_path))
-        if rel.startswith(WORKFLOW_DIR) and f.suffix in (".yml", ".yaml"):
+    for f in iter_repo_files(repo_path):
+        if is_stack_file(repo_path, f):
             candidates.add(f)
 
     return sorted(candidates)
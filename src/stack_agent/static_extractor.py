@@ -0,0 +1,150 @@
+"""
+정적 기술 스택 추출기: build_parsers 결과 → ExtractedStack (LLM 불필요).
+
+언어/버전, 프레임워크/버전, 빌드 도구, 카테고리별 의존성을 파서 결과와 분류 규칙(catalog)으로 채운다.
+설명(description)은 내장 카탈로그·설명 캐시에 있는 것만 채우고, 나머지는 extractor.ai_describe_artifacts로
+처음 보는 아티팩트만 따로 물어본다.
+"""
+from __future__ import annotations
+from collections import Counter
+
+from stack_agent.build_parsers import BuildInfo, Dependency
+from stack_agent.catalog import CATEGORY_ORDER, categorize
+from stack_agent.models import CategoryModel, DependencyItem, ExtractedStack
+
+# 생태계 → 언어
+_LANGUAGES = {
+    "maven": "Java", "gradle-plugin": "Java", "npm": "JavaScript", "pypi": "Python",
+    "go": "Go", "cargo": "Rust", "rubygems": "Ruby",
+}
+_VERSION_KEYS = {"JavaScript": "Node.js", "TypeScript": "Node.js"}
+
+# (아티팩트 키 접두사, 프레임워크) — 주 언어 생태계 안에서 위에서부터 처음 일치하는 것
+FRAMEWORKS = [
+    ("maven:org.springframework.boot:", "Spring Boot"),
+    ("gradle-plugin:org.springframework.boot", "Spring Boot"),
+    ("maven:io.quarkus:", "Quarkus"),
+    ("maven:io.micronaut", "Micronaut"),
+    ("maven:io.ktor:", "Ktor"),
+    ("maven:org.springframework:spring-webmvc", "Spring MVC"),
+    ("npm:@nestjs/core", "NestJS"),
+    ("npm:next", "Next.js"),
+    ("npm:nuxt", "Nuxt"),
+    ("npm:@angular/core", "Angular"),
+    ("npm:react", "React"),
+    ("npm:vue", "Vue"),
+    ("npm:svelte", "Svelte"),
+    ("npm:express", "Express"),
+    ("pypi:django", "Django"),
+    ("pypi:fastapi", "FastAPI"),
+    ("pypi:flask", "Flask"),
+    ("go:github.com/gin-gonic/gin", "Gin"),
+    ("go:github.com/labstack/echo", "Echo"),
+    ("go:github.com/gofiber/fiber", "Fiber"),
+    ("rubygems:rails", "Rails"),
+    ("cargo:actix-web", "Actix Web"),
+    ("cargo:axum", "Axum"),
+]
+
+# 선언 범위가 여러 곳에서 다르면 더 넓은 쪽을 표시
+_SCOPE_RANK = {"compile": 0, "runtime": 0, "parent": 0, "import": 1, "provided": 2, "annotation": 3,
+               "peer": 3, "optional": 4, "plugin": 5, "dev": 6, "test": 7}
+
+# 요약에 한 줄씩 넣을 카테고리
+_SUMMARY_CATEGORIES = ("Database", "ORM / Data Access", "Cache", "Messaging", "Security", "Cloud")
+
+# 빌드 도구가 아닌 항목 (카테고리로 표시)
+_NOT_BUILD_TOOLS = {"Docker", "Docker Compose", "GitHub Actions"}
+
+
+def dedupe_dependencies(deps: list[Dependency]) -> list[Dependency]:
+    """같은 아티팩트(버전 무관)는 하나로: 버전은 처음 확인된 값, 범위는 가장 넓은 값."""
+    merged: dict[str, Dependency] = {}
+    for d in deps:
+        cur = merged.get(d.key)
+        if cur is None:
+            merged[d.key] = Dependency(d.ecosystem, d.name, d.group, d.version, d.scope, d.source)
+            continue
+        if cur.version is None or "${" in cur.version:
+            cur.version = d.version or cur.version
+        if _SCOPE_RANK.get(d.scope or "", 8) < _SCOPE_RANK.get(cur.scope or "", 8):
+            cur.scope = d.scope
+    return list(merged.values())
+
+
+def _primary_language(info: BuildInfo, deps: list[Dependency]) -> str | None:
+    counts = Counter(_LANGUAGES[d.ecosystem] for d in deps if d.ecosystem in _LANGUAGES)
+    if not counts:
+        return None
+    language = counts.most_common(1)[0][0]
+    # 빌드 파일별 표시(ecosystems) 중 Kotlin/TypeScript가 더 많을 때만 해당 언어로 본다
+    marks = Counter(info.ecosystems)
+    if language == "Java" and marks["kotlin"] > marks["maven"] + marks["gradle"]:
+        return "Kotlin"
+    if language == "JavaScript" and marks["typescript"] > marks["npm"]:
+        return "TypeScript"
+    return language
+
+
+def _language_version(language: str | None, info: BuildInfo, deps: list[Dependency]) -> str | None:
+    if language == "Kotlin":
+        return next((d.version for d in deps if d.ecosystem == "gradle-plugin"
+                     and d.name.startswith("org.jetbrains.kotlin.") and d.version), None)
+    return info.language_versions.get(_VERSION_KEYS.get(language, language or ""))
+
+
+def _framework(language: str | None, deps: list[Dependency]) -> tuple[str | None, str | None]:
+    ecosystems = {e for e, lang in _LANGUAGES.items() if lang == {"Kotlin": "Java", "TypeScript": "JavaScript"}.get(language, language)}
+    for candidates in ([d for d in deps if d.ecosystem in ecosystems], deps):
+        for prefix, name in FRAMEWORKS:
+            matched = [d for d in candidates if d.key == prefix or (prefix.endswith(":") and d.key.startswith(prefix))]
+            if matched:
+                version = next((d.version for d in matched if d.version and "${" not in d.version), None)
+                return name, version
+    return None, None
+
+
+def build_stack(info: BuildInfo, notes: dict[str, tuple[str | None, str | None]]) -> ExtractedStack:
+    """
+    notes: 아티팩트 키 → (카테고리, 설명) — 규칙으로 분류되지 않은(Other) 항목은 notes의 카테고리를 쓴다.
+    """
+    deps = dedupe_dependencies(info.dependencies)
+    language = _primary_language(info, deps)
+    framework, framework_version = _framework(language, deps)
+
+    grouped: dict[str, list[DependencyItem]] = {}
+    first_in: dict[str, str] = {}
+    for d in deps:
+        category = categorize(d)
+        note_category, description = notes.get(d.key, (None, None))
+        if category == "Other" and note_category in CATEGORY_ORDER:
+            category = note_category
+        grouped.setdefault(category, []).append(
+            DependencyItem(name=d.name, version=d.version, scope=d.scope, description=description)
+        )
+        first_in.setdefault(category, d.name)
+
+    build_tools = [t for t in info.build_tools if t not in _NOT_BUILD_TOOLS]
+    language_version = _language_version(language, info, deps)
+
+    # 예: "Spring Boot 3.2.1 on Java 17 (Maven) — Database: postgresql; Security: spring-boot-starter-security"
+    head = " ".join(x for x in (framework, framework_version) if x)
+    lang = " ".join(x for x in (language, language_version) if x)
+    summary = f"{head} on {lang}" if head and lang else head or lang
+    if build_tools:
+        summary += f" ({', '.join(build_tools)})"
+    highlights = [f"{c}: {first_in[c]}" for c in _SUMMARY_CATEGORIES if c in first_in]
+    if highlights:
+        summary += " — " + "; ".join(highlights)
+
+    return ExtractedStack(
+        language=language,
+        language_version=language_version,
+        framework=framework,
+        framework_version=framework_version,
+        build_tool=", ".join(build_tools) or None,
+        summary=summary.strip() or None,
+        categories=[
+            CategoryModel(category=c, items=grouped[c]) for c in CATEGORY_ORDER if c in grouped
+        ],
+    )
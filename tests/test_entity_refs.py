@@ -0,0 +1,75 @@
+"""
+같은 단순 이름의 엔티티가 여러 패키지에 있을 때 FK 대상 해석 테스트.
+
+merge_schemas는 자식 파일의 package/import로 부모 엔티티를 정하고,
+import로도 정할 수 없으면 FK를 추측하지 않고 생략한다.
+"""
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+from erd_agent.config import settings
+from erd_agent.parsers.jpa_java import parse_entities, type_candidates
+
+ADMIN_USER = """
+package com.shop.admin;
+@Entity @Table(name = "users")
+public class User { @Id private Long id; }
+"""
+USER = """
+package com.shop.user;
+@Entity @Table(name = "member")
+public class User { @Id private Long uid; }
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_parse_cache(monkeypatch):
+    monkeypatch.setattr(settings, "erd_parse_cache_enabled", False)
+
+
+def _refs(files: dict[str, str]) -> dict[str, tuple[str, str]]:
+    schema = parse_entities([(Path(p), text) for p, text in files.items()])
+    return {f"{r.child_table}.{r.child_column}": (r.parent_table, r.parent_column) for r in schema.refs}
+
+
+def test_single_type_import_picks_the_imported_entity():
+    order = """
+    package com.shop.order;
+    import com.shop.user.User;
+    import java.util.*;
+    @Entity public class Order { @Id private Long id; @ManyToOne private User owner; }
+    """
+    refs = _refs({"admin/User.java": ADMIN_USER, "user/User.java": USER, "order/Order.java": order})
+    assert refs["order.owner_id"] == ("member", "uid")
+
+
+def test_same_package_entity_wins_without_import():
+    profile = """
+    package com.shop.user;
+    @Entity public class Profile { @Id private Long id; @ManyToOne private User user; }
+    """
+    refs = _refs({"admin/User.java": ADMIN_USER, "user/User.java": USER, "user/Profile.java": profile})
+    assert refs["profile.user_id"] == ("member", "uid")
+
+
+def test_ambiguous_entity_skips_the_fk(caplog):
+    note = """
+    package com.shop.note;
+    @Entity public class Note { @Id private Long id; @ManyToOne private User author; }
+    """
+    refs = _refs({"admin/User.java": ADMIN_USER, "user/User.java": USER, "note/Note.java": note})
+    assert "note.author_id" not in refs
+    assert "matches several entities" in caplog.text
+
+
+def test_type_candidates_order():
+    class Imp:
+        def __init__(self, path, wildcard=False, static=False):
+            self.path, self.wildcard, self.static = path, wildcard, static
+
+    imports = [Imp("com.a"), Imp("com.b", wildcard=True), Imp("com.c.Util.helper", static=True)]
+    assert type_candidates("User", "com.x", imports) == ["com.x.User", "com.b.User"]
+    assert type_candidates("User", None, [Imp("com.a.User")]) == ["com.a.User"]
+    assert type_candidates("com.z.User", "com.x", imports) == ["com.z.User"]
@@ -0,0 +1,261 @@
+"""
+java_lite ↔ javalang 파리티 테스트.
+
+같은 소스를 두 파서로 읽어 정적 추출기가 쓰는 선언부(타입/애너테이션/필드/메서드)가 같은지 비교한다.
+javalang이 지원하지 않는 문법(text block, record)은 같은 의미의 구식 문법으로 바꾼 소스를 javalang에 넣어 비교한다.
+"""
+from __future__ import annotations
+from pathlib import Path
+
+import javalang
+import pytest
+
+from erd_agent.model import Schema
+from erd_agent.parsers import java_lite
+from erd_agent.parsers.jpa_java import JPAJavaParser, parse_java
+
+_KINDS = {
+    "ClassDeclaration": "class",
+    "InterfaceDeclaration": "interface",
+    "EnumDeclaration": "enum",
+    "AnnotationDeclaration": "annotation",
+}
+
+
+def _type(t) -> str | None:
+    if t is None:
+        return None
+    while getattr(t, "sub_type", None) is not None:  # javalang: java.util.List → sub_type 체인
+        t = t.sub_type
+    args = getattr(t, "arguments", None) or []
+    rendered = ",".join(
+        "?" if a.type is None else (f"? {a.pattern_type} " if a.pattern_type in ("extends", "super") else "") + _type(a.type)
+        for a in args
+    )
+    dims = getattr(t, "dimensions", 0)
+    dims = len(dims) if isinstance(dims, list) else (dims or 0)
+    return t.name + (f"<{rendered}>" if args else "") + "[]" * dims
+
+
+def _value(v):
+    kind = type(v).__name__
+    if kind == "Literal":
+        return v.value
+    if kind == "MemberReference":
+        return f"{v.qualifier}.{v.member}" if v.qualifier else v.member
+    if kind == "ElementArrayValue":
+        return [_value(x) for x in v.values]
+    if kind == "Annotation":
+        return _annotation(v)
+    return "<expr>"
+
+
+def _annotation(a) -> tuple:
+    element = a.element
+    if isinstance(element, list):
+        element = {p.name: _value(p.value) for p in element}
+    elif element is not None:
+        element = _value(element)
+    return a.name.rsplit(".", 1)[-1], element
+
+
+def _nested(t) -> list:
+    if hasattr(t, "kind"):  # java_lite
+        return t.types
+    body = t.body if isinstance(t.body, list) else (t.body.declarations if t.body else [])
+    return [b for b in body if type(b).__name__ in _KINDS]
+
+
+def _summary(t, with_kind: bool = True) -> dict:
+    methods = [
+        m for m in t.methods
+        # java_lite는 생성자도 methods에 (return_type None, 이름 = 타입명) 넣는다
+        if not (getattr(m, "return_type", None) is None and m.name == t.name and hasattr(t, "kind"))
+    ]
+    return {
+        "kind": (t.kind if hasattr(t, "kind") else _KINDS[type(t).__name__]) if with_kind else None,
+        "name": t.name,
+        "annotations": [_annotation(a) for a in t.annotations],
+        "fields": [
+            {
+                "annotations": [_annotation(a) for a in f.annotations],
+                "type": _type(f.type),
+                "names": [d.name for d in f.declarators],
+            }
+            for f in t.fields
+        ],
+        "methods": [
+            {
+                "name": m.name,
+                "annotations": [_annotation(a) for a in m.annotations],
+                "returns": _type(m.return_type),
+                "params": [(_type(p.type), p.name, p.varargs) for p in m.parameters],
+            }
+            for m in methods
+        ],
+        "types": [_summary(n, with_kind) for n in _nested(t)],
+    }
+
+
+def _both(src: str, legacy: str | None = None, with_kind: bool = True) -> tuple[list, list]:
+    lite = java_lite.parse(src)
+    ref = javalang.parse.parse(legacy or src)
+    return [_summary(t, with_kind) for t in lite.types], [_summary(t, with_kind) for t in ref.types]
+
+
+def test_enum_bodies():
+    src = """
+    package a;
+    public class Order {
+        public enum Status {
+            NEW("{"), PAID("}") {
+                @Override String label() { return "paid {"; }
+            };
+            private final String label;
+            Status(String label) { this.label = label; }
+            String label() { return label; }
+        }
+        @Enumerated(EnumType.STRING) private Status status;
+        enum Empty { A, B }
+    }
+    """
+    lite, ref = _both(src)
+    assert lite == ref
+    assert [f["names"] for f in lite[0]["fields"]] == [["status"]]
+
+
+def test_lambdas_in_field_initializers():
+    src = """
+    class Handlers {
+        private Comparator<String> cmp = (a, b) -> { return a.compareTo(b); };
+        private Runnable r = () -> { new Thread(new Runnable() { public void run() { } }).start(); };
+        private Function<Integer, Integer> inc = x -> x + 1, dec = x -> { return x - 1; };
+        @Column(name = "after") private String after;
+    }
+    """
+    lite, ref = _both(src)
+    assert lite == ref
+    assert [f["names"] for f in lite[0]["fields"]] == [["cmp"], ["r"], ["inc", "dec"], ["after"]]
+
+
+def test_text_blocks():
+    src = '''
+    class Queries {
+        static final String SQL = """
+            select * from t where a = '{' and b = "}" ;
+            """;
+        @Column(name = "after") private String after;
+        String q() { return """
+            { "x": 1 }
+            """; }
+    }
+    '''
+    legacy = '''
+    class Queries {
+        static final String SQL = "select";
+        @Column(name = "after") private String after;
+        String q() { return "{"; }
+    }
+    '''
+    lite, ref = _both(src, legacy)
+    assert lite == ref
+    with pytest.raises(Exception):
+        javalang.parse.parse(src)  # javalang은 text block을 읽지 못한다 → java_lite가 필요한 이유
+    assert java_lite.parse(src).types[0].fields[0].declarators[0].initializer.value.startswith('"""')
+
+
+def test_char_literals():
+    src = """
+    class Braces {
+        private char open = '{', close = '}';
+        private char quote = '"';
+        private char escaped = '\\'';
+        String f() { char c = '{'; return "}"; }
+        @Column(name = "after") private String after;
+    }
+    """
+    lite, ref = _both(src)
+    assert lite == ref
+    assert [f["names"] for f in lite[0]["fields"]][-1] == ["after"]
+
+
+def test_generics_with_commas():
+    src = """
+    class Generic<K, V extends Comparable<V>> {
+        private Map<String, List<Integer>> tags = new HashMap<String, List<Integer>>();
+        private Map<K, Map<V, Set<String>>> nested;
+        private java.util.Map.Entry<String, Long> entry;
+        private List<? extends Number> numbers;
+        private Map<String, int[]>[] arrays;
+        public <T> Map<T, List<V>> group(List<? super T> xs, Map<String, Integer> counts, int... rest) { return null; }
+    }
+    """
+    lite, ref = _both(src)
+    assert lite == ref
+    assert lite[0]["fields"][0]["type"] == "Map<String,List<Integer>>"
+
+
+def test_multiple_declarators():
+    src = """
+    class Many {
+        private int a, b[], c = 3;
+        public static final String X = "x", Y = "y", Z = X + Y;
+        private Map<String, Integer> m1 = new HashMap<>(), m2 = Map.of("a", 1, "b", 2);
+        private int w = a < b ? 1 : 2, v;
+    }
+    """
+    lite, ref = _both(src)
+    assert lite == ref
+    declarators = java_lite.parse(src).types[0].fields[1].declarators
+    assert [(d.name, d.initializer.value if d.initializer else None) for d in declarators] == [
+        ("X", '"x"'), ("Y", '"y"'), ("Z", None)
+    ]
+
+
+def test_records():
+    src = """
+    @Embeddable
+    public record PayId(@Column(name = "pay_no") Long payNo, String code) implements Serializable {
+        static final String PREFIX = "P";
+        public PayId { Objects.requireNonNull(code); }
+        String label() { return PREFIX + code; }
+        record Inner(int x) { }
+    }
+    """
+    legacy = """
+    @Embeddable
+    public class PayId implements Serializable {
+        static final String PREFIX = "P";
+        String label() { return PREFIX + code; }
+        class Inner { }
+    }
+    """
+    lite, ref = _both(src, legacy, with_kind=False)
+    assert lite == ref
+    unit = java_lite.parse(src)
+    assert unit.types[0].kind == "record" and unit.types[0].types[0].kind == "record"
+
+
+def test_javalang_fallback(monkeypatch):
+    src = """
+    @Entity @Table(name = "users")
+    public class User {
+        @Id @GeneratedValue private Long id;
+        @Column(name = "email", nullable = false) private String email;
+    }
+    """
+
+    def fail(_text):
+        raise java_lite.JavaLiteError("unsupported")
+
+    monkeypatch.setattr(java_lite, "parse", fail)
+    tree = parse_java(src)
+    assert isinstance(tree, javalang.tree.CompilationUnit)
+
+    schema = Schema()
+    JPAJavaParser().parse(Path("User.java"), src, schema)
+    assert set(schema.tables["users"].columns) == {"id", "email"}
+
+
+def test_unparseable_returns_none():
+    assert parse_java("class Broken { void f() { ") is None
@@ -0,0 +1,106 @@
+"""
+레포 캐시 동시성 테스트.
+
+fetch_repo의 single-flight(같은 항목 동시 요청은 한 번만 다운로드), sparse 요청의 전체 zip 폴백,
+죽은 보유자가 남긴 lock 회수, LRU 정리의 유예 시간(REPO_CACHE_EVICT_GRACE)을 네트워크 없이 확인한다.
+"""
+from __future__ import annotations
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from erd_agent import repo as repo_mod
+from erd_agent.config import settings
+
+REPO = "https://github.com/acme/shop.git"
+SHA = "a" * 40
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """캐시 루트를 tmp_path로 바꾸고, ref 확인/다운로드를 가짜로 대체한다 (다운로드 횟수 기록)."""
+    monkeypatch.setattr(repo_mod, "writable_cache_root", lambda: tmp_path)
+    monkeypatch.setattr(repo_mod, "resolve_ref", lambda repo, ref=None, cached=None: repo_mod.ResolvedRef(ref, SHA))
+    monkeypatch.setattr(settings, "repo_selective_max_files", 0)
+    downloads: list[str] = []
+    lock = threading.Lock()
+
+    def fake_download(url: str, dest: Path, token: str | None = None) -> None:
+        with lock:
+            downloads.append(url)
+        time.sleep(0.3)  # 다른 요청이 lock을 기다리는 동안 다운로드가 진행 중이도록
+        with zipfile.ZipFile(dest, "w") as zf:
+            zf.writestr("shop-main/pom.xml", "<project/>")
+            zf.writestr("shop-main/src/main/java/App.java", "class App {}")
+
+    monkeypatch.setattr(repo_mod, "_download", fake_download)
+    return tmp_path, downloads
+
+
+def test_concurrent_fetches_download_once(cache):
+    _, downloads = cache
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: repo_mod.fetch_repo(REPO, materialize=False), range(4)))
+    assert len(downloads) == 1
+    assert {r.path for r in results} == {results[0].path}
+    assert results[0].path.name.endswith(".zip") and results[0].sha == SHA
+
+
+def test_sparse_zip_fallback_shares_full_entry_lock(cache):
+    """sparse 요청이 전체 zip으로 넘어가도 같은 커밋의 전체 요청과 아카이브를 한 번만 받는다."""
+    root, downloads = cache
+
+    def fetch(i: int):
+        return repo_mod.fetch_repo(REPO, materialize=True, sparse=["*.java", "pom.xml"] if i % 2 else None)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(fetch, range(4)))
+    assert len(downloads) == 1
+    assert {r.path for r in results} == {results[0].path}
+    assert (results[0].path / "src/main/java/App.java").exists()
+    assert not list(root.glob("*.lock"))
+
+
+def test_stale_lock_is_taken_over(tmp_path):
+    lock = tmp_path / "entry.lock"
+    lock.write_text("dead-host 1 1\n")
+    old = time.time() - 120
+    os.utime(lock, (old, old))
+
+    with repo_mod._file_lock(lock, timeout=1, stale_after=60):
+        assert lock.read_text().split()[0] != "dead-host"
+    assert not lock.exists()
+
+
+def test_live_lock_times_out(tmp_path):
+    lock = tmp_path / "entry.lock"
+    with repo_mod._file_lock(lock, timeout=1, stale_after=60):
+        with pytest.raises(TimeoutError):
+            with repo_mod._file_lock(lock, timeout=0.2, stale_after=60):
+                pass
+
+
+def test_eviction_skips_recent_and_locked_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "repo_cache_max_bytes", 10)
+    monkeypatch.setattr(settings, "repo_cache_evict_grace", 3600)
+    for name in ("old", "locked", "recent", "new"):
+        (tmp_path / f"{name}.zip").write_bytes(b"x" * 100)
+    with repo_mod._manifest(tmp_path) as m:
+        long_ago = time.time() - 7200
+        m["entries"] = {
+            "old.zip": {"bytes": 100, "last_access": long_ago},
+            "locked.zip": {"bytes": 100, "last_access": long_ago},
+            "recent.zip": {"bytes": 100, "last_access": time.time() - 60},
+        }
+
+    # 다른 요청이 받는 중인 항목 (다운로드 lock 보유)
+    with repo_mod._file_lock(repo_mod._entry_lock(tmp_path, "locked.zip"), timeout=1, stale_after=60):
+        repo_mod._register_entry(tmp_path, tmp_path / "new.zip", REPO, SHA)
+
+    assert not (tmp_path / "old.zip").exists()
+    assert all((tmp_path / f"{name}.zip").exists() for name in ("locked", "recent", "new"))